@@ -0,0 +1,90 @@
+#    _____           ______  _____
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+r"""
+    Cost of converting 1080p frames between colorspaces that OpenCV has no direct conversion for: two ``cv.cvtColor()``
+    passes through BGR (the previous behaviour of the ``to_*()`` functions), against ``caer.color.convert()``,
+    with and without a preallocated ``out`` buffer.
+
+    Then, the cost of converting a stack of small frames with one ``to_*()`` call per frame, against a single call on the
+    ``(n, height, width, 3)`` stack, which converts every frame on a thread pool into one output array.
+
+    Usage (from the repository root, with caer installed or on ``PYTHONPATH``):
+        python benchmarks/bench_color_convert.py
+"""
+
+import time
+
+import cv2 as cv
+import numpy as np
+import caer
+
+FRAMES = 32
+REPEATS = 3
+SHAPE = (1080, 1920, 3)
+PAIRS = [('hsv', 'lab'), ('lab', 'yuv'), ('gray', 'hsv'), ('gray', 'lab')]
+BATCH_SHAPE = (256, 120, 160, 3)
+
+
+def _best(fn):
+    times = []
+    for _ in range(REPEATS):
+        since = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - since)
+    return min(times)
+
+
+def _two_pass(tens, src, dst):
+    bgr = cv.cvtColor(tens, getattr(cv, f'COLOR_{src.upper()}2BGR'))
+    return cv.cvtColor(bgr, getattr(cv, f'COLOR_BGR2{dst.upper()}'))
+
+
+def main():
+    rng = np.random.default_rng(0)
+    bgr = rng.integers(0, 256, SHAPE, dtype=np.uint8)
+
+    print(f'{FRAMES} frames of {SHAPE}, best of {REPEATS} (ms/frame)')
+    print(f'{"conversion":<16}{"two passes":>14}{"convert()":>14}{"+ out":>14}')
+
+    for src, dst in PAIRS:
+        frame = bgr if src == 'bgr' else cv.cvtColor(bgr, getattr(cv, f'COLOR_BGR2{src.upper()}'))
+        tens = caer.Tensor(frame, cspace=src)
+        out = np.empty(caer.color.convert(tens, dst).shape, dtype=np.uint8)
+
+        two_pass = _best(lambda: [_two_pass(frame, src, dst) for _ in range(FRAMES)])
+        convert = _best(lambda: [caer.color.convert(tens, dst) for _ in range(FRAMES)])
+        convert_out = _best(lambda: [caer.color.convert(tens, dst, out=out) for _ in range(FRAMES)])
+
+        row = [seconds / FRAMES * 1e3 for seconds in (two_pass, convert, convert_out)]
+        print(f'{src + " -> " + dst:<16}' + ''.join(f'{ms:>14.2f}' for ms in row))
+
+    stack = caer.Tensor(rng.integers(0, 256, BATCH_SHAPE, dtype=np.uint8), cspace='bgr')
+    frames = list(stack)
+    out = np.empty(BATCH_SHAPE, dtype=np.uint8)
+
+    print()
+    print(f'stack of {BATCH_SHAPE}, best of {REPEATS} (ms/stack)')
+    print(f'{"conversion":<16}{"per frame":>14}{"stack":>14}{"+ out":>14}')
+
+    for dst in ('rgb', 'hsv', 'lab'):
+        to_dst = getattr(caer, f'to_{dst}')
+
+        per_frame = _best(lambda: [to_dst(tens) for tens in frames])
+        batched = _best(lambda: to_dst(stack))
+        batched_out = _best(lambda: caer.color.convert(stack, dst, out=out))
+
+        row = [seconds * 1e3 for seconds in (per_frame, batched, batched_out)]
+        print(f'{"bgr -> " + dst:<16}' + ''.join(f'{ms:>14.2f}' for ms in row))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#    _____           ______  _____
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+r"""
+    Decode time and peak memory of ``caer.imread(target_size=...)`` with and without reduced-resolution JPEG decoding.
+
+    Usage (from the repository root, with caer installed or on ``PYTHONPATH``):
+        python benchmarks/bench_imread_reduced.py
+"""
+
+import os
+import tempfile
+import time
+import tracemalloc
+
+import cv2 as cv
+import caer
+
+REPEATS = 10
+SOURCE_SIZE = (4000, 3000)
+TARGET_SIZES = [(224, 224), (640, 480), (1920, 1080)]
+
+
+def _make_camera_jpeg(path):
+    # Upscale a bundled sample to a typical camera resolution
+    tens = cv.imread(os.path.join(os.path.dirname(caer.__file__), 'data', 'sunrise.jpg'))
+    tens = cv.resize(tens, SOURCE_SIZE, interpolation=cv.INTER_CUBIC)
+    cv.imwrite(path, tens, [cv.IMWRITE_JPEG_QUALITY, 95])
+
+
+def _measure(path, target_size, reduced_decode):
+    # Warm-up (file cache, lazy OpenCV initialisation)
+    caer.imread(path, target_size=target_size, reduced_decode=reduced_decode)
+
+    since = time.perf_counter()
+    for _ in range(REPEATS):
+        caer.imread(path, target_size=target_size, reduced_decode=reduced_decode)
+    took = (time.perf_counter() - since) / REPEATS
+
+    tracemalloc.start()
+    caer.imread(path, target_size=target_size, reduced_decode=reduced_decode)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return took, peak
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'camera.jpg')
+        _make_camera_jpeg(path)
+
+        print(f'Source: {SOURCE_SIZE[0]}x{SOURCE_SIZE[1]} JPEG, {REPEATS} repeats')
+        print(f'{"target":>12} {"mode":>8} {"time (ms)":>10} {"peak (MB)":>10}')
+        for target_size in TARGET_SIZES:
+            for reduced_decode in (False, True):
+                took, peak = _measure(path, target_size, reduced_decode)
+                mode = 'reduced' if reduced_decode else 'full'
+                print(f'{target_size[0]:>5}x{target_size[1]:<6} {mode:>8} {took * 1000:>10.1f} {peak / 2**20:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+#    _____           ______  _____
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+r"""
+    Encoding throughput and output size of ``caer.imsave()`` per encoder profile and format, on the sample images in ``caer/data``.
+
+    Throughput is reported as MB/s of raw (decoded) pixels written, so the numbers are comparable across formats.
+
+    Usage (from the repository root, with caer installed or on ``PYTHONPATH``):
+        python benchmarks/bench_imsave_profiles.py
+"""
+
+import os
+import tempfile
+import time
+
+import caer
+
+REPEATS = 3
+FORMATS = ['.png', '.jpg', '.webp']
+PROFILES = [None, 'fast', 'balanced', 'small']
+
+
+def _load_samples():
+    data_dir = os.path.join(os.path.dirname(caer.__file__), 'data')
+    paths = sorted(caer.path.list_images(data_dir, recursive=False, use_fullpath=True, verbose=0))
+    return [caer.imread(path) for path in paths]
+
+
+def _measure(tensors, tmp, ext, profile):
+    path = os.path.join(tmp, 'out' + ext)
+    raw = sum(tens.nbytes for tens in tensors)
+
+    # Warm-up (lazy encoder initialisation)
+    caer.imsave(path, tensors[0], profile=profile)
+
+    size = 0
+    since = time.perf_counter()
+    for _ in range(REPEATS):
+        size = 0
+        for tens in tensors:
+            caer.imsave(path, tens, profile=profile)
+            size += os.path.getsize(path)
+    took = (time.perf_counter() - since) / REPEATS
+
+    return raw / took / 2**20, size, raw
+
+
+def main():
+    tensors = _load_samples()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f'{len(tensors)} sample images from caer/data, {REPEATS} repeats')
+        print(f'{"format":>7} {"profile":>9} {"MB/s":>8} {"size (MB)":>10} {"ratio":>7}')
+        for ext in FORMATS:
+            for profile in PROFILES:
+                throughput, size, raw = _measure(tensors, tmp, ext, profile)
+                print(f'{ext:>7} {str(profile):>9} {throughput:>8.1f} {size / 2**20:>10.2f} {raw / size:>7.1f}')
+
+
+if __name__ == '__main__':
+    main()
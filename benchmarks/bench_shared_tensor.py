@@ -0,0 +1,82 @@
+#    _____           ______  _____
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+r"""
+    Cost of handing 1080p RGB frames to a ``multiprocessing.Pool``: pickling every ``caer.Tensor`` through the pool's pipe,
+    against sending a ``SharedTensorHandle`` (``Tensor.to_shared()``) and mapping it in the worker (``Tensor.from_shared()``).
+
+    The worker does trivial work (reads one pixel), so the timings are dominated by the transport. For shared memory, the
+    one-off copy into the segment made by ``to_shared()`` is reported separately; it is paid once per frame, however many
+    tasks or workers read it.
+
+    Usage (from the repository root, with caer installed or on ``PYTHONPATH``):
+        python benchmarks/bench_shared_tensor.py
+"""
+
+import time
+import multiprocessing as mp
+
+import numpy as np
+import caer
+
+FRAMES = 64
+WORKERS = 4
+REPEATS = 3
+SHAPE = (1080, 1920, 3)
+
+
+def _work_pickled(tens):
+    return int(tens[0, 0, 0])
+
+
+def _work_shared(handle):
+    tens = caer.Tensor.from_shared(handle)
+    return int(tens[0, 0, 0])
+
+
+def _best(fn):
+    times = []
+    for _ in range(REPEATS):
+        since = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - since)
+    return min(times)
+
+
+def main():
+    rng = np.random.default_rng(0)
+    frames = [caer.Tensor(rng.integers(0, 256, SHAPE, dtype=np.uint8), cspace='rgb') for _ in range(FRAMES)]
+    mb = sum(tens.nbytes for tens in frames) / 2**20
+
+    print(f'{FRAMES} frames of {SHAPE} ({mb:.0f} MiB), {WORKERS} workers, best of {REPEATS}')
+    print(f'{"transport":<28}{"total (s)":>12}{"ms/frame":>12}{"MiB/s":>12}')
+
+    def _row(name, seconds):
+        print(f'{name:<28}{seconds:>12.3f}{seconds / FRAMES * 1e3:>12.2f}{mb / seconds:>12.0f}')
+
+    with mp.Pool(WORKERS) as pool:
+        # Warm the pool up
+        pool.map(_work_pickled, frames[:WORKERS])
+
+        _row('pickle (pool.map)', _best(lambda: pool.map(_work_pickled, frames)))
+
+        copy_time = _best(lambda: [handle.unlink() for handle in [tens.to_shared() for tens in frames]])
+        handles = [tens.to_shared() for tens in frames]
+        try:
+            _row('shared memory (pool.map)', _best(lambda: pool.map(_work_shared, handles)))
+            _row('  + to_shared() copy', copy_time)
+        finally:
+            for handle in handles:
+                handle.unlink()
+
+
+if __name__ == '__main__':
+    main()
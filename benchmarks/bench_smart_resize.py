@@ -0,0 +1,68 @@
+#    _____           ______  _____
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+r"""
+    Time and quality of ``caer.smart_resize()`` with the default two-pass path (integer downsize, then crop) 
+    against ``single_resample=True`` (one resample of the source region under the crop).
+
+    Quality is reported as the PSNR of the single-resample output against the two-pass output (``inf`` = identical).
+
+    Usage (from the repository root, with caer installed or on ``PYTHONPATH``):
+        python benchmarks/bench_smart_resize.py
+"""
+
+import time
+
+import cv2 as cv
+import numpy as np
+import caer
+
+REPEATS = 20
+SOURCE_SIZES = [(640, 427), (1920, 1080), (4000, 3000)]
+TARGET_SIZES = [(224, 224), (64, 64), (300, 100), (1000, 600)]
+
+
+def _psnr(a, b):
+    mse = np.mean((np.asarray(a, dtype=np.float64) - np.asarray(b, dtype=np.float64)) ** 2)
+    return float('inf') if mse == 0 else 10 * np.log10(255 ** 2 / mse)
+
+
+def _time(tens, target_size, single_resample):
+    caer.smart_resize(tens, target_size, single_resample=single_resample)
+
+    since = time.perf_counter()
+    for _ in range(REPEATS):
+        caer.smart_resize(tens, target_size, single_resample=single_resample)
+    return (time.perf_counter() - since) / REPEATS
+
+
+def main():
+    sample = caer.data.beverages()
+
+    print(f'{REPEATS} repeats')
+    print(f'{"source":>11} {"target":>10} {"two-pass (ms)":>14} {"single (ms)":>12} {"speedup":>8} {"PSNR (dB)":>10}')
+    for source_size in SOURCE_SIZES:
+        tens = caer.to_tensor(cv.resize(sample, source_size, interpolation=cv.INTER_CUBIC), cspace='rgb')
+
+        for target_size in TARGET_SIZES:
+            if target_size[0] > source_size[0] or target_size[1] > source_size[1]:
+                continue
+
+            two_pass = _time(tens, target_size, False)
+            single = _time(tens, target_size, True)
+            psnr = _psnr(caer.smart_resize(tens, target_size), caer.smart_resize(tens, target_size, single_resample=True))
+
+            print(f'{source_size[0]:>5}x{source_size[1]:<5} {target_size[0]:>4}x{target_size[1]:<5} '
+                  f'{two_pass * 1000:>14.2f} {single * 1000:>12.2f} {two_pass / single:>7.1f}x {psnr:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
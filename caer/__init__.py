@@ -82,9 +82,30 @@ def copyright():
 # IO-stuff
 from .io import (
     imread,
+    imread_batch,
+    imread_iter,
     imsave,
+    imdecode,
+    imdecode_batch,
+    imencode,
+    imencode_batch,
     resize,
     smart_resize,
+    resize_batch,
+    ResizePlan,
+    ImagePyramid,
+    tiled_resize,
+    URLFetcher,
+    imread_urls,
+    AsyncImageWriter,
+    ImageCache,
+    enable_image_cache,
+    disable_image_cache,
+    get_image_cache,
+    imsize,
+    imsize_batch,
+    ShardWriter,
+    ShardReader,
     __all__ as __all_io__
 )
 
@@ -118,6 +139,7 @@ from .core import (
 
 # Color Spaces
 from .color import (
+    convert,
     to_bgr,
     to_rgb,
     to_gray,
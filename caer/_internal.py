@@ -10,6 +10,7 @@
 # Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
 
 
+import os
 import numpy as np 
 
 def _check_target_size(size):
@@ -76,7 +77,6 @@ def _get_output(array, out, fname, dtype=None, output=None):
     -------
     output : Tensor
     '''
-    detail = '.\nWhen an output argument is used, the checking is very strict as this is a performance feature.'
     if dtype is None:
         dtype = array.dtype
     if output is not None: # pragma: no cover
@@ -90,13 +90,34 @@ def _get_output(array, out, fname, dtype=None, output=None):
     if out is None:
         return np.empty(array.shape, dtype)
 
+    return _check_output(out, array.shape, dtype, fname)
+
+
+def _check_output(out, shape, dtype, fname):
+    '''
+    out = _check_output(out, shape, dtype, fname)
+    Verifies that a caller-supplied `out` array has exactly the expected
+    `shape` and `dtype` and is contiguous (see ``_get_output``).
+    Parameters
+    ----------
+    out : Tensor
+    shape : tuple
+    dtype : numpy dtype
+    fname : str
+        Function name. Used in error messages
+    Returns
+    -------
+    out : Tensor
+    '''
+    detail = '.\nWhen an output argument is used, the checking is very strict as this is a performance feature.'
+
     if out.dtype != dtype:
         raise ValueError(
             'caer.%s: `out` has wrong type (out.dtype is %s; expected %s)%s' %
                 (fname, out.dtype, dtype, detail))
 
-    if out.shape != array.shape:
-        raise ValueError('caer.%s: `out` has wrong shape (got %s, while expecting %s)%s' % (fname, out.shape, array.shape, detail))
+    if out.shape != tuple(shape):
+        raise ValueError('caer.%s: `out` has wrong shape (got %s, while expecting %s)%s' % (fname, out.shape, tuple(shape), detail))
 
     if not out.flags.contiguous:
         raise ValueError('caer.%s: `out` is not c-array%s' % (fname,detail))
@@ -228,4 +249,18 @@ def _check_3(arr, funcname):
 
 def _check_2(arr, funcname):
     if arr.ndim != 2:
-        raise ValueError('caer.%s: this function can only handle 2D arrays (passed array with shape %s).' % (funcname, arr.shape))
\ No newline at end of file
+        raise ValueError('caer.%s: this function can only handle 2D arrays (passed array with shape %s).' % (funcname, arr.shape))
+
+def _get_num_workers(workers):
+    '''
+    workers = _get_num_workers(workers)
+    Resolves the number of worker threads to use for the batch functions.
+    ``None`` means one worker per available CPU.
+    '''
+    if workers is None:
+        return os.cpu_count() or 1
+
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError('`workers` must be a positive integer (or None to use all available CPUs)')
+
+    return workers
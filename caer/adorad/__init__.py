@@ -15,7 +15,16 @@ from .tensor import (
     is_tensor
 )
 
+from .batch import (
+    TensorBatch
+)
+
+from .shared import (
+    SharedTensorHandle
+)
+
 from ._internal import (
     from_numpy,
+    from_dlpack,
     to_tensor
 )
\ No newline at end of file
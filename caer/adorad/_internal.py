@@ -11,12 +11,17 @@
 
 import numpy as np 
 from .tensor import Tensor 
+from .batch import TensorBatch
 
 __all__ = [
     'from_numpy',
+    'from_dlpack',
     'to_tensor'
 ]
 
+# DLPack device type of host memory (kDLCPU)
+_DLPACK_CPU = 1
+
 
 def from_numpy(x, cspace, dtype=None, override_checks=False, enforce_tensor=False):
     r"""
@@ -51,6 +56,51 @@ def from_numpy(x, cspace, dtype=None, override_checks=False, enforce_tensor=Fals
         raise TypeError('`x` is not a Numpy Array')
 
 
+def from_dlpack(x, cspace=None, layout=None):
+    r"""
+        Convert a tensor of another framework to a Caer Tensor without copying, through DLPack (``__dlpack__``) or, for objects
+        that don't support it, the buffer protocol.
+
+        DLPack doesn't carry a colorspace, so specify ``cspace`` (unless `x` is a ``caer.Tensor``, whose ``cspace`` is kept).
+        The resulting Tensor shares memory with `x`.
+
+    Args:
+        x (object): CPU tensor supporting DLPack (PyTorch, JAX, CuPy host arrays, NumPy, ...) or an object exposing a buffer.
+        cspace (str): Value should be either bgr/rgb/gray/hsv/hls/lab/yuv/luv. If None (and `x` is not a ``caer.Tensor``), 
+            the Tensor's ``cspace`` is 'null'.
+        layout (str): If given (``'nhwc'`` or ``'nchw'``), `x` is a batch and a ``caer.TensorBatch`` is returned.
+
+    Returns:
+        ``caer.Tensor``
+
+    Examples::
+
+        >> tens = caer.from_dlpack(torch_tensor.permute(1, 2, 0), cspace='rgb') # (C,H,W) -> (H,W,C), still zero-copy
+        >> batch = caer.from_dlpack(torch_batch, cspace='rgb', layout='nchw')
+        >> torch.from_dlpack(batch.to_layout('nhwc'))
+
+    """
+    if hasattr(x, '__dlpack__'):
+        if hasattr(x, '__dlpack_device__') and int(x.__dlpack_device__()[0]) != _DLPACK_CPU:
+            raise ValueError('caer.from_dlpack: only CPU tensors are supported. Move the tensor to the CPU first (e.g. `.cpu()`)')
+
+        arr = np.from_dlpack(x)
+
+    else:
+        try:
+            arr = np.asarray(memoryview(x))
+        except TypeError:
+            raise TypeError(f'Cannot convert class {type(x)} to a caer.Tensor: it supports neither DLPack nor the buffer protocol') from None
+
+    if cspace is None:
+        cspace = getattr(x, 'cspace', None)
+
+    if layout is not None:
+        return TensorBatch(arr, cspace=cspace, layout=layout)
+
+    return Tensor(arr, cspace=cspace)
+
+
 def to_tensor(x, cspace=None, dtype=None, override_checks=False, enforce_tensor=False):
     r"""
         Convert an array to a caer.Tensor.
@@ -75,10 +125,8 @@ def to_tensor(x, cspace=None, dtype=None, override_checks=False, enforce_tensor=
             return x 
 
         else:
-            # Preserve
-            x = Tensor(x, cspace=cspace, dtype=dtype)
-            tens = _preserve_tensor_attrs(old=x)
-            return tens 
+            # A new view carrying the updated colorspace. `x` itself is left untouched
+            return Tensor(x, cspace=cspace, dtype=dtype)
 
     elif isinstance(x, np.ndarray):
         return from_numpy(x, cspace=cspace, override_checks=override_checks, enforce_tensor=enforce_tensor)
@@ -108,9 +156,8 @@ def _preserve_tensor_attrs(old):
     if not isinstance(old, Tensor):
         raise TypeError('`old` needs to be a caer.Tensor.')
 
-    new = Tensor(old, cspace=None, dtype=old.dtype)
-    new.cspace = old.cspace 
-    return new 
+    # Tensor.__array_finalize__ copies the attributes over to the view
+    return old.view(Tensor)
 
 
 # def _convert_to_tensor_and_rename_cspace(x, to) -> Tensor:
@@ -11,17 +11,21 @@
 
 
 class _TensorBase:
-    def __init__(self):
-        self.max_width = 2
-        self.is_floating_point = False
-        self.sci_mode = False
-        self.int_mode = True
-        self.numelem = self.size
-        self.foreign = True
+    # Defaults live on the class, so wrapping an array in a Tensor doesn't populate a per-instance ``__dict__``.
+    # ``Tensor.__array_finalize__`` only sets what differs (e.g. the ``cspace`` inherited from a parent Tensor)
+    max_width = 2
+    is_floating_point = False
+    sci_mode = False
+    int_mode = True
+    foreign = True
 
-        # self._mode = 'rgb'
-        # self.mode = self._mode # '._mode' is used internally --> prevents misuse of the API
-        self.cspace = 'null' # default
+    # self._mode = 'rgb'
+    # self.mode = self._mode # '._mode' is used internally --> prevents misuse of the API
+    cspace = 'null' # default
+
+    @property
+    def numelem(self):
+        return self.size
 
 
     def __repr__(self):
@@ -43,7 +47,7 @@ class _TensorBase:
         return self.cspace
 
     def numel(self):
-        return self.numelem
+        return self.size
 
     def dim(self):
         return self.ndim
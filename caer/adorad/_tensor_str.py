@@ -27,33 +27,56 @@ PRINT_OPTS = __PrinterOptions()
 
 class _Formatter(object):
     def __init__(self, tensor):
-        self.floating_dtype = 'float' in str(repr(tensor.dtype))
+        # `tensor` is at most the summarized edge items of the Tensor being printed (see _tensor_str()),
+        # and every statistic below is a NumPy reduction, so the cost doesn't depend on the size of the Tensor
+        self.floating_dtype = np.issubdtype(tensor.dtype, np.floating)
         self.int_mode = True
         self.sci_mode = False
         self.max_width = 1
 
-        tensor_view = tensor.reshape(-1)
+        tensor_view = np.asarray(tensor).reshape(-1)
 
-        if not self.floating_dtype:
-            for value in tensor_view:
-                value_str = '{}'.format(value)
-                # d = max(self.max_width, len(value_str))
-                d = max(2, len(value_str))
-                self.max_width = d
+        if tensor_view.size == 0:
+            pass
+
+        elif not self.floating_dtype:
+            # The widest value is one of the extremes (the minimum may carry a sign)
+            self.max_width = max(len('{}'.format(tensor_view.max())), len('{}'.format(tensor_view.min())))
 
         else:
             # FLOATING POINT
+            finite = tensor_view[np.isfinite(tensor_view)]
+
+            if finite.size == 0:
+                # Only inf/nan
+                self.max_width = max(len('{}'.format(value)) for value in np.unique(tensor_view))
+
+            else:
+                self.int_mode = bool(np.all(finite == np.ceil(finite)))
+                extremes = (finite.max(), finite.min())
 
-            for value in tensor_view:
-                if value != np.ceil(value):
-                    self.int_mode = False
-                    break
+                nonzero = np.abs(finite[finite != 0])
+                nonzero_max = nonzero.max() if nonzero.size > 0 else 0
+                nonzero_min = nonzero.min() if nonzero.size > 0 else 0
 
-            if self.int_mode:
-                for value in tensor_view:
-                    value_str = ('{:.0f}').format(value)
-                    self.max_width = max(self.max_width, len(value_str) + 1)
+                if self.int_mode:
+                    # Formatted as '{:.0f}' followed by a '.'
+                    if nonzero_max > 1.e8:
+                        self.sci_mode = True
+                        self.max_width = max(len(('{{:.{}e}}').format(PRINT_OPTS.precision).format(value)) for value in extremes)
+                    else:
+                        self.max_width = max(len('{:.0f}'.format(value)) + 1 for value in extremes)
 
+                elif nonzero_max / max(nonzero_min, np.finfo(np.float64).tiny) > 1000. or nonzero_max > 1.e8 or nonzero_min < 1.e-4:
+                    self.sci_mode = True
+                    self.max_width = max(len(('{{:.{}e}}').format(PRINT_OPTS.precision).format(value)) for value in extremes + (nonzero_min,))
+
+                else:
+                    self.max_width = max(len(('{{:.{}f}}').format(PRINT_OPTS.precision).format(value)) for value in extremes)
+
+                if not np.all(np.isfinite(tensor_view)):
+                    # '-inf' is the widest non-finite value
+                    self.max_width = max(self.max_width, 4)
 
         if PRINT_OPTS.sci_mode is not None:
             self.sci_mode = PRINT_OPTS.sci_mode
@@ -79,8 +102,7 @@ class _Formatter(object):
         else:
             ret = '{}'.format(value)
 
-        # return (self.max_width - len(ret)) * ' ' + ret
-        return (2 - len(ret)) * ' ' + ret
+        return (self.max_width - len(ret)) * ' ' + ret
 
 def _scalar_str(self, formatter):
     # Usually, we must never come here. 
@@ -118,8 +140,8 @@ def _tensor_str_with_formatter(self, indent, summarize, formatter):
     dim = self.dim()
     # dim = self.ndim()
 
-    # if dim == 0:
-    #     return _scalar_str(self, formatter)
+    if dim == 0:
+        return _scalar_str(self, formatter)
 
     if dim == 1:
         return _vector_str(self, indent, summarize, formatter)
@@ -180,25 +202,17 @@ def _add_suffixes(tensor_str, suffixes, indent, force_newline):
 
 
 def get_summarized_data(self):
-    
-    dim = self.dim()
-    
-    if dim == 0:
-        return self
+    # Keeps the first and last ``PRINT_OPTS.edgeitems`` entries along every long axis: at most
+    # ``(2 * edgeitems) ** ndim`` elements, gathered with one ``np.take()`` per axis
+    edgeitems = PRINT_OPTS.edgeitems
 
-    if dim == 1:
-        if self.size_dim(0) > 2 * PRINT_OPTS.edgeitems:
-            return np.concatenate((self[:PRINT_OPTS.edgeitems], self[-PRINT_OPTS.edgeitems:]))
-        else:
-            return self
+    for axis in range(self.dim()):
+        size = self.size_dim(axis)
+        if size > 2 * edgeitems:
+            indices = np.r_[0:edgeitems, size - edgeitems:size]
+            self = np.take(self, indices, axis=axis)
 
-    if self.size_dim(0) > 2 * PRINT_OPTS.edgeitems:
-        start = [self[i] for i in range(0, PRINT_OPTS.edgeitems)]
-        end = ([self[i]
-               for i in range(len(self) - PRINT_OPTS.edgeitems, len(self))])
-        return np.stack([get_summarized_data(x) for x in (start + end)])
-    else:
-        return np.stack([get_summarized_data(x) for x in self])
+    return self
 
 
 def _str_intern(self):
@@ -0,0 +1,159 @@
+#    _____           ______  _____
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+#pylint:disable=unused-argument
+
+import numpy as np
+
+from .tensor import Tensor
+
+__all__ = [
+    'TensorBatch'
+]
+
+_LAYOUTS = ('nhwc', 'nchw')
+
+
+class TensorBatch(Tensor):
+    r"""
+        A batch of images of the same shape, stored as one 4D array. The colorspace and memory layout are set once for the whole batch.
+
+        ``caer.to_rgb()`` (and the other color conversions), ``caer.resize()``, ``caer.transforms.hflip()``/``vflip()``/``hvflip()``,
+        ``caer.normalize()`` and mean subtraction accept a ``TensorBatch`` directly and process every image in one vectorized
+        (or thread-parallel) call. Their result is again a ``TensorBatch``, in the layout of the input.
+
+        Indexing a single image (``batch[i]``) returns a ``caer.Tensor`` view of it. Slicing along the batch axis
+        (``batch[2:10]``) returns a ``TensorBatch`` view. NumPy functions and ufuncs work as usual.
+
+    Args:
+        x (ndarray, list): Array of shape ``(n, height, width, channels)`` (or ``(n, channels, height, width)`` for ``layout='nchw'``),
+            or a list of same-shape images. A 3D array (or a list of 2D images) is treated as a batch of single-channel images.
+        cspace (str): Colorspace of the batch (rgb/bgr/gray/hsv/hls/lab/yuv/luv).
+            Defaults to the colorspace of `x` (or its first image) if that is a ``caer.Tensor``.
+        layout (str): ``'nhwc'`` (channels last, the layout of a ``caer.Tensor``) or ``'nchw'`` (channels first).
+            Defaults to the layout of `x` if that is a ``TensorBatch``, ``'nhwc'`` otherwise.
+        dtype (numpy): (optional) Data Type
+
+    Examples::
+
+        >> batch = caer.TensorBatch(caer.imread_batch(paths, target_size=(224,224)))
+        >> batch.shape, batch.cspace
+        ((32, 224, 224, 3), 'rgb')
+
+        >> batch = caer.to_bgr(caer.transforms.hflip(batch)) # Two vectorized calls for the whole batch
+        >> batch[0].shape # A Tensor view of the first image
+        (224, 224, 3)
+
+        >> batch.to_layout('nchw').shape # e.g. for PyTorch
+        (32, 3, 224, 224)
+
+    """
+    __module__ = 'caer'
+
+    layout = 'nhwc' # default
+
+    def __new__(cls, x, cspace=None, layout=None, dtype=None):
+        layout = _get_layout(x, layout)
+        if layout not in _LAYOUTS:
+            raise ValueError(f'`layout` must be either "nhwc" or "nchw". Got "{layout}"')
+
+        if isinstance(x, (list, tuple)):
+            if len(x) == 0:
+                raise ValueError('Cannot create a TensorBatch from an empty list')
+
+            shapes = {np.shape(tens) for tens in x}
+            if len(shapes) != 1:
+                raise ValueError(f'Every image of a TensorBatch must have the same shape. Got {sorted(shapes)}')
+
+            x = np.stack(x)
+
+        if not isinstance(x, np.ndarray):
+            raise TypeError('`x` needs to be an ndarray or a list of images')
+
+        if x.ndim == 3:
+            # Single-channel images
+            x = x[..., None] if layout == 'nhwc' else x[:, None]
+
+        if x.ndim != 4:
+            raise ValueError(f'A TensorBatch must be 4D ({layout}). Got an array of shape {x.shape}')
+
+        return super().__new__(cls, x, cspace, dtype=dtype)
+
+    def __init__(self, x, cspace=None, layout=None, dtype=None):
+        if cspace is None:
+            # Inherit the colorspace of the stacked images
+            first = x[0] if isinstance(x, (list, tuple)) else x
+            cspace = getattr(first, 'cspace', None)
+
+        super().__init__(x, cspace, dtype=dtype)
+        self.layout = _get_layout(x, layout)
+
+    def __array_finalize__(self, obj):
+        super().__array_finalize__(obj)
+        if isinstance(obj, TensorBatch):
+            self.layout = obj.layout
+
+    def __array_wrap__(self, arr, context=None, return_scalar=False):
+        # Reductions over the batch (``batch.mean(axis=0)``, ...) are no longer batches
+        arr = super().__array_wrap__(arr, context, return_scalar)
+        return _downcast(arr)
+
+    def __getitem__(self, index):
+        return _downcast(super().__getitem__(index))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    # Image dimensions are independent of the layout
+    def batch_size(self):
+        return self.shape[0]
+
+    def height(self):
+        return self.shape[self._axis('h')]
+
+    def width(self):
+        return self.shape[self._axis('w')]
+
+    def channels(self):
+        return self.shape[self._axis('c')]
+
+    def to_layout(self, layout) -> 'TensorBatch':
+        r"""
+            Returns the batch in `layout` (``'nhwc'`` or ``'nchw'``). This is a (non-contiguous) view, not a copy.
+            Use ``np.ascontiguousarray()`` on the result if a contiguous buffer is needed.
+        """
+        if layout not in _LAYOUTS:
+            raise ValueError(f'`layout` must be either "nhwc" or "nchw". Got "{layout}"')
+
+        if layout == self.layout:
+            return self
+
+        tens = self.transpose(0, 3, 1, 2) if layout == 'nchw' else self.transpose(0, 2, 3, 1)
+        tens.layout = layout
+        return tens
+
+    def _axis(self, dim):
+        return self.layout.index(dim)
+
+
+def _get_layout(x, layout):
+    if layout is None:
+        return getattr(x, 'layout', 'nhwc')
+    return layout
+
+
+def _downcast(arr):
+    # Anything that isn't 4D anymore (a single image, a pixel, a reduction) is returned as a plain Tensor view
+    if isinstance(arr, TensorBatch) and arr.ndim != 4:
+        return arr.view(Tensor)
+    return arr
+
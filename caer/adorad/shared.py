@@ -0,0 +1,150 @@
+#    _____           ______  _____
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+
+import os
+import sys
+import weakref
+from multiprocessing import shared_memory, resource_tracker
+
+import numpy as np
+
+__all__ = [
+    'SharedTensorHandle'
+]
+
+
+class SharedTensorHandle:
+    r"""
+        A picklable reference to a Tensor copied into a ``multiprocessing.shared_memory`` segment, returned by ``Tensor.to_shared()``.
+
+        Passing the handle to another process (e.g. as the argument of a ``multiprocessing.Pool`` task) sends only its name,
+        shape, dtype and colorspace. ``caer.Tensor.from_shared(handle)`` then maps the segment and returns a zero-copy view of it.
+
+        The process that created the segment owns it: it must call ``unlink()`` once every process is done with it
+        (or use the handle as a context manager). Views returned by ``from_shared()`` keep the segment mapped for as long as they
+        are alive, so they stay valid even after ``unlink()``; the memory is freed once the last view is gone.
+
+    Attributes:
+        name (str): Name of the shared memory segment.
+        shape (tuple): Shape of the Tensor.
+        dtype (numpy dtype): Data type of the Tensor.
+        cspace (str): Colorspace of the Tensor.
+        layout (str): Layout of a ``caer.TensorBatch`` (None for a Tensor).
+
+    Examples::
+
+        >> def work(handle):
+        ..     tens = caer.Tensor.from_shared(handle) # No copy, keeps its cspace
+        ..     return tens.mean()
+
+        >> with tens.to_shared() as handle:
+        ..     with multiprocessing.Pool(4) as pool:
+        ..         means = pool.map(work, [handle] * 8)
+
+    """
+    def __init__(self, name, shape, dtype, cspace, layout=None, shm=None):
+        self.name = name
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.cspace = cspace
+        self.layout = layout
+
+        # The segment, if this handle created it (it never travels with the handle)
+        self._shm = shm
+
+
+    def __repr__(self):
+        return f'SharedTensorHandle(name={self.name!r}, shape={self.shape}, dtype={self.dtype}, cspace={self.cspace!r})'
+
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_shm'] = None
+        return state
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.unlink()
+
+
+    @property
+    def nbytes(self) -> int:
+        return int(np.prod(self.shape, dtype=np.int64)) * self.dtype.itemsize
+
+
+    def close(self):
+        r"""
+            Closes the creating process's own mapping of the segment, without destroying it. Safe to call more than once.
+        """
+        if self._shm is not None:
+            self._shm.close()
+            self._shm = None
+
+
+    def unlink(self):
+        r"""
+            Destroys the segment (its name can no longer be attached to) and closes the creator's mapping.
+            Must be called once, by the process that created it. Existing views remain valid.
+        """
+        if self._shm is not None:
+            if os.name != 'nt' and sys.version_info < (3, 13):
+                # Processes sharing our resource tracker (e.g. multiprocessing workers) removed the segment from it when they
+                # attached (see _attach_segment()). Registering it again (a no-op otherwise) lets unlink() unregister it cleanly
+                resource_tracker.register(self._shm._name, 'shared_memory')
+            self._shm.unlink()
+            self.close()
+
+
+def _to_shared(tens) -> SharedTensorHandle:
+    # Copies `tens` into a new shared memory segment
+    shm = shared_memory.SharedMemory(create=True, size=max(tens.nbytes, 1))
+    handle = SharedTensorHandle(shm.name, tens.shape, tens.dtype, tens.cspace, layout=getattr(tens, 'layout', None), shm=shm)
+
+    np.copyto(np.ndarray(tens.shape, dtype=tens.dtype, buffer=shm.buf), tens)
+    return handle
+
+
+def _from_shared(handle) -> np.ndarray:
+    # Attaches to the segment of `handle` and returns an ndarray view of it
+    if not isinstance(handle, SharedTensorHandle):
+        raise TypeError('`handle` must be a caer.SharedTensorHandle (returned by Tensor.to_shared())')
+
+    shm = _attach_segment(handle.name)
+    if shm.size < handle.nbytes:
+        shm.close()
+        raise ValueError(f'Shared memory segment "{handle.name}" is smaller than the Tensor it should hold')
+
+    arr = np.ndarray(handle.shape, dtype=handle.dtype, buffer=shm.buf)
+
+    # NumPy does not keep `shm` alive, and collecting it would unmap the segment under the array. Every view of `arr` references it
+    # (directly or through the Tensor wrapping it), so the segment is closed once the last view is gone
+    weakref.finalize(arr, shm.close)
+    return arr
+
+
+def _attach_segment(name):
+    r"""
+        Attaches to an existing segment, without handing it to the resource tracker of this process: only its creator owns it,
+        and the tracker would unlink it when this process exits. ``track=False`` does this from Python 3.13 on. Before that,
+        the registration made by ``SharedMemory`` is undone. Windows has no resource tracker
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    shm = shared_memory.SharedMemory(name=name)
+    if os.name != 'nt':
+        resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
@@ -15,6 +15,7 @@ import numpy as np
 
 from ._tensor_str import _str
 from ._tensor_base import _TensorBase
+from .shared import _to_shared, _from_shared
 
 
 # We use np.ndarray as a super class, because ``ndarray.view()`` expects an ndarray sub-class
@@ -35,16 +36,13 @@ class Tensor(_TensorBase, np.ndarray):
                 f'`cspace` needs to be of type <string>, not {type(cspace)}'
             )
 
-        obj = np.asarray(x, dtype=dtype).view(cls)
-        obj.dtype = obj.dtype
-
-        return obj
+        # A view, not a copy (unless `x` is a list or needs a `dtype` conversion).
+        # `x` itself is not kept around, so a Tensor never holds its source array alive
+        return np.asarray(x, dtype=dtype).view(cls)
 
     def __init__(self, x, cspace, dtype=None):
-        super().__init__()  # gets attributes from '_TensorBase'
-        self.x = x
-
-        if cspace is None:
+        # 'null' is what a Tensor of unknown colorspace carries (and passes on to its views), so re-wrapping one is allowed
+        if cspace is None or cspace == 'null':
             self.cspace = 'null'
 
         else:
@@ -55,6 +53,65 @@ class Tensor(_TensorBase, np.ndarray):
                     'The `cspace` attribute needs to be either rgb/bgr/gray/hsv/hls/lab/yuv/luv'
                 )
 
+    def __array_finalize__(self, obj):
+        # Called for every new Tensor: views, slices, ``.astype()`` copies and ufunc outputs.
+        # Metadata is inherited from the array it derives from, so ``tens[10:20]`` or ``tens * 2`` keep their ``cspace``.
+        # Arrays that aren't Tensors leave the class defaults of ``_TensorBase`` in place
+        if isinstance(obj, Tensor):
+            self.cspace = obj.cspace
+            self.foreign = obj.foreign
+
+    def to_shared(self):
+        r"""
+            Copies the Tensor into a new ``multiprocessing.shared_memory`` segment, and returns a picklable ``caer.SharedTensorHandle``.
+
+            Send the handle to worker processes instead of the Tensor itself (which would be pickled and copied through a pipe),
+            and rebuild it there with ``caer.Tensor.from_shared(handle)``. The calling process owns the segment and must
+            ``unlink()`` the handle once the workers are done (or use it as a context manager).
+
+        Returns:
+            SharedTensorHandle
+        """
+        return _to_shared(self)
+
+    @classmethod
+    def from_shared(cls, handle):
+        r"""
+            Returns a zero-copy view of a Tensor shared with ``Tensor.to_shared()``, with its ``cspace`` (a ``caer.TensorBatch``,
+            with its layout, if a batch was shared). Writes to the view are visible to every process sharing the segment.
+
+        Args:
+            handle (SharedTensorHandle): Handle returned by ``Tensor.to_shared()``, possibly unpickled in another process.
+
+        Returns:
+            Tensor
+        """
+        arr = _from_shared(handle)
+
+        if handle.layout is not None:
+            from .batch import TensorBatch
+            return TensorBatch(arr, cspace=handle.cspace, layout=handle.layout)
+
+        return Tensor(arr, cspace=handle.cspace)
+
+    def __dlpack__(self, *, stream=None, **kwargs):
+        r"""
+            Exports the Tensor as a DLPack capsule, for zero-copy consumption by any DLPack consumer
+            (``torch.from_dlpack()``, ``jax.dlpack.from_dlpack()``, ``np.from_dlpack()``, ...).
+            DLPack carries no metadata: the ``cspace`` stays on the caer side (see ``caer.from_dlpack()``).
+        """
+        # Newer DLPack keywords (max_version, dl_device, copy) are forwarded only when a consumer passes them
+        return self.view(np.ndarray).__dlpack__(stream=stream, **kwargs)
+
+    def __dlpack_device__(self):
+        return self.view(np.ndarray).__dlpack_device__()
+
+    def __reduce_ex__(self, protocol):
+        # ndarray's reduction already hands contiguous data to protocol 5 as an out-of-band ``pickle.PickleBuffer`` (no copy),
+        # but drops the instance ``__dict__`` holding ``cspace`` (and friends). So it is wrapped, and the metadata sent alongside
+        reduced = np.ndarray.__reduce_ex__(self.view(np.ndarray), protocol)
+        return (_rebuild_tensor, (reduced, type(self), self.__dict__.copy()))
+
     def __repr__(self):
         return _str(self)
 
@@ -62,6 +119,17 @@ class Tensor(_TensorBase, np.ndarray):
         return self.__repr__()
 
 
+def _rebuild_tensor(reduced, cls, metadata):
+    # Inverse of Tensor.__reduce_ex__()
+    arr = reduced[0](*reduced[1])
+    if len(reduced) > 2:
+        arr.__setstate__(reduced[2])
+
+    tens = arr.view(cls)
+    tens.__dict__.update(metadata)
+    return tens
+
+
 def is_tensor(x):
     r'''
         Returns True if `x` is a Caer tensor.
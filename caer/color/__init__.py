@@ -10,6 +10,7 @@
 # Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
 
 from .core import (
+    convert,
     to_bgr,
     to_rgb,
     to_gray,
@@ -10,10 +10,8 @@
 # Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
 
 
-import cv2 as cv
-
-from ..adorad import Tensor, to_tensor
-from ._constants import BGR2RGB, BGR2GRAY, BGR2HSV, BGR2LAB, BGR2HLS, BGR2YUV, BGR2LUV
+from ..adorad import Tensor, TensorBatch, to_tensor
+from .core import _convert_as
 
 __all__ = [
     'bgr2gray',
@@ -29,7 +27,9 @@ __all__ = [
 def _is_bgr_image(tens):
     # tens = to_tensor(tens)
     # return tens.is_bgr()
-    return len(tens.shape) == 3 and tens.shape[-1] == 3
+    if isinstance(tens, TensorBatch):
+        return tens.channels() == 3
+    return len(tens.shape) in (3, 4) and tens.shape[-1] == 3
 
 
 def bgr2rgb(tens) -> Tensor:
@@ -37,7 +37,7 @@ def bgr2rgb(tens) -> Tensor:
         Converts a BGR Tensor to its RGB version.
 
     Args:
-        tens (Tensor): Valid BGR Tensor
+        tens (Tensor): Valid BGR Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         RGB Tensor of shape ``(height, width, channels)``
@@ -51,8 +51,7 @@ def bgr2rgb(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a BGR Tensor to its RGB counterpart'
         )
 
-    im = cv.cvtColor(tens, BGR2RGB)
-    return to_tensor(im, cspace='rgb')
+    return _convert_as(tens, 'bgr', 'rgb')
 
 
 def bgr2gray(tens) -> Tensor:
@@ -60,7 +59,7 @@ def bgr2gray(tens) -> Tensor:
         Converts a BGR Tensor to its Grayscale version.
 
     Args:
-        tens (Tensor): Valid BGR Tensor
+        tens (Tensor): Valid BGR Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         Grayscale Tensor of shape ``(height, width, channels)``
@@ -79,8 +78,7 @@ def bgr2gray(tens) -> Tensor:
         tens._nullprt()
     )  # raises a ValueError if we're dealing with a Foreign Tensor with illegal `.cspace` value
 
-    im = cv.cvtColor(tens, BGR2GRAY)
-    return to_tensor(im, cspace='gray')
+    return _convert_as(tens, 'bgr', 'gray')
 
 
 def bgr2hsv(tens) -> Tensor:
@@ -88,7 +86,7 @@ def bgr2hsv(tens) -> Tensor:
         Converts a BGR Tensor to its HSV version.
 
     Args:
-        tens (Tensor): Valid BGR Tensor
+        tens (Tensor): Valid BGR Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         HSV Tensor of shape ``(height, width, channels)``
@@ -102,8 +100,7 @@ def bgr2hsv(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a BGR Tensor to its HSV counterpart'
         )
 
-    im = cv.cvtColor(tens, BGR2HSV)
-    return to_tensor(im, cspace='hsv')
+    return _convert_as(tens, 'bgr', 'hsv')
 
 
 def bgr2lab(tens) -> Tensor:
@@ -111,7 +108,7 @@ def bgr2lab(tens) -> Tensor:
         Converts a BGR Tensor to its LAB version.
 
     Args:
-        tens (Tensor): Valid BGR Tensor
+        tens (Tensor): Valid BGR Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         LAB Tensor of shape ``(height, width, channels)``
@@ -125,8 +122,7 @@ def bgr2lab(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a BGR Tensor to its LAB counterpart'
         )
 
-    im = cv.cvtColor(tens, BGR2LAB)
-    return to_tensor(im, cspace='lab')
+    return _convert_as(tens, 'bgr', 'lab')
 
 
 def bgr2hls(tens) -> Tensor:
@@ -134,7 +130,7 @@ def bgr2hls(tens) -> Tensor:
         Converts a BGR Tensor to its HLS version.
 
     Args:
-        tens (Tensor): Valid BGR Tensor
+        tens (Tensor): Valid BGR Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         HLS Tensor of shape ``(height, width, channels)``
@@ -148,8 +144,7 @@ def bgr2hls(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a BGR Tensor to its HLS counterpart'
         )
 
-    im = cv.cvtColor(tens, BGR2HLS)
-    return to_tensor(im, cspace='hls')
+    return _convert_as(tens, 'bgr', 'hls')
 
 
 def bgr2yuv(tens) -> Tensor:
@@ -157,7 +152,7 @@ def bgr2yuv(tens) -> Tensor:
         Converts a BGR Tensor to its YUV version.
 
     Args:
-        tens (Tensor): Valid BGR Tensor
+        tens (Tensor): Valid BGR Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         YUV Tensor of shape ``(height, width, channels)``
@@ -171,8 +166,7 @@ def bgr2yuv(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a BGR Tensor to its YUV counterpart'
         )
 
-    im = cv.cvtColor(tens, BGR2YUV)
-    return to_tensor(im, cspace='yuv')
+    return _convert_as(tens, 'bgr', 'yuv')
 
 
 def bgr2luv(tens) -> Tensor:
@@ -180,7 +174,7 @@ def bgr2luv(tens) -> Tensor:
         Converts a BGR Tensor to its LUV version.
 
     Args:
-        tens (Tensor): Valid BGR Tensor
+        tens (Tensor): Valid BGR Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         YUV Tensor of shape ``(height, width, channels)``
@@ -194,5 +188,4 @@ def bgr2luv(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a BGR Tensor to its LUV counterpart'
         )
 
-    im = cv.cvtColor(tens, BGR2LUV)
-    return to_tensor(im, cspace='luv')
+    return _convert_as(tens, 'bgr', 'luv')
@@ -0,0 +1,180 @@
+#    _____           ______  _____
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+
+# Table-driven colorspace conversion shared by caer.color.convert(), the to_*() functions and the xxx2yyy() helpers
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2 as cv
+import numpy as np
+
+from .._internal import _get_num_workers
+from ._constants import (
+    BGR2RGB, BGR2GRAY, RGB2GRAY, GRAY2BGR, GRAY2RGB,
+    BGR2HSV, RGB2HSV, HSV2BGR, HSV2RGB,
+    BGR2HLS, RGB2HLS, HLS2BGR, HLS2RGB,
+    BGR2LAB, RGB2LAB, LAB2BGR, LAB2RGB,
+    BGR2LUV, RGB2LUV, LUV2BGR, LUV2RGB,
+    BGR2YUV, RGB2YUV, YUV2BGR, YUV2RGB,
+)
+
+# 'bgr' comes first, so that paths that need an intermediate colorspace go through BGR (as they always have)
+CSPACES = ('bgr', 'rgb', 'gray', 'hsv', 'hls', 'lab', 'yuv', 'luv')
+
+# Conversions OpenCV performs in a single pass
+_DIRECT = {
+    ('bgr', 'rgb'): BGR2RGB, ('rgb', 'bgr'): BGR2RGB,
+    ('bgr', 'gray'): BGR2GRAY, ('rgb', 'gray'): RGB2GRAY, ('gray', 'bgr'): GRAY2BGR, ('gray', 'rgb'): GRAY2RGB,
+    ('bgr', 'hsv'): BGR2HSV, ('rgb', 'hsv'): RGB2HSV, ('hsv', 'bgr'): HSV2BGR, ('hsv', 'rgb'): HSV2RGB,
+    ('bgr', 'hls'): BGR2HLS, ('rgb', 'hls'): RGB2HLS, ('hls', 'bgr'): HLS2BGR, ('hls', 'rgb'): HLS2RGB,
+    ('bgr', 'lab'): BGR2LAB, ('rgb', 'lab'): RGB2LAB, ('lab', 'bgr'): LAB2BGR, ('lab', 'rgb'): LAB2RGB,
+    ('bgr', 'luv'): BGR2LUV, ('rgb', 'luv'): RGB2LUV, ('luv', 'bgr'): LUV2BGR, ('luv', 'rgb'): LUV2RGB,
+    ('bgr', 'yuv'): BGR2YUV, ('rgb', 'yuv'): RGB2YUV, ('yuv', 'bgr'): YUV2BGR, ('yuv', 'rgb'): YUV2RGB,
+}
+
+
+def _shortest_path(src, dst):
+    # Breadth-first search over the direct conversions: the fewest full-image passes from `src` to `dst`
+    parents = {src: None}
+    queue = deque([src])
+
+    while queue:
+        cspace = queue.popleft()
+        if cspace == dst:
+            break
+
+        for nxt in CSPACES:
+            if (cspace, nxt) in _DIRECT and nxt not in parents:
+                parents[nxt] = cspace
+                queue.append(nxt)
+
+    path = [dst]
+    while path[-1] != src:
+        path.append(parents[path[-1]])
+    return path[::-1]
+
+
+# (src, dst) -> colorspaces visited, e.g. ('hsv', 'lab') -> ['hsv', 'bgr', 'lab']
+PATHS = {(src, dst): _shortest_path(src, dst) for src in CSPACES for dst in CSPACES}
+
+# Per-thread scratch buffer for the intermediate image of two-pass conversions
+_scratch = threading.local()
+
+# OpenCV's 8-bit LAB/LUV conversions are computed in floating point, and cost more than a table lookup.
+# Its HSV, HLS and YUV conversions are cheaper than the lookup, so they are left to OpenCV
+_GRAY_LUT_CSPACES = ('lab', 'luv')
+
+# dst -> (1, 256, 3) uint8 table of every gray level converted to `dst`
+_GRAY_LUTS = {}
+_GRAY_LUTS_LOCK = threading.Lock()
+
+
+def _convert(tens, src, dst, out=None, workers=None):
+    r"""
+        Converts `tens` from colorspace `src` to `dst` along the cheapest path, and returns the result as an ndarray
+        (`tens` itself if ``src == dst`` and `out` is None). A 4D `tens` is a ``(n, height, width, channels)`` stack,
+        converted by _convert_batch().
+
+        Paths of one direct OpenCV conversion run in a single pass. Longer paths write their intermediate image into a
+        per-thread scratch buffer that is reused across calls, so with `out` given, steady-state conversions allocate nothing.
+        8-bit grayscale images are converted to LAB/LUV by expanding them to BGR and applying a 256-entry lookup table of the
+        full conversion (see _gray_lut()), which gives identical results for a fraction of the cost.
+
+        `out` must already have been validated (see caer.color.convert())
+    """
+    if src == dst:
+        if out is None:
+            return tens
+        np.copyto(out, tens)
+        return out
+
+    if tens.ndim == 4:
+        return _convert_batch(tens, src, dst, out=out, workers=workers)
+
+    # OpenCV only writes into plain ndarrays in place
+    if out is not None:
+        out = out.view(np.ndarray)
+
+    path = PATHS[(src, dst)]
+
+    if src == 'gray' and dst in _GRAY_LUT_CSPACES and tens.dtype == np.uint8:
+        bgr = cv.cvtColor(tens, GRAY2BGR, dst=out)
+        return cv.LUT(bgr, _gray_lut(dst), dst=bgr)
+
+    for i in range(len(path) - 1):
+        last = i == len(path) - 2
+        dst_buf = out if last else _get_scratch(tens.shape[:2] + (3,), tens.dtype)
+        tens = cv.cvtColor(tens, _DIRECT[(path[i], path[i + 1])], dst=dst_buf)
+
+    return tens
+
+
+def _convert_batch(tens, src, dst, out=None, workers=None):
+    r"""
+        Converts every image of the ``(n, height, width, channels)`` stack `tens` into its slot of a single output array of
+        shape ``(n, height, width, channels_out)``, on a thread pool. Each image goes through exactly the same code as a
+        single image, so the results are identical. OpenCV releases the GIL while converting, so threads scale across cores.
+    """
+    n = len(tens)
+    if out is None:
+        out = np.empty(tens.shape[:3] + (1 if dst == 'gray' else 3,), dtype=tens.dtype)
+    else:
+        out = out.view(np.ndarray)
+
+    # Indexing plain ndarrays is much cheaper than indexing Tensors
+    tens = tens.view(np.ndarray)
+
+    def _convert_chunk(indices):
+        for i in indices:
+            _ = _convert(tens[i], src, dst, out=out[i])
+
+    workers = min(_get_num_workers(workers), n)
+    if workers <= 1:
+        _convert_chunk(range(n))
+        return out
+
+    chunks = [range(i * n // workers, (i + 1) * n // workers) for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Consume the iterator so that errors are raised here
+        list(executor.map(_convert_chunk, chunks))
+
+    return out
+
+
+def _get_scratch(shape, dtype):
+    # Only the last shape is kept, so a thread holds at most one intermediate image
+    buf = getattr(_scratch, 'buf', None)
+    if buf is None or buf.shape != shape or buf.dtype != dtype:
+        buf = np.empty(shape, dtype=dtype)
+        _scratch.buf = buf
+    return buf
+
+
+def _gray_lut(dst):
+    # A gray level expands to the same value in every BGR channel, so channel `c` of the converted pixel only depends on
+    # that value: ``cv.LUT()`` maps channel `c` of the expanded image through ``lut[..., c]``
+    lut = _GRAY_LUTS.get(dst)
+    if lut is None:
+        with _GRAY_LUTS_LOCK:
+            levels = np.arange(256, dtype=np.uint8).reshape(1, 256)
+            path = PATHS[('gray', dst)]
+
+            # The path converts every gray level exactly as a gray image would be converted
+            lut = levels
+            for i in range(len(path) - 1):
+                lut = cv.cvtColor(lut, _DIRECT[(path[i], path[i + 1])])
+
+            lut = np.ascontiguousarray(lut.reshape(1, 256, 3))
+            _GRAY_LUTS[dst] = lut
+    return lut
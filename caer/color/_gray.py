@@ -10,11 +10,8 @@
 # Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
 
 
-import cv2 as cv
-
-from ..adorad import Tensor, to_tensor
-from ._constants import GRAY2BGR, GRAY2RGB
-from ._bgr import bgr2lab, bgr2hsv, bgr2hls, bgr2yuv, bgr2luv
+from ..adorad import Tensor, TensorBatch
+from .core import _convert_as
 
 __all__ = [
     'gray2rgb',
@@ -30,7 +27,9 @@ __all__ = [
 def _is_gray_image(tens):
     # tens = to_tensor(tens)
     # return tens.is_gray()
-    return (len(tens.shape) == 2) or (len(tens.shape) == 3 and tens.shape[-1] == 1)
+    if isinstance(tens, TensorBatch):
+        return tens.channels() == 1
+    return (len(tens.shape) == 2) or (len(tens.shape) in (3, 4) and tens.shape[-1] == 1)
 
 
 def gray2rgb(tens) -> Tensor:
@@ -38,7 +37,7 @@ def gray2rgb(tens) -> Tensor:
         Converts a Grayscale Tensor to its RGB version.
 
     Args:
-        tens (Tensor): Valid Grayscale Tensor
+        tens (Tensor): Valid Grayscale Tensor, or a ``(n, height, width, 1)`` stack of them
 
     Returns:
         RGB Tensor of shape ``(height, width, channels)``
@@ -52,8 +51,7 @@ def gray2rgb(tens) -> Tensor:
             f'Tensor of shape 2 expected. Found shape {len(tens.shape)}. This function converts a Grayscale Tensor to its RGB counterpart'
         )
 
-    im = cv.cvtColor(tens, GRAY2RGB)
-    return to_tensor(im, cspace='rgb')
+    return _convert_as(tens, 'gray', 'rgb')
 
 
 def gray2bgr(tens) -> Tensor:
@@ -61,7 +59,7 @@ def gray2bgr(tens) -> Tensor:
         Converts a Grayscale Tensor to its BGR version.
 
     Args:
-        tens (Tensor): Valid Grayscale Tensor
+        tens (Tensor): Valid Grayscale Tensor, or a ``(n, height, width, 1)`` stack of them
 
     Returns:
         BGR Tensor of shape ``(height, width, channels)``
@@ -75,8 +73,7 @@ def gray2bgr(tens) -> Tensor:
             f'Tensor of shape 2 expected. Found shape {len(tens.shape)}. This function converts a Grayscale Tensor to its BGR counterpart'
         )
 
-    im = cv.cvtColor(tens, GRAY2BGR)
-    return to_tensor(im, cspace='bgr')
+    return _convert_as(tens, 'gray', 'bgr')
 
 
 def gray2hsv(tens) -> Tensor:
@@ -84,7 +81,7 @@ def gray2hsv(tens) -> Tensor:
         Converts a Grayscale Tensor to its HSV version.
 
     Args:
-        tens (Tensor): Valid Grayscale Tensor
+        tens (Tensor): Valid Grayscale Tensor, or a ``(n, height, width, 1)`` stack of them
 
     Returns:
         HSV Tensor of shape ``(height, width, channels)``
@@ -98,10 +95,7 @@ def gray2hsv(tens) -> Tensor:
             f'Tensor of shape 2 expected. Found shape {len(tens.shape)}. This function converts a LAB Tensor to its HSV counterpart'
         )
 
-    bgr = gray2bgr(tens)
-
-    im = bgr2hsv(bgr)
-    return to_tensor(im, cspace='hsv')
+    return _convert_as(tens, 'gray', 'hsv')
 
 
 def gray2hls(tens) -> Tensor:
@@ -109,7 +103,7 @@ def gray2hls(tens) -> Tensor:
         Converts a Grayscale Tensor to its HLS version.
 
     Args:
-        tens (Tensor): Valid Grayscale Tensor
+        tens (Tensor): Valid Grayscale Tensor, or a ``(n, height, width, 1)`` stack of them
 
     Returns:
         HLS Tensor of shape ``(height, width, channels)``
@@ -123,10 +117,7 @@ def gray2hls(tens) -> Tensor:
             f'Tensor of shape 2 expected. Found shape {len(tens.shape)}. This function converts a LAB Tensor to its HLS counterpart'
         )
 
-    bgr = gray2bgr(tens)
-
-    im = bgr2hls(bgr)
-    return to_tensor(im, cspace='hls')
+    return _convert_as(tens, 'gray', 'hls')
 
 
 def gray2lab(tens) -> Tensor:
@@ -134,7 +125,7 @@ def gray2lab(tens) -> Tensor:
         Converts a Grayscale Tensor to its LAB version.
 
     Args:
-        tens (Tensor): Valid Grayscale Tensor
+        tens (Tensor): Valid Grayscale Tensor, or a ``(n, height, width, 1)`` stack of them
 
     Returns:
         LAB Tensor of shape ``(height, width, channels)``
@@ -148,10 +139,7 @@ def gray2lab(tens) -> Tensor:
             f'Tensor of shape 2 expected. Found shape {len(tens.shape)}. This function converts a Grayscale Tensor to its LAB counterpart'
         )
 
-    bgr = gray2bgr(tens)
-
-    im = bgr2lab(bgr)
-    return to_tensor(im, cspace='lab')
+    return _convert_as(tens, 'gray', 'lab')
 
 
 def gray2yuv(tens) -> Tensor:
@@ -159,7 +147,7 @@ def gray2yuv(tens) -> Tensor:
         Converts a Grayscale Tensor to its YUV version.
 
     Args:
-        tens (Tensor): Valid Grayscale Tensor
+        tens (Tensor): Valid Grayscale Tensor, or a ``(n, height, width, 1)`` stack of them
 
     Returns:
         YUV Tensor of shape ``(height, width, channels)``
@@ -173,10 +161,7 @@ def gray2yuv(tens) -> Tensor:
             f'Tensor of shape 2 expected. Found shape {len(tens.shape)}. This function converts a Grayscale Tensor to its YUV counterpart'
         )
 
-    bgr = gray2bgr(tens)
-
-    im = bgr2yuv(bgr)
-    return to_tensor(im, cspace='yuv')
+    return _convert_as(tens, 'gray', 'yuv')
 
 
 def gray2luv(tens) -> Tensor:
@@ -184,7 +169,7 @@ def gray2luv(tens) -> Tensor:
         Converts a Grayscale Tensor to its LUV version.
 
     Args:
-        tens (Tensor): Valid Grayscale Tensor
+        tens (Tensor): Valid Grayscale Tensor, or a ``(n, height, width, 1)`` stack of them
 
     Returns:
         LUV Tensor of shape ``(height, width, channels)``
@@ -198,7 +183,4 @@ def gray2luv(tens) -> Tensor:
             f'Tensor of shape 2 expected. Found shape {len(tens.shape)}. This function converts a Grayscale Tensor to its LUV counterpart'
         )
 
-    bgr = gray2bgr(tens)
-
-    im = bgr2luv(bgr)
-    return to_tensor(im, cspace='luv')
+    return _convert_as(tens, 'gray', 'luv')
@@ -10,11 +10,8 @@
 # Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
 
 
-import cv2 as cv
-
-from ..adorad import Tensor, to_tensor
-from ._constants import HLS2BGR, HLS2RGB
-from ._bgr import bgr2gray, bgr2lab, bgr2hsv, bgr2yuv, bgr2luv
+from ..adorad import Tensor, TensorBatch
+from .core import _convert_as
 
 
 __all__ = [
@@ -31,7 +28,9 @@ __all__ = [
 def _is_hls_image(tens):
     # tens = to_tensor(tens)
     # return tens.is_hls()
-    return len(tens.shape) == 3 and tens.shape[-1] == 3
+    if isinstance(tens, TensorBatch):
+        return tens.channels() == 3
+    return len(tens.shape) in (3, 4) and tens.shape[-1] == 3
 
 
 def hls2rgb(tens) -> Tensor:
@@ -39,7 +38,7 @@ def hls2rgb(tens) -> Tensor:
         Converts a HLS Tensor to its RGB version.
 
     Args:
-        tens (Tensor): Valid HLS Tensor
+        tens (Tensor): Valid HLS Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         RGB Tensor of shape ``(height, width, channels)``
@@ -53,8 +52,7 @@ def hls2rgb(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a HLS Tensor to its RGB counterpart'
         )
 
-    im = cv.cvtColor(tens, HLS2RGB)
-    return to_tensor(im, cspace='rgb')
+    return _convert_as(tens, 'hls', 'rgb')
 
 
 def hls2bgr(tens) -> Tensor:
@@ -62,7 +60,7 @@ def hls2bgr(tens) -> Tensor:
         Converts a HLS Tensor to its BGR version.
 
     Args:
-        tens (Tensor): Valid HLS Tensor
+        tens (Tensor): Valid HLS Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         BGR Tensor of shape ``(height, width, channels)``
@@ -76,8 +74,7 @@ def hls2bgr(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a HLS Tensor to its BGR counterpart'
         )
 
-    im = cv.cvtColor(tens, HLS2BGR)
-    return to_tensor(im, cspace='bgr')
+    return _convert_as(tens, 'hls', 'bgr')
 
 
 def hls2gray(tens) -> Tensor:
@@ -85,7 +82,7 @@ def hls2gray(tens) -> Tensor:
         Converts a HLS Tensor to its Grayscale version.
 
     Args:
-        tens (Tensor): Valid HLS Tensor
+        tens (Tensor): Valid HLS Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         Grayscale Tensor of shape ``(height, width, channels)``
@@ -99,10 +96,7 @@ def hls2gray(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a HLS Tensor to its Grayscale counterpart'
         )
 
-    bgr = hls2bgr(tens)
-
-    im = bgr2gray(bgr)
-    return to_tensor(im, cspace='gray')
+    return _convert_as(tens, 'hls', 'gray')
 
 
 def hls2hsv(tens) -> Tensor:
@@ -110,7 +104,7 @@ def hls2hsv(tens) -> Tensor:
         Converts a HLS Tensor to its HSV version.
 
     Args:
-        tens (Tensor): Valid HLS Tensor
+        tens (Tensor): Valid HLS Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         HSV Tensor of shape ``(height, width, channels)``
@@ -124,10 +118,7 @@ def hls2hsv(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a HLS Tensor to its LAB counterpart'
         )
 
-    bgr = hls2bgr(tens)
-
-    im = bgr2hsv(bgr)
-    return to_tensor(im, cspace='hsv')
+    return _convert_as(tens, 'hls', 'hsv')
 
 
 def hls2lab(tens) -> Tensor:
@@ -135,7 +126,7 @@ def hls2lab(tens) -> Tensor:
         Converts a HLS Tensor to its LAB version.
 
     Args:
-        tens (Tensor): Valid HLS Tensor
+        tens (Tensor): Valid HLS Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         LAB Tensor of shape ``(height, width, channels)``
@@ -149,10 +140,7 @@ def hls2lab(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a HLS Tensor to its LAB counterpart'
         )
 
-    bgr = hls2bgr(tens)
-
-    im = bgr2lab(bgr)
-    return to_tensor(im, cspace='lab')
+    return _convert_as(tens, 'hls', 'lab')
 
 
 def hls2yuv(tens) -> Tensor:
@@ -160,7 +148,7 @@ def hls2yuv(tens) -> Tensor:
         Converts a HLS Tensor to its YUV version.
 
     Args:
-        tens (Tensor): Valid HLS Tensor
+        tens (Tensor): Valid HLS Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         YUV Tensor of shape ``(height, width, channels)``
@@ -174,10 +162,7 @@ def hls2yuv(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a HLS Tensor to its YUV counterpart'
         )
 
-    bgr = hls2bgr(tens)
-
-    im = bgr2yuv(bgr)
-    return to_tensor(im, cspace='yuv')
+    return _convert_as(tens, 'hls', 'yuv')
 
 
 def hls2luv(tens) -> Tensor:
@@ -185,7 +170,7 @@ def hls2luv(tens) -> Tensor:
         Converts a HLS Tensor to its LUV version.
 
     Args:
-        tens (Tensor): Valid HLS Tensor
+        tens (Tensor): Valid HLS Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         YUV Tensor of shape ``(height, width, channels)``
@@ -199,7 +184,4 @@ def hls2luv(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a HLS Tensor to its LUV counterpart'
         )
 
-    bgr = hls2bgr(tens)
-
-    im = bgr2luv(bgr)
-    return to_tensor(im, cspace='luv')
+    return _convert_as(tens, 'hls', 'luv')
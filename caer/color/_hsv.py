@@ -10,11 +10,8 @@
 # Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
 
 
-import cv2 as cv
-
-from ..adorad import Tensor, to_tensor
-from ._constants import HSV2BGR, HSV2RGB
-from ._bgr import bgr2gray, bgr2lab, bgr2hls, bgr2yuv, bgr2luv
+from ..adorad import Tensor, TensorBatch
+from .core import _convert_as
 
 __all__ = [
     'hsv2rgb',
@@ -30,7 +27,9 @@ __all__ = [
 def _is_hsv_image(tens):
     # tens = to_tensor(tens)
     # return tens.is_hsv()
-    return len(tens.shape) == 3 and tens.shape[-1] == 3
+    if isinstance(tens, TensorBatch):
+        return tens.channels() == 3
+    return len(tens.shape) in (3, 4) and tens.shape[-1] == 3
 
 
 def hsv2rgb(tens) -> Tensor:
@@ -38,7 +37,7 @@ def hsv2rgb(tens) -> Tensor:
         Converts a HSV Tensor to its RGB version.
 
     Args:
-        tens (Tensor): Valid HSV Tensor
+        tens (Tensor): Valid HSV Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         RGB Tensor of shape ``(height, width, channels)``
@@ -52,8 +51,7 @@ def hsv2rgb(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a HSV Tensor to its RGB counterpart'
         )
 
-    im = cv.cvtColor(tens, HSV2RGB)
-    return to_tensor(im, cspace='rgb')
+    return _convert_as(tens, 'hsv', 'rgb')
 
 
 def hsv2bgr(tens) -> Tensor:
@@ -61,7 +59,7 @@ def hsv2bgr(tens) -> Tensor:
         Converts a HSV Tensor to its BGR version.
 
     Args:
-        tens (Tensor): Valid HSV Tensor
+        tens (Tensor): Valid HSV Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         BGR Tensor of shape ``(height, width, channels)``
@@ -75,8 +73,7 @@ def hsv2bgr(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a HSV Tensor to its BGR counterpart'
         )
 
-    im = cv.cvtColor(tens, HSV2BGR)
-    return to_tensor(im, cspace='bgr')
+    return _convert_as(tens, 'hsv', 'bgr')
 
 
 def hsv2gray(tens) -> Tensor:
@@ -84,7 +81,7 @@ def hsv2gray(tens) -> Tensor:
         Converts a HSV Tensor to its Grayscale version.
 
     Args:
-        tens (Tensor): Valid HSV Tensor
+        tens (Tensor): Valid HSV Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         Grayscale Tensor of shape ``(height, width, channels)``
@@ -98,10 +95,7 @@ def hsv2gray(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a HSV Tensor to its Grayscale counterpart'
         )
 
-    bgr = hsv2bgr(tens)
-
-    im = bgr2gray(bgr)
-    return to_tensor(im, cspace='gray')
+    return _convert_as(tens, 'hsv', 'gray')
 
 
 def hsv2hls(tens) -> Tensor:
@@ -109,7 +103,7 @@ def hsv2hls(tens) -> Tensor:
         Converts a HSV Tensor to its HLS version.
 
     Args:
-        tens (Tensor): Valid HSV Tensor
+        tens (Tensor): Valid HSV Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         HLS Tensor of shape ``(height, width, channels)``
@@ -123,10 +117,7 @@ def hsv2hls(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a HSV Tensor to its HLS counterpart'
         )
 
-    bgr = hsv2bgr(tens)
-
-    im = bgr2hls(bgr)
-    return to_tensor(im, cspace='hls')
+    return _convert_as(tens, 'hsv', 'hls')
 
 
 def hsv2lab(tens) -> Tensor:
@@ -134,7 +125,7 @@ def hsv2lab(tens) -> Tensor:
         Converts a HSV Tensor to its LAB version.
 
     Args:
-        tens (Tensor): Valid HSV Tensor
+        tens (Tensor): Valid HSV Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         LAB Tensor of shape ``(height, width, channels)``
@@ -148,10 +139,7 @@ def hsv2lab(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a HSV Tensor to its LAB counterpart'
         )
 
-    bgr = hsv2bgr(tens)
-
-    im = bgr2lab(bgr)
-    return to_tensor(im, cspace='lab')
+    return _convert_as(tens, 'hsv', 'lab')
 
 
 def hsv2yuv(tens) -> Tensor:
@@ -159,7 +147,7 @@ def hsv2yuv(tens) -> Tensor:
         Converts a HSV Tensor to its YUV version.
 
     Args:
-        tens (Tensor): Valid HSV Tensor
+        tens (Tensor): Valid HSV Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         YUV Tensor of shape ``(height, width, channels)``
@@ -173,10 +161,7 @@ def hsv2yuv(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a HSV Tensor to its YUV counterpart'
         )
 
-    bgr = hsv2bgr(tens)
-
-    im = bgr2yuv(bgr)
-    return to_tensor(im, cspace='yuv')
+    return _convert_as(tens, 'hsv', 'yuv')
 
 
 def hsv2luv(tens) -> Tensor:
@@ -184,7 +169,7 @@ def hsv2luv(tens) -> Tensor:
         Converts a HSV Tensor to its LUV version.
 
     Args:
-        tens (Tensor): Valid HSV Tensor
+        tens (Tensor): Valid HSV Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         LUV Tensor of shape ``(height, width, channels)``
@@ -198,7 +183,4 @@ def hsv2luv(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a HSV Tensor to its LUV counterpart'
         )
 
-    bgr = hsv2bgr(tens)
-
-    im = bgr2luv(bgr)
-    return to_tensor(im, cspace='luv')
+    return _convert_as(tens, 'hsv', 'luv')
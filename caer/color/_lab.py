@@ -10,11 +10,8 @@
 # Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
 
 
-import cv2 as cv
-
-from ..adorad import Tensor, to_tensor
-from ._constants import LAB2BGR, LAB2RGB
-from ._bgr import bgr2gray, bgr2hsv, bgr2hls, bgr2yuv, bgr2luv
+from ..adorad import Tensor, TensorBatch
+from .core import _convert_as
 
 __all__ = ['lab2rgb', 'lab2bgr', 'lab2gray', 'lab2hsv', 'lab2hls', 'lab2yuv', 'lab2luv']
 
@@ -22,7 +19,9 @@ __all__ = ['lab2rgb', 'lab2bgr', 'lab2gray', 'lab2hsv', 'lab2hls', 'lab2yuv', 'l
 def _is_lab_image(tens):
     # tens = to_tensor(tens)
     # return tens.is_lab()
-    return len(tens.shape) == 3 and tens.shape[-1] == 3
+    if isinstance(tens, TensorBatch):
+        return tens.channels() == 3
+    return len(tens.shape) in (3, 4) and tens.shape[-1] == 3
 
 
 def lab2rgb(tens) -> Tensor:
@@ -30,7 +29,7 @@ def lab2rgb(tens) -> Tensor:
         Converts an LAB Tensor to its RGB version.
 
     Args:
-        tens (Tensor): Valid LAB Tensor
+        tens (Tensor): Valid LAB Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         RGB Tensor of shape ``(height, width, channels)``
@@ -44,8 +43,7 @@ def lab2rgb(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a LAB Tensor to its RGB counterpart'
         )
 
-    im = cv.cvtColor(tens, LAB2RGB)
-    return to_tensor(im, cspace='rgb')
+    return _convert_as(tens, 'lab', 'rgb')
 
 
 def lab2bgr(tens) -> Tensor:
@@ -53,7 +51,7 @@ def lab2bgr(tens) -> Tensor:
         Converts an LAB Tensor to its BGR version.
 
     Args:
-        tens (Tensor): Valid LAB Tensor
+        tens (Tensor): Valid LAB Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         BGR Tensor of shape ``(height, width, channels)``
@@ -67,8 +65,7 @@ def lab2bgr(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a LAB Tensor to its BGR counterpart'
         )
 
-    im = cv.cvtColor(tens, LAB2BGR)
-    return to_tensor(im, cspace='bgr')
+    return _convert_as(tens, 'lab', 'bgr')
 
 
 def lab2gray(tens) -> Tensor:
@@ -76,7 +73,7 @@ def lab2gray(tens) -> Tensor:
         Converts an LAB Tensor to its Grayscale version.
 
     Args:
-        tens (Tensor): Valid LAB Tensor
+        tens (Tensor): Valid LAB Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         Grayscale Tensor of shape ``(height, width, channels)``
@@ -90,10 +87,7 @@ def lab2gray(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a LAB Tensor to its Grayscale counterpart'
         )
 
-    bgr = lab2bgr(tens)
-
-    im = bgr2gray(bgr)
-    return to_tensor(im, cspace='gray')
+    return _convert_as(tens, 'lab', 'gray')
 
 
 def lab2hsv(tens) -> Tensor:
@@ -101,7 +95,7 @@ def lab2hsv(tens) -> Tensor:
         Converts an LAB Tensor to its HSV version.
 
     Args:
-        tens (Tensor): Valid LAB Tensor
+        tens (Tensor): Valid LAB Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         HSV Tensor of shape ``(height, width, channels)``
@@ -115,10 +109,7 @@ def lab2hsv(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a LAB Tensor to its HSV counterpart'
         )
 
-    bgr = lab2bgr(tens)
-
-    im = bgr2hsv(bgr)
-    return to_tensor(im, cspace='hsv')
+    return _convert_as(tens, 'lab', 'hsv')
 
 
 def lab2hls(tens) -> Tensor:
@@ -126,7 +117,7 @@ def lab2hls(tens) -> Tensor:
         Converts an LAB Tensor to its HLS version.
 
     Args:
-        tens (Tensor): Valid LAB Tensor
+        tens (Tensor): Valid LAB Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         HLS Tensor of shape ``(height, width, channels)``
@@ -140,10 +131,7 @@ def lab2hls(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a LAB Tensor to its LAB counterpart'
         )
 
-    bgr = lab2bgr(tens)
-
-    im = bgr2hls(bgr)
-    return to_tensor(im, cspace='hls')
+    return _convert_as(tens, 'lab', 'hls')
 
 
 def lab2yuv(tens) -> Tensor:
@@ -151,7 +139,7 @@ def lab2yuv(tens) -> Tensor:
         Converts an LAB Tensor to its YUV version.
 
     Args:
-        tens (Tensor): Valid LAB Tensor
+        tens (Tensor): Valid LAB Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         YUV Tensor of shape ``(height, width, channels)``
@@ -165,9 +153,7 @@ def lab2yuv(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a LAB Tensor to its YUV counterpart'
         )
 
-    bgr = lab2bgr(tens)
-    im = bgr2yuv(bgr)
-    return to_tensor(im, cspace='yuv')
+    return _convert_as(tens, 'lab', 'yuv')
 
 
 def lab2luv(tens) -> Tensor:
@@ -175,7 +161,7 @@ def lab2luv(tens) -> Tensor:
         Converts an LAB Tensor to its LUV version.
 
     Args:
-        tens (Tensor): Valid LAB Tensor
+        tens (Tensor): Valid LAB Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         YUV Tensor of shape ``(height, width, channels)``
@@ -189,6 +175,4 @@ def lab2luv(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a LAB Tensor to its LUV counterpart'
         )
 
-    bgr = lab2bgr(tens)
-    im = bgr2luv(bgr)
-    return to_tensor(im, cspace='luv')
+    return _convert_as(tens, 'lab', 'luv')
@@ -9,11 +9,8 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
 
-import cv2 as cv
-
-from ..adorad import Tensor, to_tensor
-from ._constants import LUV2BGR, LUV2RGB
-from ._bgr import bgr2gray, bgr2hls, bgr2hsv, bgr2lab, bgr2yuv
+from ..adorad import Tensor, TensorBatch
+from .core import _convert_as
 
 __all__ = [
     'luv2bgr',
@@ -27,7 +24,9 @@ __all__ = [
 
 
 def _is_luv_image(tens):
-    return len(tens.shape) == 3 and tens.shape[-1] == 3
+    if isinstance(tens, TensorBatch):
+        return tens.channels() == 3
+    return len(tens.shape) in (3, 4) and tens.shape[-1] == 3
 
 
 def luv2bgr(tens) -> Tensor:
@@ -35,7 +34,7 @@ def luv2bgr(tens) -> Tensor:
         Converts an LUV Tensor to its BGR version.
 
     Args:
-        tens (Tensor): Valid LUV Tensor
+        tens (Tensor): Valid LUV Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         BGR Tensor of shape ``(height, width, channels)``
@@ -49,8 +48,7 @@ def luv2bgr(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts an LUV Tensor to its BGR counterpart'
         )
 
-    im = cv.cvtColor(tens, LUV2BGR)
-    return to_tensor(im, cspace='bgr')
+    return _convert_as(tens, 'luv', 'bgr')
 
 
 def luv2rgb(tens) -> Tensor:
@@ -58,7 +56,7 @@ def luv2rgb(tens) -> Tensor:
         Converts a LUV Tensor to its RGB version.
 
     Args:
-        tens (Tensor): Valid LUV Tensor
+        tens (Tensor): Valid LUV Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         RGB Tensor of shape ``(height, width, channels)``
@@ -72,8 +70,7 @@ def luv2rgb(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts a LUV Tensor to its RGB counterpart'
         )
 
-    im = cv.cvtColor(tens, LUV2RGB)
-    return to_tensor(im, cspace='rgb')
+    return _convert_as(tens, 'luv', 'rgb')
 
 
 def luv2gray(tens) -> Tensor:
@@ -81,7 +78,7 @@ def luv2gray(tens) -> Tensor:
         Converts an LUV Tensor to its GRAY version.
 
     Args:
-        tens (Tensor): Valid LUV Tensor
+        tens (Tensor): Valid LUV Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         GRAY Tensor of shape ``(height, width, channels)``
@@ -95,9 +92,7 @@ def luv2gray(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts an LUV Tensor to its GRAY counterpart'
         )
 
-    im = luv2bgr(tens)
-    im = bgr2gray(tens)
-    return to_tensor(im, cspace='gray')
+    return _convert_as(tens, 'luv', 'gray')
 
 
 def luv2hls(tens) -> Tensor:
@@ -105,7 +100,7 @@ def luv2hls(tens) -> Tensor:
         Converts an LUV Tensor to its HLS version.
 
     Args:
-        tens (Tensor): Valid LUV Tensor
+        tens (Tensor): Valid LUV Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         HLS Tensor of shape ``(height, width, channels)``
@@ -119,9 +114,7 @@ def luv2hls(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts an LUV Tensor to its HLS counterpart'
         )
 
-    im = luv2bgr(tens)
-    im = bgr2hls(tens)
-    return to_tensor(im, cspace='hls')
+    return _convert_as(tens, 'luv', 'hls')
 
 
 def luv2hsv(tens) -> Tensor:
@@ -129,7 +122,7 @@ def luv2hsv(tens) -> Tensor:
         Converts an LUV Tensor to its HSV version.
 
     Args:
-        tens (Tensor): Valid LUV Tensor
+        tens (Tensor): Valid LUV Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         HSV Tensor of shape ``(height, width, channels)``
@@ -143,9 +136,7 @@ def luv2hsv(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts an LUV Tensor to its HSV counterpart'
         )
 
-    im = luv2bgr(tens)
-    im = bgr2hsv(tens)
-    return to_tensor(im, cspace='hsv')
+    return _convert_as(tens, 'luv', 'hsv')
 
 
 def luv2lab(tens) -> Tensor:
@@ -153,7 +144,7 @@ def luv2lab(tens) -> Tensor:
         Converts an LUV Tensor to its LAB version.
 
     Args:
-        tens (Tensor): Valid LUV Tensor
+        tens (Tensor): Valid LUV Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         LAB Tensor of shape ``(height, width, channels)``
@@ -167,9 +158,7 @@ def luv2lab(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts an LUV Tensor to its LAB counterpart'
         )
 
-    im = luv2bgr(tens)
-    im = bgr2lab(tens)
-    return to_tensor(im, cspace='lab')
+    return _convert_as(tens, 'luv', 'lab')
 
 
 def luv2yuv(tens) -> Tensor:
@@ -177,7 +166,7 @@ def luv2yuv(tens) -> Tensor:
         Converts an LUV Tensor to its YUV version.
 
     Args:
-        tens (Tensor): Valid LUV Tensor
+        tens (Tensor): Valid LUV Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         YUV Tensor of shape ``(height, width, channels)``
@@ -191,6 +180,4 @@ def luv2yuv(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts an LUV Tensor to its YUV counterpart'
         )
 
-    im = luv2bgr(tens)
-    im = bgr2yuv(tens)
-    return to_tensor(im, cspace='yuv')
+    return _convert_as(tens, 'luv', 'yuv')
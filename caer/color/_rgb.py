@@ -10,10 +10,8 @@
 # Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
 
 
-import cv2 as cv
-
-from ..adorad import Tensor, to_tensor
-from ._constants import RGB2BGR, RGB2GRAY, RGB2HSV, RGB2LAB, RGB2HLS, RGB2YUV, RGB2LUV
+from ..adorad import Tensor, TensorBatch
+from .core import _convert_as
 
 __all__ = [
     'rgb2bgr',
@@ -29,7 +27,9 @@ __all__ = [
 def _is_rgb_image(tens):
     # tens = to_tensor(tens)
     # return tens.is_rgb()
-    return len(tens.shape) == 3 and tens.shape[-1] == 3
+    if isinstance(tens, TensorBatch):
+        return tens.channels() == 3
+    return len(tens.shape) in (3, 4) and tens.shape[-1] == 3
 
 
 def rgb2bgr(tens) -> Tensor:
@@ -37,7 +37,7 @@ def rgb2bgr(tens) -> Tensor:
         Converts an RGB Tensor to its BGR version.
 
     Args:
-        tens (Tensor): Valid RGB Tensor
+        tens (Tensor): Valid RGB Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         BGR Tensor of shape ``(height, width, channels)``
@@ -51,8 +51,7 @@ def rgb2bgr(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts an RGB Tensor to its BGR counterpart'
         )
 
-    im = cv.cvtColor(tens, RGB2BGR)
-    return to_tensor(im, cspace='bgr')
+    return _convert_as(tens, 'rgb', 'bgr')
 
 
 def rgb2gray(tens) -> Tensor:
@@ -60,7 +59,7 @@ def rgb2gray(tens) -> Tensor:
         Converts an RGB Tensor to its Grayscale version.
 
     Args:
-        tens (Tensor): Valid RGB Tensor
+        tens (Tensor): Valid RGB Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         Grayscale Tensor of shape ``(height, width, channels)``
@@ -74,8 +73,7 @@ def rgb2gray(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts an RGB Tensor to its Grayscale counterpart'
         )
 
-    im = cv.cvtColor(tens, RGB2GRAY)
-    return to_tensor(im, cspace='gray')
+    return _convert_as(tens, 'rgb', 'gray')
 
 
 def rgb2hsv(tens) -> Tensor:
@@ -83,7 +81,7 @@ def rgb2hsv(tens) -> Tensor:
         Converts an RGB Tensor to its HSV version.
 
     Args:
-        tens (Tensor): Valid RGB Tensor
+        tens (Tensor): Valid RGB Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         HSV Tensor of shape ``(height, width, channels)``
@@ -97,8 +95,7 @@ def rgb2hsv(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts an RGB Tensor to its HSV counterpart'
         )
 
-    im = cv.cvtColor(tens, RGB2HSV)
-    return to_tensor(im, cspace='hsv')
+    return _convert_as(tens, 'rgb', 'hsv')
 
 
 def rgb2hls(tens) -> Tensor:
@@ -106,7 +103,7 @@ def rgb2hls(tens) -> Tensor:
         Converts an RGB Tensor to its HLS version.
 
     Args:
-        tens (Tensor): Valid RGB Tensor
+        tens (Tensor): Valid RGB Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         HLS Tensor of shape ``(height, width, channels)``
@@ -120,8 +117,7 @@ def rgb2hls(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts an RGB Tensor to its HLS counterpart'
         )
 
-    im = cv.cvtColor(tens, RGB2HLS)
-    return to_tensor(im, cspace='hls')
+    return _convert_as(tens, 'rgb', 'hls')
 
 
 def rgb2lab(tens) -> Tensor:
@@ -129,7 +125,7 @@ def rgb2lab(tens) -> Tensor:
         Converts an RGB Tensor to its LAB version.
 
     Args:
-        tens (Tensor): Valid RGB Tensor
+        tens (Tensor): Valid RGB Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         LAB Tensor of shape ``(height, width, channels)``
@@ -143,8 +139,7 @@ def rgb2lab(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts an RGB Tensor to its LAB counterpart'
         )
 
-    im = cv.cvtColor(tens, RGB2LAB)
-    return to_tensor(im, cspace='lab')
+    return _convert_as(tens, 'rgb', 'lab')
 
 
 def rgb2yuv(tens) -> Tensor:
@@ -152,7 +147,7 @@ def rgb2yuv(tens) -> Tensor:
         Converts an RGB Tensor to its YUV version.
 
     Args:
-        tens (Tensor): Valid RGB Tensor
+        tens (Tensor): Valid RGB Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         YUV Tensor of shape ``(height, width, channels)``
@@ -166,8 +161,7 @@ def rgb2yuv(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts an RGB Tensor to its YUV counterpart'
         )
 
-    im = cv.cvtColor(tens, RGB2YUV)
-    return to_tensor(im, cspace='yuv')
+    return _convert_as(tens, 'rgb', 'yuv')
 
 
 def rgb2luv(tens) -> Tensor:
@@ -175,7 +169,7 @@ def rgb2luv(tens) -> Tensor:
         Converts an RGB Tensor to its LUV version.
 
     Args:
-        tens (Tensor): Valid RGB Tensor
+        tens (Tensor): Valid RGB Tensor, or a ``(n, height, width, 3)`` stack of them
 
     Returns:
         YUV Tensor of shape ``(height, width, channels)``
@@ -189,5 +183,4 @@ def rgb2luv(tens) -> Tensor:
             f'Tensor of shape 3 expected. Found shape {len(tens.shape)}. This function converts an RGB Tensor to its LUV counterpart'
         )
 
-    im = cv.cvtColor(tens, RGB2LUV)
-    return to_tensor(im, cspace='luv')
+    return _convert_as(tens, 'rgb', 'luv')
@@ -9,18 +9,14 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
 
-from ..adorad import Tensor, to_tensor
+import numpy as np
 
-from ._bgr import bgr2gray, bgr2hsv, bgr2lab, bgr2rgb, bgr2hls, bgr2yuv, bgr2luv
-from ._rgb import rgb2gray, rgb2hsv, rgb2lab, rgb2bgr, rgb2hls, rgb2yuv, rgb2luv
-from ._gray import gray2lab, gray2rgb, gray2hsv, gray2bgr, gray2hls, gray2yuv, gray2luv
-from ._hsv import hsv2gray, hsv2rgb, hsv2lab, hsv2bgr, hsv2hls, hsv2yuv, hsv2luv
-from ._hls import hls2gray, hls2rgb, hls2lab, hls2bgr, hls2hsv, hls2yuv, hls2luv
-from ._lab import lab2gray, lab2rgb, lab2hsv, lab2bgr, lab2hls, lab2yuv, lab2luv
-from ._yuv import yuv2bgr, yuv2rgb, yuv2hsv, yuv2hls, yuv2gray, yuv2lab, yuv2luv
-from ._luv import luv2bgr, luv2rgb, luv2hsv, luv2hls, luv2gray, luv2lab, luv2yuv
+from ..adorad import Tensor, TensorBatch, to_tensor
+from .._internal import _check_output
+from ._convert import _convert, CSPACES
 
 __all__ = [
+    'convert',
     'to_rgb',
     'to_bgr',
     'to_gray',
@@ -32,75 +28,120 @@ __all__ = [
 ]
 
 
-def to_rgb(tens) -> Tensor:
+def convert(tens, to, out=None, workers=None) -> Tensor:
     r'''
-        Converts any supported colorspace to RGB
+        Converts a Tensor (or a batch of images) from its colorspace (``tens.cspace``) to the colorspace `to`.
+
+        Every pair of colorspaces is converted along the cheapest path of OpenCV conversions: pairs that OpenCV converts
+        directly (e.g. ``bgr -> hsv``, ``lab -> rgb``) take a single pass over the image, while the others
+        (e.g. ``hsv -> lab``) go through BGR, with the intermediate image held in a reusable buffer.
+        8-bit grayscale images are converted to LAB and LUV through a lookup table, at a fraction of the cost.
+
+        With `out`, nothing is allocated for each call, so a preallocated buffer can be reused for every frame of a video.
+
+        A 4D Tensor of shape ``(n, height, width, channels)`` (or a ``caer.TensorBatch``) is converted on a thread pool, every image
+        into its slot of a single output array. The result is identical to converting each image on its own. Grayscale
+        batches have a channel axis: ``(n, height, width, 1)``.
 
     Args:
-        tens (Tensor)
+        tens (Tensor, TensorBatch): Tensor with a valid ``.cspace``
+        to (str): Target colorspace (rgb/bgr/gray/hsv/hls/lab/yuv/luv)
+        out (Tensor, ndarray): Optional output array to write the result into.
+            Must be contiguous, have the dtype of ``tens``, and be of shape ``(height, width)`` for ``to='gray'``,
+            ``(height, width, 3)`` otherwise (``(n, height, width, 1)`` or ``(n, height, width, 3)`` for a batch, in its layout).
+        workers (int): Number of threads used for a batch. Defaults to the number of available CPUs.
 
     Returns:
-        Tensor
+        Tensor with ``.cspace == to`` (a ``caer.TensorBatch`` in the same layout if ``tens`` is one).
+        If ``out`` is given, the Tensor is a view of ``out``.
+        If ``tens`` is already in `to` (and ``out`` is None), ``tens`` itself is returned.
+
+    Raises:
+        TypeError: If `tens` is not a caer.Tensor (or has no colorspace)
+        ValueError: If `to` is not a supported colorspace, or if `tens` or `out` have the wrong shape
+
+    Examples::
+
+        >> out = np.empty((480, 640, 3), dtype=np.uint8)
+        >> for frame in frames:
+        ..     lab = caer.color.convert(frame, 'lab', out=out) # Written into `out`
+
+        >> stack.shape, stack.cspace
+        ((256, 480, 640, 3), 'bgr')
+        >> caer.color.convert(stack, 'gray', workers=8).shape
+        (256, 480, 640, 1)
     '''
     if not isinstance(tens, Tensor):
         raise TypeError('`tens` must be a caer.Tensor')
 
-    # Convert to tensor
-    _ = (
-        tens._nullprt()
-    )  # raises a ValueError if we're dealing with a Foreign Tensor with illegal `.cspace` value
-    cspace = tens.cspace
-
-    # If 'null', we assume we have a brand new Tensor
-    if cspace == 'null':
-        print(
-            'Warning: Caer was unable to assign a colorspace for a foreign tensor. Sticking with "rgb". This issue will be'
-            'fixed in a future update.'
-        )
+    if to not in CSPACES:
+        raise ValueError(f'`to` must be one of {CSPACES}. Got "{to}"')
 
-        # We assume that the tens is a BGR image
-        im = bgr2rgb(tens)
-        im = to_tensor(im, cspace='rgb')
-        return im
+    # Raises a TypeError if we're dealing with a Foreign Tensor with illegal `.cspace` value
+    tens._nullprt()
+    cspace = tens.cspace
 
-    elif cspace == 'rgb':
+    if to == cspace and out is None:
         return tens
 
-    elif cspace == 'bgr':
-        im = bgr2rgb(tens)
-        return to_tensor(im, cspace='rgb')
+    if isinstance(tens, TensorBatch) and tens.layout == 'nchw':
+        # Converted channels-last, then returned in the layout of the batch
+        res = convert(TensorBatch(np.ascontiguousarray(tens.to_layout('nhwc')), cspace=cspace), to, workers=workers)
+        res = np.asarray(res).transpose(0, 3, 1, 2)
+
+        if out is None:
+            out = np.ascontiguousarray(res)
+        else:
+            _ = _check_output(out, res.shape, res.dtype, 'convert')
+            np.copyto(out, res)
 
-    elif cspace == 'gray':
-        im = gray2rgb(tens)
-        return to_tensor(im, cspace='rgb')
+        return TensorBatch(out, cspace=to, layout='nchw')
 
-    elif cspace == 'hls':
-        im = hls2rgb(tens)
-        return to_tensor(im, cspace='rgb')
+    if cspace == 'gray':
+        if not (tens.ndim == 2 or (tens.ndim in (3, 4) and tens.shape[-1] == 1)):
+            raise ValueError(f'Grayscale Tensor of shape (height, width[, 1]) or (n, height, width, 1) expected. Found shape {tens.shape}')
+    elif not (tens.ndim in (3, 4) and tens.shape[-1] == 3):
+        raise ValueError(f'{cspace.upper()} Tensor of shape (height, width, 3) or (n, height, width, 3) expected. Found shape {tens.shape}')
+
+    if out is not None:
+        leading = tens.shape[:3] if tens.ndim == 4 else tens.shape[:2]
+        if to == cspace:
+            shape = tens.shape
+        elif to == 'gray':
+            shape = leading + (1,) if tens.ndim == 4 else leading
+        else:
+            shape = leading + (3,)
+        _ = _check_output(out, shape, tens.dtype, 'convert')
+
+    im = _convert(tens, cspace, to, out=out, workers=workers)
+
+    if isinstance(tens, TensorBatch):
+        return TensorBatch(im if out is None else out, cspace=to, layout='nhwc')
+
+    if out is not None:
+        # A view of `out`, in the type of `out` if it is a Tensor
+        im = out if isinstance(out, Tensor) else out.view(Tensor)
+        im.cspace = to
+        return im
 
-    elif cspace == 'hsv':
-        im = hsv2rgb(tens)
-        return to_tensor(im, cspace='rgb')
+    return to_tensor(im, cspace=to)
 
-    elif cspace == 'lab':
-        im = lab2rgb(tens)
-        return to_tensor(im, cspace='rgb')
 
-    elif cspace == 'yuv':
-        im = yuv2rgb(tens)
-        return to_tensor(im, cspace='rgb')
+def _convert_as(tens, src, dst) -> Tensor:
+    # Backs the xxx2yyy() helpers, which take `tens` to be in `src` whatever its ``.cspace``.
+    # A TensorBatch goes through convert(), which keeps its type and layout
+    if isinstance(tens, TensorBatch):
+        return convert(TensorBatch(tens, cspace=src), dst)
 
-    elif cspace == 'luv':
-        im = luv2rgb(tens)
-        return to_tensor(im, cspace='rgb')
+    return to_tensor(_convert(tens, src, dst), cspace=dst)
 
 
-def to_bgr(tens) -> Tensor:
+def to_rgb(tens) -> Tensor:
     r'''
-        Converts any supported colorspace to BGR
+        Converts any supported colorspace to RGB
 
     Args:
-        tens (Tensor)
+        tens (Tensor, TensorBatch)
 
     Returns:
         Tensor
@@ -108,42 +149,23 @@ def to_bgr(tens) -> Tensor:
     if not isinstance(tens, Tensor):
         raise TypeError('`tens` must be a caer.Tensor')
 
-    # Convert to tensor
-    _ = (
-        tens._nullprt()
-    )  # raises a ValueError if we're dealing with a Foreign Tensor with illegal `.cspace` value
-    cspace = tens.cspace
-
-    if cspace == 'bgr':
-        return tens
-
-    elif cspace == 'gray':
-        im = gray2bgr(tens)
-        return to_tensor(im, cspace='bgr')
+    return convert(tens, 'rgb')
 
-    elif cspace == 'rgb':
-        im = rgb2bgr(tens)
-        return to_tensor(im, cspace='bgr')
 
-    elif cspace == 'hls':
-        im = hls2bgr(tens)
-        return to_tensor(im, cspace='bgr')
-
-    elif cspace == 'hsv':
-        im = hsv2bgr(tens)
-        return to_tensor(im, cspace='bgr')
+def to_bgr(tens) -> Tensor:
+    r'''
+        Converts any supported colorspace to BGR
 
-    elif cspace == 'lab':
-        im = lab2bgr(tens)
-        return to_tensor(im, cspace='bgr')
+    Args:
+        tens (Tensor, TensorBatch)
 
-    elif cspace == 'yuv':
-        im = yuv2bgr(tens)
-        return to_tensor(im, cspace='bgr')
+    Returns:
+        Tensor
+    '''
+    if not isinstance(tens, Tensor):
+        raise TypeError('`tens` must be a caer.Tensor')
 
-    elif cspace == 'luv':
-        im = luv2bgr(tens)
-        return to_tensor(im, cspace='bgr')
+    return convert(tens, 'bgr')
 
 
 def to_gray(tens) -> Tensor:
@@ -151,7 +173,7 @@ def to_gray(tens) -> Tensor:
         Converts any supported colorspace to grayscale
 
     Args:
-        tens (Tensor)
+        tens (Tensor, TensorBatch)
 
     Returns:
         Tensor
@@ -159,42 +181,7 @@ def to_gray(tens) -> Tensor:
     if not isinstance(tens, Tensor):
         raise TypeError('`tens` must be a caer.Tensor')
 
-    # Convert to tensor
-    _ = (
-        tens._nullprt()
-    )  # raises a ValueError if we're dealing with a Foreign Tensor with illegal `.cspace` value
-    cspace = tens.cspace
-
-    if cspace == 'gray':
-        return tens
-
-    elif cspace == 'bgr':
-        im = bgr2gray(tens)
-        return to_tensor(im, cspace='gray')
-
-    elif cspace == 'rgb':
-        im = rgb2gray(tens)
-        return to_tensor(im, cspace='gray')
-
-    elif cspace == 'hls':
-        im = hls2gray(tens)
-        return to_tensor(im, cspace='gray')
-
-    elif cspace == 'hsv':
-        im = hsv2gray(tens)
-        return to_tensor(im, cspace='gray')
-
-    elif cspace == 'lab':
-        im = lab2gray(tens)
-        return to_tensor(im, cspace='gray')
-
-    elif cspace == 'yuv':
-        im = yuv2gray(tens)
-        return to_tensor(im, cspace='gray')
-
-    elif cspace == 'luv':
-        im = luv2gray(tens)
-        return to_tensor(im, cspace='gray')
+    return convert(tens, 'gray')
 
 
 def to_hsv(tens) -> Tensor:
@@ -202,7 +189,7 @@ def to_hsv(tens) -> Tensor:
         Converts any supported colorspace to hsv
 
     Args:
-        tens (Tensor)
+        tens (Tensor, TensorBatch)
 
     Returns:
         Tensor
@@ -210,42 +197,7 @@ def to_hsv(tens) -> Tensor:
     if not isinstance(tens, Tensor):
         raise TypeError('`tens` must be a caer.Tensor')
 
-    # Convert to tensor
-    _ = (
-        tens._nullprt()
-    )  # raises a ValueError if we're dealing with a Foreign Tensor with illegal `.cspace` value
-    cspace = tens.cspace
-
-    if cspace == 'hsv':
-        return tens
-
-    elif cspace == 'bgr':
-        im = bgr2hsv(tens)
-        return to_tensor(im, cspace='hsv')
-
-    elif cspace == 'rgb':
-        im = rgb2hsv(tens)
-        return to_tensor(im, cspace='hsv')
-
-    elif cspace == 'hls':
-        im = hls2hsv(tens)
-        return to_tensor(im, cspace='hsv')
-
-    elif cspace == 'gray':
-        im = gray2hsv(tens)
-        return to_tensor(im, cspace='hsv')
-
-    elif cspace == 'lab':
-        im = lab2hsv(tens)
-        return to_tensor(im, cspace='hsv')
-
-    elif cspace == 'yuv':
-        im = yuv2hsv(tens)
-        return to_tensor(im, cspace='hsv')
-
-    elif cspace == 'luv':
-        im = luv2hsv(tens)
-        return to_tensor(im, cspace='hsv')
+    return convert(tens, 'hsv')
 
 
 def to_hls(tens) -> Tensor:
@@ -253,7 +205,7 @@ def to_hls(tens) -> Tensor:
         Converts any supported colorspace to HLS
 
     Args:
-        tens (Tensor)
+        tens (Tensor, TensorBatch)
 
     Returns:
         Tensor
@@ -261,42 +213,7 @@ def to_hls(tens) -> Tensor:
     if not isinstance(tens, Tensor):
         raise TypeError('`tens` must be a caer.Tensor')
 
-    # Convert to tensor
-    _ = (
-        tens._nullprt()
-    )  # raises a ValueError if we're dealing with a Foreign Tensor with illegal `.cspace` value
-    cspace = tens.cspace
-
-    if cspace == 'hls':
-        return tens
-
-    elif cspace == 'bgr':
-        im = bgr2hls(tens)
-        return to_tensor(im, cspace='hls')
-
-    elif cspace == 'rgb':
-        im = rgb2hls(tens)
-        return to_tensor(im, cspace='hls')
-
-    elif cspace == 'hsv':
-        im = hsv2hls(tens)
-        return to_tensor(im, cspace='hls')
-
-    elif cspace == 'gray':
-        im = gray2hls(tens)
-        return to_tensor(im, cspace='hls')
-
-    elif cspace == 'lab':
-        im = lab2hls(tens)
-        return to_tensor(im, cspace='hls')
-
-    elif cspace == 'yuv':
-        im = yuv2hls(tens)
-        return to_tensor(im, cspace='hls')
-
-    elif cspace == 'luv':
-        im = luv2hls(tens)
-        return to_tensor(im, cspace='hls')
+    return convert(tens, 'hls')
 
 
 def to_lab(tens) -> Tensor:
@@ -304,7 +221,7 @@ def to_lab(tens) -> Tensor:
         Converts any supported colorspace to LAB
 
     Args:
-        tens (Tensor)
+        tens (Tensor, TensorBatch)
 
     Returns:
         Tensor
@@ -312,36 +229,7 @@ def to_lab(tens) -> Tensor:
     if not isinstance(tens, Tensor):
         raise TypeError('`tens` must be a caer.Tensor')
 
-    # Convert to tensor
-    _ = (
-        tens._nullprt()
-    )  # raises a ValueError if we're dealing with a Foreign Tensor with illegal `.cspace` value
-    cspace = tens.cspace
-
-    if cspace == 'lab':
-        return tens
-
-    elif cspace == 'bgr':
-        im = bgr2lab(tens)
-        return to_tensor(im, cspace='lab')
-    elif cspace == 'rgb':
-        im = rgb2lab(tens)
-        return to_tensor(im, cspace='lab')
-    elif cspace == 'hsv':
-        im = hsv2lab(tens)
-        return to_tensor(im, cspace='lab')
-    elif cspace == 'gray':
-        im = gray2lab(tens)
-        return to_tensor(im, cspace='lab')
-    elif cspace == 'hls':
-        im = hls2lab(tens)
-        return to_tensor(im, cspace='lab')
-    elif cspace == 'yuv':
-        im = yuv2lab(tens)
-        return to_tensor(im, cspace='lab')
-    elif cspace == 'luv':
-        im = luv2lab(tens)
-        return to_tensor(im, cspace='lab')
+    return convert(tens, 'lab')
 
 
 def to_yuv(tens) -> Tensor:
@@ -349,7 +237,7 @@ def to_yuv(tens) -> Tensor:
         Converts any supported colorspace to YUV
 
     Args:
-        tens (Tensor)
+        tens (Tensor, TensorBatch)
 
     Returns:
         Tensor
@@ -357,36 +245,7 @@ def to_yuv(tens) -> Tensor:
     if not isinstance(tens, Tensor):
         raise TypeError('`tens` must be a caer.Tensor')
 
-    # Convert to tensor
-    _ = (
-        tens._nullprt()
-    )  # raises a ValueError if we're dealing with a Foreign Tensor with illegal `.cspace` value
-    cspace = tens.cspace
-
-    if cspace == 'yuv':
-        return tens
-
-    elif cspace == 'bgr':
-        im = bgr2yuv(tens)
-        return to_tensor(im, cspace='yuv')
-    elif cspace == 'rgb':
-        im = rgb2yuv(tens)
-        return to_tensor(im, cspace='yuv')
-    elif cspace == 'hsv':
-        im = hsv2yuv(tens)
-        return to_tensor(im, cspace='yuv')
-    elif cspace == 'gray':
-        im = gray2yuv(tens)
-        return to_tensor(im, cspace='yuv')
-    elif cspace == 'hls':
-        im = hls2yuv(tens)
-        return to_tensor(im, cspace='yuv')
-    elif cspace == 'lab':
-        im = lab2yuv(tens)
-        return to_tensor(im, cspace='yuv')
-    elif cspace == 'luv':
-        im = luv2yuv(tens)
-        return to_tensor(im, cspace='yuv')
+    return convert(tens, 'yuv')
 
 
 def to_luv(tens) -> Tensor:
@@ -394,7 +253,7 @@ def to_luv(tens) -> Tensor:
         Converts any supported colorspace to LUV
 
     Args:
-        tens (Tensor)
+        tens (Tensor, TensorBatch)
 
     Returns:
         Tensor
@@ -402,33 +261,4 @@ def to_luv(tens) -> Tensor:
     if not isinstance(tens, Tensor):
         raise TypeError('`tens` must be a caer.Tensor')
 
-    # Convert to tensor
-    _ = (
-        tens._nullprt()
-    )  # raises a ValueError if we're dealing with a Foreign Tensor with illegal `.cspace` value
-    cspace = tens.cspace
-
-    if cspace == 'luv':
-        return tens
-
-    elif cspace == 'bgr':
-        im = bgr2luv(tens)
-        return to_tensor(im, cspace='luv')
-    elif cspace == 'rgb':
-        im = rgb2luv(tens)
-        return to_tensor(im, cspace='luv')
-    elif cspace == 'hsv':
-        im = hsv2luv(tens)
-        return to_tensor(im, cspace='luv')
-    elif cspace == 'gray':
-        im = gray2luv(tens)
-        return to_tensor(im, cspace='luv')
-    elif cspace == 'hls':
-        im = hls2luv(tens)
-        return to_tensor(im, cspace='luv')
-    elif cspace == 'lab':
-        im = lab2luv(tens)
-        return to_tensor(im, cspace='luv')
-    elif cspace == 'yuv':
-        im = yuv2luv(tens)
-        return to_tensor(im, cspace='luv')
+    return convert(tens, 'luv')
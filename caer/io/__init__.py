@@ -13,14 +13,75 @@
 from .resize import (
     resize,
     smart_resize,
+    resize_batch,
+    ResizePlan,
     __all__ as __all_res__
 )
 
 # Image 
 from .io import (
     imread,
+    imread_batch,
+    imread_iter,
     imsave,
     __all__ as __all_io__
 )
 
-__all__ = __all_io__ + __all_res__
\ No newline at end of file
+# Pyramids
+from .pyramid import (
+    ImagePyramid,
+    __all__ as __all_pyramid__
+)
+
+# Tiled processing
+from .tiled import (
+    tiled_resize,
+    __all__ as __all_tiled__
+)
+
+# In-memory codecs
+from .codec import (
+    imdecode,
+    imdecode_batch,
+    imencode,
+    imencode_batch,
+    __all__ as __all_codec__
+)
+
+# URLs
+from .urls import (
+    URLFetcher,
+    imread_urls,
+    __all__ as __all_urls__
+)
+
+# Writers
+from .writer import (
+    AsyncImageWriter,
+    __all__ as __all_writer__
+)
+
+# Decoded-image cache
+from .cache import (
+    ImageCache,
+    enable_image_cache,
+    disable_image_cache,
+    get_image_cache,
+    __all__ as __all_cache__
+)
+
+# Header probing
+from .probe import (
+    imsize,
+    imsize_batch,
+    __all__ as __all_probe__
+)
+
+# Shards
+from .shards import (
+    ShardWriter,
+    ShardReader,
+    __all__ as __all_shards__
+)
+
+__all__ = __all_io__ + __all_res__ + __all_pyramid__ + __all_tiled__ + __all_codec__ + __all_urls__ + __all_writer__ + __all_cache__ + __all_probe__ + __all_shards__
\ No newline at end of file
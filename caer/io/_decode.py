@@ -0,0 +1,94 @@
+#    _____           ______  _____ 
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+# Decoding helpers shared by the file, URL and in-memory readers in caer.io
+
+import cv2 as cv
+import numpy as np 
+
+from .resize import resize
+from ..adorad import to_tensor
+from .._internal import _check_output
+
+
+IMREAD_GRAYSCALE = 0
+IMREAD_COLOR = 1
+IMREAD_REDUCED_GRAYSCALE_2 = 16
+IMREAD_REDUCED_COLOR_2 = 17
+IMREAD_REDUCED_GRAYSCALE_4 = 32
+IMREAD_REDUCED_COLOR_4 = 33
+IMREAD_REDUCED_GRAYSCALE_8 = 64
+IMREAD_REDUCED_COLOR_8 = 65
+BGR2RGB = 4
+
+# OpenCV decodes colour images as BGR, so 'rgb' needs a single (in-place) channel swap after decoding
+_DECODE_FLAGS = {
+    'rgb': IMREAD_COLOR,
+    'bgr': IMREAD_COLOR,
+    'gray': IMREAD_GRAYSCALE,
+}
+
+# (scale, flag) pairs for DCT-domain (reduced-resolution) JPEG decoding. Largest reduction first
+_REDUCED_DECODE_FLAGS = {
+    'rgb': ((8, IMREAD_REDUCED_COLOR_8), (4, IMREAD_REDUCED_COLOR_4), (2, IMREAD_REDUCED_COLOR_2)),
+    'bgr': ((8, IMREAD_REDUCED_COLOR_8), (4, IMREAD_REDUCED_COLOR_4), (2, IMREAD_REDUCED_COLOR_2)),
+    'gray': ((8, IMREAD_REDUCED_GRAYSCALE_8), (4, IMREAD_REDUCED_GRAYSCALE_4), (2, IMREAD_REDUCED_GRAYSCALE_2)),
+}
+
+
+def _decode_cspace(rgb, gray):
+    r"""
+        Returns the colorspace ('rgb', 'bgr' or 'gray') the decoders should produce
+    """
+    if gray:
+        return 'gray'
+    return 'rgb' if rgb else 'bgr'
+
+
+def _finish_decode(tens, cspace):
+    r"""
+        Converts a freshly decoded (BGR or grayscale) ndarray to `cspace`. 
+        At most one conversion is done, in-place.
+    """
+    # WARNING: DO NOT USE to_rgb() as it creates a brand new Tensor (which defaults to RGB)
+    if cspace == 'rgb':
+        cv.cvtColor(tens, BGR2RGB, dst=tens)
+
+    return tens
+
+
+def _decode_buffer(buffer, cspace='rgb', source='buffer'):
+    r"""
+        Decodes an encoded image held in memory (bytes, bytearray, memoryview, ...) into an ndarray in `cspace` (rgb/bgr/gray).
+        `buffer` is wrapped with ``np.frombuffer``, so the encoded payload is not copied.
+    """
+    tens = cv.imdecode(np.frombuffer(buffer, dtype=np.uint8), _DECODE_FLAGS[cspace])
+
+    if tens is None:
+        raise ValueError(f'No image found at "{source}"')
+
+    return _finish_decode(tens, cspace)
+
+
+def _finish_read(tens, cspace, target_size=None, resize_factor=None, preserve_aspect_ratio=False, interpolation='bilinear', out=None):
+    r"""
+        Resizes a freshly decoded ndarray (if required) and wraps it as a Tensor tagged with `cspace`.
+        If `out` is given, the result is written into it (the resize writes there directly)
+    """
+    if target_size is not None or resize_factor is not None:
+        tens = resize(tens, target_size, resize_factor=resize_factor, preserve_aspect_ratio=preserve_aspect_ratio,interpolation=interpolation, out=out)
+
+    elif out is not None:
+        _ = _check_output(out, tens.shape, tens.dtype, 'imread')
+        np.copyto(out, tens)
+        tens = out
+
+    return to_tensor(tens, cspace=cspace)
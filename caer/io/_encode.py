@@ -0,0 +1,113 @@
+#    _____           ______  _____
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+
+# Encoder parameter handling shared by caer.imsave(), caer.io.imencode() and caer.io.AsyncImageWriter
+
+import os
+
+
+IMWRITE_JPEG_QUALITY = 1
+IMWRITE_JPEG_PROGRESSIVE = 2
+IMWRITE_JPEG_OPTIMIZE = 3
+IMWRITE_PNG_COMPRESSION = 16
+IMWRITE_WEBP_QUALITY = 64
+
+# Encoder profiles. `None` (the default everywhere) keeps OpenCV's own defaults (PNG level 1 + RLE, JPEG quality 95, lossless WebP)
+#   'fast':     cheapest settings that still compress; meant for dumping large numbers of frames
+#   'balanced': moderate PNG compression, OpenCV's default JPEG quality
+#   'small':    smallest files, at a much higher encoding cost
+ENCODER_PROFILES = {
+    'fast': {
+        # OpenCV's default (level 1 with the RLE strategy) beats any explicit level, which switches zlib to its default strategy
+        'png_compression': None,
+        'jpeg_quality': 90,
+        'jpeg_optimize': False,
+        'jpeg_progressive': False,
+        'webp_quality': 80,
+    },
+    'balanced': {
+        'png_compression': 4,
+        'jpeg_quality': 95,
+        'jpeg_optimize': False,
+        'jpeg_progressive': False,
+        'webp_quality': 90,
+    },
+    'small': {
+        'png_compression': 9,
+        'jpeg_quality': 85,
+        'jpeg_optimize': True,
+        'jpeg_progressive': True,
+        'webp_quality': 70,
+    },
+}
+
+_JPEG_EXTS = ('.jpg', '.jpeg', '.jpe')
+_PNG_EXTS = ('.png',)
+_WEBP_EXTS = ('.webp',)
+
+
+def _encoder_params(ext, profile=None, png_compression=None, jpeg_quality=None, jpeg_optimize=None, jpeg_progressive=None, webp_quality=None):
+    r"""
+        Returns the flat OpenCV ``(flag, value)`` parameter list for encoding to `ext` (e.g. '.jpg' or 'frame.jpg').
+        Explicit arguments override the values of `profile`. Arguments that don't apply to the format of `ext` are ignored
+    """
+    options = _check_encoder_options(profile, png_compression=png_compression, jpeg_quality=jpeg_quality, jpeg_optimize=jpeg_optimize, jpeg_progressive=jpeg_progressive, webp_quality=webp_quality)
+
+    ext = os.path.splitext(ext)[1].lower() or ext.lower()
+    params = []
+
+    if ext in _PNG_EXTS:
+        if options['png_compression'] is not None:
+            params += [IMWRITE_PNG_COMPRESSION, options['png_compression']]
+
+    elif ext in _JPEG_EXTS:
+        if options['jpeg_quality'] is not None:
+            params += [IMWRITE_JPEG_QUALITY, options['jpeg_quality']]
+        if options['jpeg_optimize'] is not None:
+            params += [IMWRITE_JPEG_OPTIMIZE, int(options['jpeg_optimize'])]
+        if options['jpeg_progressive'] is not None:
+            params += [IMWRITE_JPEG_PROGRESSIVE, int(options['jpeg_progressive'])]
+
+    elif ext in _WEBP_EXTS:
+        if options['webp_quality'] is not None:
+            params += [IMWRITE_WEBP_QUALITY, options['webp_quality']]
+
+    return params
+
+
+def _check_encoder_options(profile=None, **options):
+    r"""
+        Validates `profile` and the explicit encoder `options`, and returns the merged options (explicit values take precedence)
+    """
+    if profile is not None and profile not in ENCODER_PROFILES:
+        raise ValueError(f'`profile` must be one of {list(ENCODER_PROFILES)} (or None). Got "{profile}"')
+
+    merged = dict.fromkeys(ENCODER_PROFILES['fast'])
+    if profile is not None:
+        merged.update(ENCODER_PROFILES[profile])
+
+    for name, value in options.items():
+        if name not in merged:
+            raise TypeError(f'Unknown encoder option "{name}"')
+        if value is not None:
+            merged[name] = value
+
+    png_compression = merged['png_compression']
+    if png_compression is not None and (not isinstance(png_compression, int) or not 0 <= png_compression <= 9):
+        raise ValueError('`png_compression` must be an integer between 0 and 9')
+
+    for name in ('jpeg_quality', 'webp_quality'):
+        quality = merged[name]
+        if quality is not None and (not isinstance(quality, int) or not 1 <= quality <= 100):
+            raise ValueError(f'`{name}` must be an integer between 1 and 100')
+
+    return merged
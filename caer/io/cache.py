@@ -0,0 +1,188 @@
+#    _____           ______  _____
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+
+import os
+import threading
+import numpy as np
+from collections import OrderedDict
+
+from ..adorad import Tensor
+
+__all__ = [
+    'ImageCache',
+    'enable_image_cache',
+    'disable_image_cache',
+    'get_image_cache'
+]
+
+
+class ImageCache:
+    r"""
+        A thread-safe, byte-budgeted LRU cache of decoded images.
+
+        Entries are stored read-only, and every hit returns a new read-only ``caer.Tensor`` view of the cached pixels,
+        so callers cannot corrupt the cache. Call ``.copy()`` on the result if you need to modify it.
+        When adding an entry would exceed ``max_bytes``, the least recently used entries are evicted.
+        Images larger than ``max_bytes`` are never cached.
+
+    Args:
+        max_bytes (int): Maximum total size (in bytes) of the cached pixel data.
+
+    Attributes:
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups not found in the cache.
+        evictions (int): Number of entries evicted to stay within ``max_bytes``.
+        nbytes (int): Current total size of the cached pixel data.
+    """
+    def __init__(self, max_bytes):
+        if not isinstance(max_bytes, int) or max_bytes < 0:
+            raise ValueError('`max_bytes` must be a non-negative integer')
+
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # key --> (read-only ndarray, cspace)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def __len__(self):
+        return len(self._entries)
+
+
+    def get(self, key):
+        r"""
+            Returns a read-only Tensor for `key`, or None if `key` is not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        arr, cspace = entry
+        return Tensor(arr, cspace=cspace)
+
+
+    def put(self, key, tens) -> Tensor:
+        r"""
+            Caches the pixels of `tens` (a caer Tensor) under `key`, without copying them.
+
+        Returns:
+            A read-only Tensor view of the cached pixels. Use it in place of `tens`, which must not be modified afterwards.
+        """
+        arr = np.asarray(tens)
+        arr.flags.writeable = False
+
+        nbytes = arr.nbytes
+        if nbytes > self.max_bytes:
+            return Tensor(arr, cspace=tens.cspace)
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[0].nbytes
+
+            while self._entries and self.nbytes + nbytes > self.max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+                self.evictions += 1
+
+            self._entries[key] = (arr, tens.cspace)
+            self.nbytes += nbytes
+
+        return Tensor(arr, cspace=tens.cspace)
+
+
+    def clear(self):
+        r"""
+            Removes every entry. The hit/miss/eviction counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+
+    def info(self) -> dict:
+        r"""
+            Returns the cache counters as a dict with keys ``hits``, ``misses``, ``evictions``, ``entries``, ``nbytes`` and ``max_bytes``.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'nbytes': self.nbytes,
+                'max_bytes': self.max_bytes,
+            }
+
+
+_image_cache = None
+
+
+def enable_image_cache(max_bytes) -> ImageCache:
+    r"""
+        Enables the process-wide decoded-image cache used by ``caer.imread()`` for local files (and everything built on it,
+        like ``caer.imread_batch()`` and the ``caer.data`` loaders).
+
+        Entries are keyed by the file's path, modification time and size together with the decoding arguments
+        (``target_size``, ``rgb``/``gray``, ``interpolation``, ...), so a modified file is never served stale.
+        Cached images are returned as read-only Tensors.
+
+    Args:
+        max_bytes (int): Byte budget for the decoded pixel data. Least recently used images are evicted beyond it.
+
+    Returns:
+        The new ``ImageCache`` (replacing any previously enabled cache).
+
+    Examples::
+
+        >> cache = caer.io.enable_image_cache(2 * 1024**3) # 2 GiB
+        >> for epoch in range(10):
+        ..     batch, failed = caer.imread_batch(paths, target_size=(224,224))
+        >> cache.info()['hits']
+        4608
+
+    """
+    global _image_cache
+    _image_cache = ImageCache(max_bytes)
+    return _image_cache
+
+
+def disable_image_cache():
+    r"""
+        Disables (and drops) the process-wide decoded-image cache.
+    """
+    global _image_cache
+    _image_cache = None
+
+
+def get_image_cache():
+    r"""
+        Returns the process-wide ``ImageCache``, or None if it is disabled.
+    """
+    return _image_cache
+
+
+def _cache_key(image_path, *args):
+    r"""
+        Returns the cache key for the local file `image_path` decoded with `args`
+    """
+    stat = os.stat(image_path)
+    return (os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size) + args
@@ -0,0 +1,183 @@
+#    _____           ______  _____
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+
+import cv2 as cv
+from concurrent.futures import ThreadPoolExecutor
+
+from ._encode import _encoder_params, _check_encoder_options
+from ._decode import _decode_buffer, _decode_cspace, _finish_read
+from ..adorad import Tensor
+from ..color import to_bgr
+from .._internal import _check_target_size, _get_num_workers
+
+__all__ = [
+    'imdecode',
+    'imdecode_batch',
+    'imencode',
+    'imencode_batch'
+]
+
+
+def imdecode(buffer, rgb=True, gray=False, target_size=None, resize_factor=None, preserve_aspect_ratio=False, interpolation='bilinear', out=None) -> Tensor:
+    r"""
+        Decodes an encoded image (JPEG, PNG, WebP, ...) held in memory.
+
+        `buffer` may be any object exposing a contiguous buffer: ``bytes``, ``bytearray``, ``memoryview``, a ``mmap.mmap``
+        or a 1D ``uint8`` ndarray. It is handed to the decoder as-is, without intermediate copies.
+
+    .. note::
+        Slicing a ``mmap`` (``mm[start:stop]``) returns a copy as ``bytes``. To decode one image out of a larger mapped archive
+        without copying, slice a memoryview of it instead: ``memoryview(mm)[start:stop]``.
+
+    Args:
+        buffer (bytes, bytearray, memoryview, mmap): Encoded image.
+        rgb (bool): Boolean to keep RGB ordering. Default: True
+        gray (bool): Decode directly to a single-channel grayscale Tensor (overrides ``rgb``). Default: False
+        target_size (tuple): Target size. Must be a tuple of ``(width, height)`` integer.
+        resize_factor (float, tuple): Resizing Factor to employ.
+        preserve_aspect_ratio (bool): Prevent aspect ratio distortion (employs center crop).
+        interpolation (str): Interpolation to use for resizing. Defaults to `'bilinear'`.
+        out (Tensor, ndarray): Optional ``uint8`` output array to decode into. See ``caer.imread()``.
+
+    Returns:
+        Tensor with shape ``(height, width, channels)``, or ``(height, width)`` if ``gray=True``.
+
+    Examples::
+
+        >> with open('beverages.jpg', 'rb') as f:
+        ..     tens = caer.io.imdecode(f.read())
+        >> tens.shape
+        (427, 640, 3)
+
+    """
+    if target_size is not None:
+        _ = _check_target_size(target_size)
+
+    cspace = _decode_cspace(rgb, gray)
+    tens = _decode_buffer(buffer, cspace=cspace)
+
+    return _finish_read(tens, cspace, target_size=target_size, resize_factor=resize_factor, preserve_aspect_ratio=preserve_aspect_ratio, interpolation=interpolation, out=out)
+
+
+def imdecode_batch(buffers, rgb=True, gray=False, target_size=None, resize_factor=None, preserve_aspect_ratio=False, interpolation='bilinear', workers=None) -> list:
+    r"""
+        Decodes a batch of encoded images concurrently on a thread pool (OpenCV releases the GIL while decoding).
+
+    Args:
+        buffers (list): Encoded images (see ``caer.io.imdecode()`` for the supported buffer types).
+        rgb (bool): Boolean to keep RGB ordering. Default: True
+        gray (bool): Decode directly to grayscale (overrides ``rgb``). Default: False
+        target_size (tuple): Target size. Must be a tuple of ``(width, height)`` integer.
+        resize_factor (float, tuple): Resizing Factor to employ.
+        preserve_aspect_ratio (bool): Prevent aspect ratio distortion (employs center crop).
+        interpolation (str): Interpolation to use for resizing. Defaults to `'bilinear'`.
+        workers (int): Number of decoding threads. Defaults to the number of available CPUs.
+
+    Returns:
+        List of Tensors, in the same order as `buffers`. Entries are ``None`` where decoding failed.
+    """
+    workers = _get_num_workers(workers)
+
+    if target_size is not None:
+        _ = _check_target_size(target_size)
+
+    buffers = list(buffers)
+
+    def _load(buffer):
+        try:
+            return imdecode(buffer, rgb=rgb, gray=gray, target_size=target_size, resize_factor=resize_factor, preserve_aspect_ratio=preserve_aspect_ratio, interpolation=interpolation)
+        except Exception:
+            return None
+
+    if len(buffers) == 0:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(buffers))) as executor:
+        return list(executor.map(_load, buffers))
+
+
+def imencode(tens, ext='.png', params=None, profile=None, png_compression=None, jpeg_quality=None, jpeg_optimize=None, jpeg_progressive=None, webp_quality=None) -> bytes:
+    r"""
+        Encodes a Tensor into an in-memory image file.
+
+    Args:
+        tens (Tensor): caer Tensor to encode.
+        ext (str): File extension that selects the format, e.g. ``'.png'``, ``'.jpg'`` or ``'.webp'``. Default: ``'.png'``
+        params (list): Additional OpenCV encoder parameters as flat ``(flag, value)`` pairs, e.g. ``[cv.IMWRITE_PNG_STRATEGY, 3]``.
+        profile (str): Encoder profile - ``'fast'``, ``'balanced'`` or ``'small'``. See ``caer.imsave()``.
+        png_compression (int): zlib compression level for PNG (0-9).
+        jpeg_quality (int): JPEG quality (1-100).
+        jpeg_optimize (bool): Compute optimal Huffman tables for JPEG.
+        jpeg_progressive (bool): Write a progressive JPEG.
+        webp_quality (int): WebP quality (1-100).
+
+    Returns:
+        bytes
+
+    Examples::
+
+        >> tens = caer.data.beverages()
+        >> blob = caer.io.imencode(tens, '.jpg')
+        >> caer.io.imdecode(blob).shape
+        (427, 640, 3)
+
+    """
+    if not isinstance(tens, Tensor):
+        raise TypeError('`tens` must be a caer.Tensor')
+
+    _ = tens._nullprt() # raises a ValueError if we're dealing with a Foreign Tensor with illegal `.cspace` value
+
+    if not ext.startswith('.'):
+        ext = '.' + ext
+
+    # OpenCV encodes BGR (or single-channel) arrays
+    if tens.cspace not in ('bgr', 'gray'):
+        tens = to_bgr(tens)
+
+    encoder_params = _encoder_params(ext, profile=profile, png_compression=png_compression, jpeg_quality=jpeg_quality, jpeg_optimize=jpeg_optimize, jpeg_progressive=jpeg_progressive, webp_quality=webp_quality)
+    if params is not None:
+        encoder_params += list(params)
+
+    ok, encoded = cv.imencode(ext, tens, encoder_params)
+    if not ok:
+        raise ValueError(f'Could not encode the Tensor as "{ext}"')
+
+    return encoded.tobytes()
+
+
+def imencode_batch(tensors, ext='.png', params=None, profile=None, workers=None, **encoder_options) -> list:
+    r"""
+        Encodes a batch of Tensors concurrently on a thread pool (OpenCV releases the GIL while encoding).
+
+    Args:
+        tensors (list): caer Tensors to encode.
+        ext (str): File extension that selects the format. Default: ``'.png'``
+        params (list): Additional OpenCV encoder parameters (see ``caer.io.imencode()``).
+        profile (str): Encoder profile - ``'fast'``, ``'balanced'`` or ``'small'``. See ``caer.imsave()``.
+        workers (int): Number of encoding threads. Defaults to the number of available CPUs.
+        **encoder_options: Explicit encoder settings, as accepted by ``caer.io.imencode()``
+            (``png_compression``, ``jpeg_quality``, ``jpeg_optimize``, ``jpeg_progressive``, ``webp_quality``).
+
+    Returns:
+        List of bytes, in the same order as `tensors`. Raises on the first Tensor that fails to encode.
+    """
+    workers = _get_num_workers(workers)
+
+    # Validated once, rather than in every worker
+    _ = _check_encoder_options(profile, **encoder_options)
+
+    tensors = list(tensors)
+    if len(tensors) == 0:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(tensors))) as executor:
+        return list(executor.map(lambda tens: imencode(tens, ext=ext, params=params, profile=profile, **encoder_options), tensors))
@@ -0,0 +1,274 @@
+#    _____           ______  _____
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+
+import cv2 as cv
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+from ..path import exists
+from .._internal import _get_num_workers
+
+__all__ = [
+    'imsize',
+    'imsize_batch'
+]
+
+IMREAD_UNCHANGED = -1
+
+# Structured dtype returned by imsize_batch()
+IMSIZE_DTYPE = np.dtype([('width', np.int32), ('height', np.int32), ('channels', np.int16)])
+
+# PNG colour type --> channels
+_PNG_CHANNELS = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}
+
+
+def imsize(image_path) -> tuple:
+    r"""
+        Returns the dimensions of the image at `image_path` by parsing only its header (no pixels are decoded).
+
+        JPEG, PNG, BMP and WebP headers are parsed directly. Any other format falls back to a full decode.
+
+        For JPEGs, the EXIF orientation is applied (as ``caer.imread()`` does): the width and height of images stored rotated
+        by 90 degrees (orientations 5 to 8) are swapped.
+
+    Args:
+        image_path (str): Filepath of the image.
+
+    Returns:
+        Tuple of ``(width, height, channels)``. ``channels`` is the number of channels stored in the file
+        (e.g. 1 for grayscale, 3 for RGB/YCbCr or palette images, 4 with an alpha channel).
+        BMPs with a palette (8 bits per pixel or less) always report 3 channels, even if the palette is grayscale.
+
+    Examples::
+
+        >> caer.io.imsize('beverages.jpg')
+        (640, 427, 3)
+
+    """
+    if not exists(image_path):
+        raise FileNotFoundError('The image file was not found')
+
+    with open(image_path, 'rb') as f:
+        size = _probe(f)
+
+    if size is None:
+        # Unknown (or unparseable) format
+        tens = cv.imread(image_path, IMREAD_UNCHANGED)
+        if tens is None:
+            raise ValueError(f'Could not decode the image at "{image_path}"')
+        size = (tens.shape[1], tens.shape[0], 1 if tens.ndim == 2 else tens.shape[2])
+
+    return size
+
+
+def imsize_batch(image_paths, workers=None) -> np.ndarray:
+    r"""
+        Returns the dimensions of every image in `image_paths`, probing the headers concurrently on a thread pool.
+
+    Args:
+        image_paths (list): Filepaths of the images.
+        workers (int): Number of threads. Defaults to the number of available CPUs.
+
+    Returns:
+        Structured ndarray of shape ``(n,)`` with the fields ``width``, ``height`` and ``channels``.
+        All three fields are ``-1`` for images that could not be read.
+
+    Examples::
+
+        >> sizes = caer.io.imsize_batch(paths)
+        >> small = sizes['width'] < 64
+        >> aspect_ratios = sizes['width'] / sizes['height']
+
+    """
+    workers = _get_num_workers(workers)
+
+    image_paths = list(image_paths)
+    sizes = np.empty(len(image_paths), dtype=IMSIZE_DTYPE)
+
+    def _load(i):
+        try:
+            sizes[i] = imsize(image_paths[i])
+        except Exception:
+            sizes[i] = (-1, -1, -1)
+
+    if len(image_paths) > 0:
+        with ThreadPoolExecutor(max_workers=min(workers, len(image_paths))) as executor:
+            list(executor.map(_load, range(len(image_paths))))
+
+    return sizes
+
+
+def _probe(f):
+    r"""
+        Returns ``(width, height, channels)`` parsed from the header of the open (binary) file `f`, or None if the format isn't recognised
+    """
+    head = f.read(32)
+    f.seek(0)
+
+    if head[:2] == b'\xff\xd8':
+        return _jpeg_header(f)
+
+    if head[:8] == b'\x89PNG\r\n\x1a\n':
+        return _png_header(head)
+
+    if head[:2] == b'BM':
+        return _bmp_header(f)
+
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return _webp_header(f)
+
+    return None
+
+
+def _jpeg_header(f):
+    r"""
+        Scans for the SOF marker of a baseline/progressive JPEG, and the EXIF orientation (APP1) that precedes it
+    """
+    f.seek(2)
+    orientation = 1
+
+    while True:
+        marker = f.read(2)
+        if len(marker) != 2 or marker[0] != 0xFF:
+            return None
+
+        # Padding bytes
+        while marker[1] == 0xFF:
+            marker = marker[1:] + f.read(1)
+
+        code = marker[1]
+        # Standalone markers carry no length field
+        if code == 0x01 or 0xD0 <= code <= 0xD7:
+            continue
+
+        segment = f.read(2)
+        if len(segment) != 2:
+            return None
+        length = int.from_bytes(segment, 'big')
+
+        # SOF0-SOF15, excluding DHT (C4), JPG (C8) and DAC (CC)
+        if 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+            header = f.read(6)
+            if len(header) != 6:
+                return None
+            height = int.from_bytes(header[1:3], 'big')
+            width = int.from_bytes(header[3:5], 'big')
+
+            # Orientations 5-8 transpose the image
+            if 5 <= orientation <= 8:
+                width, height = height, width
+            return width, height, header[5]
+
+        if code == 0xE1:
+            orientation = _exif_orientation(f.read(length - 2), orientation)
+            continue
+
+        f.seek(length - 2, 1)
+
+
+def _exif_orientation(data, default=1):
+    r"""
+        Returns the Orientation tag (0x0112) of IFD0 in the APP1 payload `data`, or `default` if `data` isn't EXIF or has no such tag
+    """
+    if data[:6] != b'Exif\0\0':
+        return default
+
+    tiff = data[6:]
+    byteorder = {b'II': 'little', b'MM': 'big'}.get(tiff[:2])
+    if byteorder is None:
+        return default
+
+    ifd = int.from_bytes(tiff[4:8], byteorder)
+    count = int.from_bytes(tiff[ifd:ifd + 2], byteorder)
+
+    # 12-byte entries: tag, type, count, then the value (a SHORT, left-justified)
+    for i in range(count):
+        entry = tiff[ifd + 2 + 12 * i:ifd + 14 + 12 * i]
+        if len(entry) != 12:
+            break
+        if int.from_bytes(entry[0:2], byteorder) == 0x0112:
+            return int.from_bytes(entry[8:10], byteorder)
+
+    return default
+
+
+def _png_header(head):
+    r"""
+        The IHDR chunk always comes first
+    """
+    if head[12:16] != b'IHDR':
+        return None
+
+    width = int.from_bytes(head[16:20], 'big')
+    height = int.from_bytes(head[20:24], 'big')
+    channels = _PNG_CHANNELS.get(head[25])
+    if channels is None:
+        return None
+
+    return width, height, channels
+
+
+def _bmp_header(f):
+    f.seek(14)
+    dib = f.read(16)
+    if len(dib) != 16:
+        return None
+
+    dib_size = int.from_bytes(dib[0:4], 'little')
+    if dib_size == 12:
+        # BITMAPCOREHEADER
+        width = int.from_bytes(dib[4:6], 'little')
+        height = int.from_bytes(dib[6:8], 'little')
+        bit_count = int.from_bytes(dib[10:12], 'little')
+    else:
+        width = int.from_bytes(dib[4:8], 'little', signed=True)
+        # Negative heights denote top-down bitmaps
+        height = abs(int.from_bytes(dib[8:12], 'little', signed=True))
+        bit_count = int.from_bytes(dib[14:16], 'little')
+
+    return width, height, 4 if bit_count == 32 else 3
+
+
+def _webp_header(f):
+    f.seek(12)
+    chunk = f.read(18)
+    if len(chunk) < 18:
+        return None
+
+    fourcc, data = chunk[:4], chunk[8:]
+
+    if fourcc == b'VP8X':
+        # Extended format: flags, 3 reserved bytes, then 24-bit (width - 1) and (height - 1)
+        alpha = bool(data[0] & 0x10)
+        width = int.from_bytes(data[4:7], 'little') + 1
+        height = int.from_bytes(data[7:10], 'little') + 1
+        return width, height, 4 if alpha else 3
+
+    if fourcc == b'VP8 ':
+        # Lossy: 3-byte frame tag, 3-byte start code, then 14-bit width and height
+        if data[3:6] != b'\x9d\x01\x2a':
+            return None
+        width = int.from_bytes(data[6:8], 'little') & 0x3FFF
+        height = int.from_bytes(data[8:10], 'little') & 0x3FFF
+        return width, height, 3
+
+    if fourcc == b'VP8L':
+        # Lossless: signature byte, then 14-bit (width - 1), 14-bit (height - 1) and the alpha hint
+        if data[0] != 0x2F:
+            return None
+        bits = int.from_bytes(data[1:5], 'little')
+        width = (bits & 0x3FFF) + 1
+        height = ((bits >> 14) & 0x3FFF) + 1
+        alpha = bool((bits >> 28) & 1)
+        return width, height, 4 if alpha else 3
+
+    return None
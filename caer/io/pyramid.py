@@ -0,0 +1,207 @@
+#    _____           ______  _____
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+
+import threading
+import cv2 as cv
+import numpy as np
+
+from .resize import _INTERPOLATION_METHODS
+from ..adorad import Tensor, to_tensor
+from .._internal import _check_target_size
+from ..globals import INTER_AREA
+
+__all__ = [
+    'ImagePyramid'
+]
+
+
+class ImagePyramid:
+    r"""
+        A lazily built image pyramid: level 0 is the source image, and every following level is ``scale_factor`` times smaller
+        than the one before it.
+
+        Levels are only computed when they are first requested (each from the level above it, never from full resolution),
+        and are kept for later requests. ``resize()`` serves any target size from the smallest level that is still at least as
+        large as the target, so multi-scale pipelines pay for the full-resolution downsample only once.
+
+    Args:
+        tens (Tensor, ndarray): Source image of shape ``(height, width)`` or ``(height, width, channels)``. It is not copied.
+        levels (int): Number of levels (including the source). Defaults to as many as fit above ``min_size``.
+        scale_factor (int, float): Downscaling factor between consecutive levels. Must be > 1. Default: 2
+        method (str): ``'area'`` (area interpolation, any ``scale_factor``) or ``'gaussian'``
+            (Gaussian blur + decimation via ``cv.pyrDown``, ``scale_factor=2`` only). Default: ``'area'``
+        min_size (int): Smallest allowed width/height of a level when ``levels`` is not given. Default: 8
+
+    Attributes:
+        sizes (list): ``(width, height)`` of every level.
+
+    Examples::
+
+        >> pyramid = caer.io.ImagePyramid(tens)
+        >> pyramid.sizes[:3]
+        [(640, 427), (320, 214), (160, 107)]
+
+        >> small = pyramid.resize((100,60)) # Served from the (160, 107) level
+        >> pyramid.nbytes
+        256800
+
+        >> for level, tens in enumerate(pyramid): # Detection-style scanning, coarse levels are built on demand
+        ..     detect(tens)
+
+    """
+    def __init__(self, tens, levels=None, scale_factor=2, method='area', min_size=8):
+        if not isinstance(tens, np.ndarray) or tens.ndim not in (2, 3):
+            raise ValueError('`tens` must be an image of shape (height, width) or (height, width, channels)')
+
+        if not isinstance(scale_factor, (int, float)) or scale_factor <= 1:
+            raise ValueError('`scale_factor` must be a number > 1')
+
+        if method not in ('area', 'gaussian'):
+            raise ValueError('`method` must be either "area" or "gaussian"')
+
+        if method == 'gaussian' and scale_factor != 2:
+            raise ValueError('The "gaussian" method only supports `scale_factor=2`')
+
+        if levels is not None and (not isinstance(levels, int) or levels < 1):
+            raise ValueError('`levels` must be a positive integer')
+
+        self.scale_factor = scale_factor
+        self.method = method
+        self.cspace = getattr(tens, 'cspace', None)
+
+        height, width = tens.shape[:2]
+        self.sizes = [(width, height)]
+
+        while levels is None or len(self.sizes) < levels:
+            w, h = self.sizes[-1]
+            if method == 'gaussian':
+                # cv.pyrDown rounds up
+                w, h = (w + 1) // 2, (h + 1) // 2
+            else:
+                w, h = max(1, round(w / scale_factor)), max(1, round(h / scale_factor))
+
+            if (w, h) == self.sizes[-1] or (levels is None and min(w, h) < min_size):
+                break
+            self.sizes.append((w, h))
+
+        if levels is not None and len(self.sizes) < levels:
+            raise ValueError(f'The image is too small for {levels} levels (at most {len(self.sizes)})')
+
+        # Built levels (None = not built yet). Level 0 is the source itself
+        self._levels = [np.asarray(tens)] + [None] * (len(self.sizes) - 1)
+        self._lock = threading.Lock()
+
+
+    def __repr__(self):
+        return f'ImagePyramid(levels={len(self)}, built={self.built}, nbytes={self.nbytes})'
+
+
+    def __len__(self):
+        return len(self.sizes)
+
+
+    def __getitem__(self, level) -> Tensor:
+        if not isinstance(level, int):
+            raise TypeError('Pyramid levels must be indexed with an integer')
+
+        if level < 0:
+            level += len(self)
+        if not 0 <= level < len(self):
+            raise IndexError(f'Pyramid level out of range (the pyramid has {len(self)} levels)')
+
+        return to_tensor(self._build(level), cspace=self.cspace, override_checks=True)
+
+
+    def __iter__(self):
+        # Finest to coarsest. Each level is built just before it is yielded
+        for level in range(len(self)):
+            yield self[level]
+
+
+    @property
+    def built(self) -> int:
+        r"""
+            Number of levels built so far (including the source).
+        """
+        return sum(level is not None for level in self._levels)
+
+
+    @property
+    def nbytes(self) -> int:
+        r"""
+            Memory (in bytes) held by the levels built so far. The source (level 0) is not counted, as it is not copied.
+        """
+        return sum(level.nbytes for level in self._levels[1:] if level is not None)
+
+
+    def level_for(self, target_size) -> int:
+        r"""
+            Returns the index of the smallest level whose width and height are both >= `target_size` ``(width, height)``.
+            Level 0 is returned if even the source is smaller than `target_size`.
+        """
+        _ = _check_target_size(target_size)
+        target_w, target_h = target_size[:2]
+
+        best = 0
+        for level, (w, h) in enumerate(self.sizes):
+            if w < target_w or h < target_h:
+                break
+            best = level
+        return best
+
+
+    def resize(self, target_size, interpolation='area') -> Tensor:
+        r"""
+            Resizes the image to `target_size` ``(width, height)``, starting from the nearest finer level (see ``level_for()``).
+
+        Args:
+            target_size (tuple): Target size. Must be a tuple of ``(width, height)`` integer.
+            interpolation (str): Interpolation to use for the final resize. Defaults to `'area'`.
+                Supports `'bilinear'`, `'bicubic'`, `'area'`, `'nearest'`.
+
+        Returns:
+            Tensor of shape ``(height, width, channels)``.
+        """
+        if str(interpolation) not in _INTERPOLATION_METHODS:
+            raise ValueError('Specify a valid interpolation type - area/nearest/bicubic/bilinear')
+
+        level = self.level_for(target_size)
+        tens = self._build(level)
+
+        if self.sizes[level] != tuple(target_size[:2]):
+            tens = cv.resize(tens, tuple(target_size[:2]), interpolation=_INTERPOLATION_METHODS[str(interpolation)])
+
+        return to_tensor(tens, cspace=self.cspace, override_checks=True)
+
+
+    def clear(self):
+        r"""
+            Drops every built level (except the source) to free memory. They are rebuilt on demand.
+        """
+        with self._lock:
+            self._levels[1:] = [None] * (len(self) - 1)
+
+
+    def _build(self, level):
+        # Returns the ndarray of `level`, building it (and any missing level above it) first
+        with self._lock:
+            first = level
+            while self._levels[first] is None:
+                first -= 1
+
+            for i in range(first + 1, level + 1):
+                if self.method == 'gaussian':
+                    self._levels[i] = cv.pyrDown(self._levels[i - 1], dstsize=self.sizes[i])
+                else:
+                    self._levels[i] = cv.resize(self._levels[i - 1], self.sizes[i], interpolation=INTER_AREA)
+
+            return self._levels[level]
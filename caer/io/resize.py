@@ -11,20 +11,33 @@
 
 
 import math 
+import functools
 import cv2 as cv
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
-from ..adorad import Tensor, to_tensor
-from .._internal import _check_target_size
+from ..adorad import Tensor, TensorBatch, to_tensor
+from .._internal import _check_target_size, _check_output, _get_num_workers
 from ..globals import (
     INTER_AREA, INTER_CUBIC, INTER_NEAREST, INTER_LINEAR
 )
 
 __all__ = [
-    'resize'
+    'resize',
+    'resize_batch',
+    'ResizePlan'
 ]
 
+# Built once at import time rather than on every call
+_INTERPOLATION_METHODS = {
+    'nearest': INTER_NEAREST, '0': INTER_NEAREST, 0: INTER_NEAREST, # 0
+    'bilinear': INTER_LINEAR, '1': INTER_LINEAR,  1: INTER_LINEAR,  # 1
+    'bicubic': INTER_CUBIC,   '2': INTER_CUBIC,   2: INTER_CUBIC,   # 2
+    'area': INTER_AREA,       '3': INTER_AREA,    3: INTER_AREA     # 3
+}
 
-def resize(tens, target_size=None, resize_factor=None, preserve_aspect_ratio=False, interpolation='bilinear'):
+
+def resize(tens, target_size=None, resize_factor=None, preserve_aspect_ratio=False, interpolation='bilinear', out=None, single_resample=False):
     r"""
         Resizes an image to a target_size without aspect ratio distortion.
         
@@ -55,10 +68,15 @@ def resize(tens, target_size=None, resize_factor=None, preserve_aspect_ratio=Fal
             preserve_aspect_ratio (bool): Prevent aspect ratio distortion (employs center crop).
             interpolation (str): Interpolation to use for resizing. Defaults to `'bilinear'`. 
                 Supports `'bilinear'`, `'bicubic'`, `'area'`, `'nearest'`.
+            out (Tensor, ndarray): Optional output array (e.g. a slot of a preallocated batch) to write the result into. 
+                Must be contiguous and have exactly the output shape and the dtype of ``tens``.
+            single_resample (bool): With ``preserve_aspect_ratio=True``, resample only the cropped region of the source, in one pass. 
+                See ``caer.smart_resize()``. Default: False
         
         
         Returns:
-            Tensor of shape ``(height, width, channels)``.
+            Tensor of shape ``(height, width, channels)``. If ``out`` is given, the Tensor is a view of ``out``.
+            If ``tens`` is a ``caer.TensorBatch``, every image is resized (see ``caer.resize_batch()``) and a ``TensorBatch`` is returned.
 
 
         Examples::
@@ -80,6 +98,17 @@ def resize(tens, target_size=None, resize_factor=None, preserve_aspect_ratio=Fal
             (200, 200, 3)
 
     """
+    if isinstance(tens, TensorBatch):
+        if resize_factor is not None:
+            if not isinstance(resize_factor, (int, float)):
+                raise ValueError('resize_factor must be an integer or float')
+
+            target_size = (int(resize_factor * tens.width()), int(resize_factor * tens.height()))
+            interpolation = 'bicubic' if resize_factor > 1 else interpolation
+            preserve_aspect_ratio = False
+
+        return resize_batch(tens, target_size=target_size, interpolation=interpolation, preserve_aspect_ratio=preserve_aspect_ratio, out=out, single_resample=single_resample)
+
     # Opencv uses the (h,w) format
     height, width = tens.shape[:2]
     interpolation = str(interpolation)
@@ -113,22 +142,19 @@ def resize(tens, target_size=None, resize_factor=None, preserve_aspect_ratio=Fal
             interpolation = 'bicubic'
 
         new_shape = (int(resize_factor * width), int(resize_factor * height))
-            
-    interpolation_methods = {
-        'nearest': INTER_NEAREST, '0': INTER_NEAREST, 0: INTER_NEAREST, # 0
-        'bilinear': INTER_LINEAR, '1': INTER_LINEAR,  1: INTER_LINEAR,  # 1
-        'bicubic': INTER_CUBIC,   '2': INTER_CUBIC,   2: INTER_CUBIC,   # 2
-        'area': INTER_AREA,       '3': INTER_AREA,    3: INTER_AREA     # 3
-    }
-
-    if interpolation not in interpolation_methods:
+
+    if interpolation not in _INTERPOLATION_METHODS:
         raise ValueError('Specify a valid interpolation type - area/nearest/bicubic/bilinear')
 
+    if out is not None:
+        width, height = new_shape[:2]
+        _ = _check_output(out, (height, width) + tens.shape[2:], tens.dtype, 'resize')
+
     if preserve_aspect_ratio:
-        im = _resize_with_ratio(tens, target_size=target_size, preserve_aspect_ratio=preserve_aspect_ratio, interpolation=interpolation_methods[interpolation])
+        im = _resize_with_ratio(tens, target_size=target_size, preserve_aspect_ratio=preserve_aspect_ratio, interpolation=_INTERPOLATION_METHODS[interpolation], out=out, single_resample=single_resample)
     else:
         width, height = new_shape[:2]
-        im = _cv2_resize(tens, (width, height), interpolation=interpolation_methods[interpolation])
+        im = _cv2_resize(tens, (width, height), interpolation=_INTERPOLATION_METHODS[interpolation], out=out)
     
     # For this function, the <cspace> attribute is not required.
     # So, we disable the mandatory check that the <cspace> attribute needs to be passed for 
@@ -136,7 +162,108 @@ def resize(tens, target_size=None, resize_factor=None, preserve_aspect_ratio=Fal
     return to_tensor(im, cspace=cspace, override_checks=True)
 
 
-def smart_resize(tens, target_size, interpolation='bilinear'):
+def resize_batch(tensors, target_size, interpolation='bilinear', preserve_aspect_ratio=False, out=None, workers=None, single_resample=False):
+    r"""
+        Resizes a batch of images to the same `target_size` on a thread pool, writing every image into its slot of a single output array.
+
+        `tensors` can be a ``(n, height, width, channels)`` stack or a list of differently sized images (ragged inputs), 
+        as long as they all have the same number of channels and dtype. The work is split into one contiguous chunk per worker, 
+        and OpenCV releases the GIL while resizing, so threads scale across cores.
+
+        Args:
+            tensors (Tensor, TensorBatch, list): Stack of shape ``(n, height, width, channels)`` or list of images of shape ``(height, width, channels)``.
+            target_size (tuple): Target size of every image. Must be a tuple of ``(width, height)`` integer.
+            interpolation (str): Interpolation to use for resizing. Defaults to `'bilinear'`. 
+                Supports `'bilinear'`, `'bicubic'`, `'area'`, `'nearest'`.
+            preserve_aspect_ratio (bool): Prevent aspect ratio distortion (employs center crop).
+            out (Tensor, ndarray): Optional output array of shape ``(n, target_height, target_width, channels)``
+                (``(n, channels, target_height, target_width)`` for an ``'nchw'`` TensorBatch). 
+                Must be contiguous and have the dtype of the inputs.
+            workers (int): Number of threads. Defaults to the number of available CPUs.
+            single_resample (bool): With ``preserve_aspect_ratio=True``, resample only the cropped region of every image. 
+                See ``caer.smart_resize()``. Default: False
+
+        Returns:
+            Tensor of shape ``(n, target_height, target_width, channels)``. If ``out`` is given, the Tensor is a view of ``out``.
+            A ``caer.TensorBatch`` (in the same layout) if ``tensors`` is one.
+
+        Examples::
+
+            >> stack.shape
+            (512, 427, 640, 3)
+            >> batch = caer.resize_batch(stack, target_size=(224,224), workers=8)
+            >> batch.shape
+            (512, 224, 224, 3)
+
+            >> batch = caer.resize_batch([tens_a, tens_b], target_size=(224,224), preserve_aspect_ratio=True) # Ragged inputs
+
+    """
+    _ = _check_target_size(target_size)
+    workers = _get_num_workers(workers)
+
+    if str(interpolation) not in _INTERPOLATION_METHODS:
+        raise ValueError('Specify a valid interpolation type - area/nearest/bicubic/bilinear')
+
+    if isinstance(tensors, TensorBatch) and tensors.layout == 'nchw':
+        # Resized channels-last, then returned in the layout of the batch
+        res = resize_batch(np.ascontiguousarray(tensors.to_layout('nhwc')), target_size=target_size, interpolation=interpolation, 
+                           preserve_aspect_ratio=preserve_aspect_ratio, workers=workers, single_resample=single_resample)
+        res = np.asarray(res).transpose(0, 3, 1, 2)
+
+        if out is None:
+            out = np.ascontiguousarray(res)
+        else:
+            _ = _check_output(out, res.shape, res.dtype, 'resize_batch')
+            np.copyto(out, res)
+
+        return TensorBatch(out, cspace=tensors.cspace, layout='nchw')
+
+    if isinstance(tensors, np.ndarray):
+        if tensors.ndim < 3:
+            raise ValueError('`tensors` must be a stack of shape (n, height, width[, channels]) or a list of images')
+        inner_shape, dtype = tensors.shape[3:], tensors.dtype
+    else:
+        tensors = list(tensors)
+        if len(tensors) == 0:
+            raise ValueError('`tensors` must contain at least one image')
+        inner_shape, dtype = tensors[0].shape[2:], tensors[0].dtype
+
+        for tens in tensors:
+            if tens.shape[2:] != inner_shape or tens.dtype != dtype:
+                raise ValueError('Every image in `tensors` must have the same number of channels and dtype')
+
+    # The cspace of the stack (or its first image) carries over to the output
+    first = tensors if isinstance(tensors, np.ndarray) else tensors[0]
+    cspace = getattr(first, 'cspace', None)
+
+    width, height = target_size[:2]
+    shape = (len(tensors), height, width) + inner_shape
+
+    if out is None:
+        out = np.empty(shape, dtype=dtype)
+    else:
+        _ = _check_output(out, shape, dtype, 'resize_batch')
+
+    def _resize_chunk(indices):
+        for i in indices:
+            _ = resize(tensors[i], target_size=target_size, preserve_aspect_ratio=preserve_aspect_ratio, interpolation=interpolation, out=out[i], single_resample=single_resample)
+
+    n = len(tensors)
+    if n > 0:
+        workers = min(workers, n)
+        chunks = [range(i * n // workers, (i + 1) * n // workers) for i in range(workers)]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume the iterator so that errors are raised here
+            list(executor.map(_resize_chunk, chunks))
+
+    if isinstance(tensors, TensorBatch):
+        return TensorBatch(out, cspace=cspace)
+
+    return to_tensor(out, cspace=cspace, override_checks=True)
+
+
+def smart_resize(tens, target_size, interpolation='bilinear', out=None, single_resample=False):
     r"""
         Resizes an image to a target_size without aspect ratio distortion.
         
@@ -157,6 +284,12 @@ def smart_resize(tens, target_size, interpolation='bilinear'):
             target_size (tuple): Target size. Must be a tuple of `(width, height)` integer.
             interpolation (str): Interpolation to use for resizing. Defaults to `'bilinear'`. 
                 Supports `'bilinear'`, `'bicubic'`, `'area'`, `'nearest'`.
+            out (Tensor, ndarray): Optional output array to write the result into (see ``caer.resize()``).
+            single_resample (bool): Map the centre crop back to source coordinates and resample only that region of the source, 
+                in one pass. The default path downsizes the whole image by an integer factor and then crops it, which resamples 
+                pixels that are cropped away and allocates the intermediate image. Both paths use area interpolation 
+                and produce the same framing. The outputs are identical when the source dimensions are multiples of the 
+                integer factor, and otherwise differ by sub-pixel sampling (see ``benchmarks/bench_smart_resize.py``). Default: False
         
         Returns:
             Tensor of shape `(height, width, channels)`
@@ -174,7 +307,11 @@ def smart_resize(tens, target_size, interpolation='bilinear'):
     # if not isinstance(tens, Tensor):
     #     raise ValueError('To use `caer.smart_resize()`, `tens` needs to be a caer.Tensor')
 
-    im = _resize_with_ratio(tens, target_size=target_size, preserve_aspect_ratio=True, interpolation=interpolation)
+    if out is not None:
+        _ = _check_target_size(target_size)
+        _ = _check_output(out, (target_size[1], target_size[0]) + tens.shape[2:], tens.dtype, 'smart_resize')
+
+    im = _resize_with_ratio(tens, target_size=target_size, preserve_aspect_ratio=True, interpolation=interpolation, out=out, single_resample=single_resample)
 
     # For this function, the <cspace> attribute is not required.
     # So, we disable the mandatory check that the <cspace> attribute needs to be passed for 
@@ -182,10 +319,152 @@ def smart_resize(tens, target_size, interpolation='bilinear'):
     return to_tensor(im, override_checks=True)
 
 
-def _cv2_resize(image, target_size, interpolation=None):
+class ResizePlan:
+    r"""
+        Precomputed resize geometry for a fixed source shape and target size.
+
+        Datasets and video streams usually have a constant source shape, so the scale factors and crop window of 
+        ``caer.resize()`` only need to be worked out once. A ``ResizePlan`` computes them at construction time and applies them 
+        with a minimal ``__call__`` (no argument parsing, no geometry, no intermediate copies beyond the resamples themselves).
+
+        ``caer.resize(preserve_aspect_ratio=True)`` and ``caer.smart_resize()`` already keep an internal cache of plans keyed by shape, 
+        so plain calls benefit automatically. Use a ``ResizePlan`` directly to also skip their argument checks.
+
+    Args:
+        src_shape (tuple): Shape of the source images, ``(height, width)`` or ``(height, width, channels)``.
+        target_size (tuple): Target size. Must be a tuple of ``(width, height)`` integer.
+        mode (str): ``'stretch'`` resizes to ``target_size`` ignoring the aspect ratio. 
+            ``'crop'`` preserves the aspect ratio by centre-cropping (same output as ``preserve_aspect_ratio=True``). Default: ``'stretch'``
+        interpolation (str): Interpolation to use for resizing. Defaults to `'bilinear'`. 
+            Supports `'bilinear'`, `'bicubic'`, `'area'`, `'nearest'`.
+        single_resample (bool): Only for ``mode='crop'``. Map the centre crop back to source coordinates and resample that region 
+            of the source once, instead of downsizing the whole image and then cropping. See ``caer.smart_resize()``. Default: False
+
+    Attributes:
+        out_shape (tuple): Shape of the resized images.
+
+    Examples::
+
+        >> plan = caer.io.ResizePlan(frame.shape, target_size=(224,224), mode='crop')
+        >> for frame in frames:
+        ..     resized = plan(frame)
+        >> resized.shape
+        (224, 224, 3)
+
+    """
+    def __init__(self, src_shape, target_size, mode='stretch', interpolation='bilinear', single_resample=False):
+        _ = _check_target_size(target_size)
+
+        if mode not in ('stretch', 'crop'):
+            raise ValueError('`mode` must be either "stretch" or "crop"')
+
+        if str(interpolation) not in _INTERPOLATION_METHODS:
+            raise ValueError('Specify a valid interpolation type - area/nearest/bicubic/bilinear')
+
+        self.src_shape = tuple(int(i) for i in src_shape)
+        self.target_size = (int(target_size[0]), int(target_size[1]))
+        self.mode = mode
+        self.interpolation = _INTERPOLATION_METHODS[str(interpolation)]
+        self.single_resample = bool(single_resample) and mode == 'crop'
+
+        oh, ow = self.src_shape[:2]
+        target_w, target_h = self.target_size
+        self.out_shape = (target_h, target_w) + self.src_shape[2:]
+
+        # Minimal (integer factor) INTER_AREA resize, then centre crop, then the final resample. Each step is skipped when it's a no-op
+        self._mid_size = None
+        self._crop = None
+        self._final_interpolation = self.interpolation
+
+        if mode == 'crop':
+            if target_h > oh or target_w > ow:
+                raise ValueError('To compute resizing keeping the aspect ratio, the target size dimensions must be <= actual image dimensions')
+
+            factor = _compute_minimal_resize((ow, oh), (target_w, target_h))
+            mid_w, mid_h = ow // factor, oh // factor
+
+            crop_w, crop_h = min(mid_w, target_w), min(mid_h, target_h)
+            y, x = (mid_h - crop_h) // 2, (mid_w - crop_w) // 2
+
+            if self.single_resample:
+                # The same crop window in source coordinates (INTER_AREA maps source [i * ow/mid_w, (i+1) * ow/mid_w) onto pixel i), 
+                # resampled straight to the target size. With factor = 1 this is just the crop
+                sx, sy = ow / mid_w, oh / mid_h
+                self._crop = (slice(round(y * sy), round((y + crop_h) * sy)), slice(round(x * sx), round((x + crop_w) * sx)))
+                self._final = factor > 1
+                self._final_interpolation = INTER_AREA
+
+            else:
+                if factor > 1:
+                    self._mid_size = (mid_w, mid_h)
+                if (crop_h, crop_w) != (mid_h, mid_w):
+                    self._crop = (slice(y, y + crop_h), slice(x, x + crop_w))
+
+                # Only resample a second time if the crop isn't already the target size
+                self._final = (crop_h, crop_w) != (target_h, target_w)
+
+        else:
+            self._final = (oh, ow) != (target_h, target_w)
+
+
+    def __repr__(self):
+        return f'ResizePlan(src_shape={self.src_shape}, target_size={self.target_size}, mode={self.mode!r}, single_resample={self.single_resample})'
+
+
+    def __call__(self, tens, out=None):
+        r"""
+            Resizes `tens` (of shape ``src_shape``) according to the plan.
+
+        Args:
+            tens (Tensor, ndarray): Source image.
+            out (Tensor, ndarray): Optional output array of shape ``out_shape`` and the dtype of ``tens`` to write the result into.
+
+        Returns:
+            Tensor of shape ``out_shape``.
+        """
+        if tens.shape != self.src_shape:
+            raise ValueError(f'caer.ResizePlan: `tens` has wrong shape (got {tens.shape}, while expecting {self.src_shape})')
+
+        if out is not None:
+            _ = _check_output(out, self.out_shape, tens.dtype, 'ResizePlan')
+
+        return to_tensor(self._apply(tens, out), cspace=getattr(tens, 'cspace', None), override_checks=True)
+
+
+    def _apply(self, tens, out=None):
+        # Returns an ndarray (a view of `out` if given). `tens` and `out` must already be validated
+        if self.mode == 'crop':
+            if self._mid_size is not None:
+                tens = cv.resize(tens, self._mid_size, interpolation=INTER_AREA)
+            if self._crop is not None:
+                tens = tens[self._crop]
+
+        if self._final:
+            if out is not None:
+                cv.resize(tens, self.target_size, dst=out, interpolation=self._final_interpolation)
+                return out
+            return cv.resize(tens, self.target_size, interpolation=self._final_interpolation)
+
+        if out is not None:
+            np.copyto(out, tens)
+            return out
+
+        return tens
+
+
+@functools.lru_cache(maxsize=256)
+def _get_plan(src_shape, target_size, mode, interpolation, single_resample=False):
+    r"""
+        Returns a (shared) ``ResizePlan``. Plans are immutable after construction, so they're safe to share across threads
+    """
+    return ResizePlan(src_shape, target_size, mode=mode, interpolation=interpolation, single_resample=single_resample)
+
+
+def _cv2_resize(image, target_size, interpolation=None, out=None):
     """
     ONLY TO BE USED INTERNALLY. NOT AVAILABLE FOR EXTERNAL USAGE. 
     Resizes the image ignoring the aspect ratio of the original image
+    If `out` is given (and already validated), the result is written into it
     """
     _ = _check_target_size(target_size)
 
@@ -196,10 +475,14 @@ def _cv2_resize(image, target_size, interpolation=None):
 
     dimensions = (width, height)
 
+    if out is not None:
+        cv.resize(image, dimensions, dst=out, interpolation=interpolation)
+        return out
+
     return cv.resize(image, dimensions, interpolation=interpolation)
 
 
-def _resize_with_ratio(tens, target_size, preserve_aspect_ratio=False, interpolation='bilinear'):
+def _resize_with_ratio(tens, target_size, preserve_aspect_ratio=False, interpolation='bilinear', out=None, single_resample=False):
     """
         Resizes an image using advanced algorithms
         :param target_size: Tuple of size 2 in the format (width,height)
@@ -210,38 +493,14 @@ def _resize_with_ratio(tens, target_size, preserve_aspect_ratio=False, interpola
     
     if not isinstance(preserve_aspect_ratio, bool):
         raise ValueError('preserve_aspect_ratio must be a boolean')
-    
-    interpolation_methods = {
-        'nearest': INTER_NEAREST, '0': INTER_NEAREST, # 0
-        'bilinear': INTER_LINEAR, '1': INTER_LINEAR,# 1
-        'bicubic': INTER_CUBIC, '2': INTER_CUBIC,# 2
-        'area': INTER_AREA, '3': INTER_AREA,# 3
-    }
-
-    if interpolation not in interpolation_methods:
-        raise ValueError('Specify a valid interpolation type - area/nearest/bicubic/bilinear')
-
-    oh, ow = tens.shape[:2]
-    target_w, target_h = target_size
 
-    if target_h > oh or target_w > ow:
-        raise ValueError('To compute resizing keeping the aspect ratio, the target size dimensions must be <= actual image dimensions')
-
-    # Computing minimal resize
-    # min_width, w_factor = _compute_minimal_resize(ow, target_w)
-    # min_height, h_factor = _compute_minimal_resize(oh, target_h)
-    minimal_resize_factor = _compute_minimal_resize((ow, oh), (target_w, target_h))
-
-    # Resizing minimally
-    tens = _cv2_resize(tens, (ow//minimal_resize_factor, oh//minimal_resize_factor))
-
-    # Computing centre crop (to avoid extra crop, we resize minimally first)
-    tens = _compute_centre_crop(tens, (target_w, target_h))
+    if interpolation not in _INTERPOLATION_METHODS:
+        raise ValueError('Specify a valid interpolation type - area/nearest/bicubic/bilinear')
 
-    if tens.shape[:2] != target_size[:2]:
-        tens = _cv2_resize(tens, (target_w, target_h), interpolation=interpolation_methods[interpolation])
+    # The geometry only depends on the shapes, so it is computed once per (source shape, target size) and reused
+    plan = _get_plan(tens.shape, tuple(target_size[:2]), 'crop', _INTERPOLATION_METHODS[interpolation], bool(single_resample))
     
-    return tens
+    return plan._apply(tens, out)
     
 
 def _compute_minimal_resize(org_size, target_dim):
@@ -264,7 +523,7 @@ def _compute_minimal_resize(org_size, target_dim):
     if len(org_size) != 2 or len(target_dim) != 2:
         raise ValueError('Size of tuple must be = 2')
 
-    oh, ow = org_size[:2]
+    ow, oh = org_size[:2]
     targ_w, targ_h = target_dim[:2]
 
     h_factor = math.floor(oh/targ_h)
@@ -274,24 +533,3 @@ def _compute_minimal_resize(org_size, target_dim):
         return h_factor 
     else:
         return w_factor
-
-
-def _compute_centre_crop(tens, target_size):
-    _ = _check_target_size(target_size)
-
-    # Getting org height and target
-    oh, ow = tens.shape[:2]
-    target_w, target_h = target_size
-
-    # The following line is actually the right way of accessing height and width of an opencv-specific image (height, width). However for some reason, while the code runs, this is flipped (it now becomes (width,height)). Testing needs to be done to catch this little bug
-    # oh, ow = tens.shape[:2]
-
-
-    if target_h > oh or target_w > ow:
-        raise ValueError('To compute centre crop, target size dimensions must be <= tens dimensions')
-
-    diff_h = (oh - target_h) // 2
-    diff_w = (ow - target_w ) // 2
-    
-    # tens[y:y+h, x:x+h]
-    return tens[diff_h:diff_h + target_h, diff_w:diff_w + target_w]
\ No newline at end of file
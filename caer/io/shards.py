@@ -0,0 +1,260 @@
+#    _____           ______  _____
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+
+import os
+import json
+import numpy as np
+
+from ..adorad import Tensor
+
+__all__ = [
+    'ShardWriter',
+    'ShardReader'
+]
+
+# Shard layout:
+#   [0, 64)                 preamble: magic, version, footer offset and footer length
+#   [64, 64 + n * item)     items, stored contiguously in C order
+#   [.., .. + 8 * n)        int64 labels (only if the shard has labels)
+#   [footer offset, EOF)    JSON footer: count, shape, dtype, cspace, classes and the region offsets
+_MAGIC = b'CAERSHRD'
+_VERSION = 1
+_PREAMBLE_SIZE = 64
+_LABEL_DTYPE = np.dtype('<i8')
+
+
+class ShardWriter:
+    r"""
+        Writes fixed-shape tensors (and optional integer labels) contiguously into a single shard file that ``ShardReader`` memory-maps.
+
+        Every item must have the same ``shape`` and ``dtype``. Items are streamed to disk as they are written, so a shard can be much
+        larger than RAM. The shard is only valid once ``close()`` has been called (or the ``with`` block has exited).
+        If the ``with`` block raises, the partial shard is deleted (see ``abort()``) instead of being finalized.
+
+    Args:
+        path (str): Filepath of the shard.
+        shape (tuple): Shape of every item, e.g. ``(height, width, channels)``.
+        dtype (str, numpy dtype): Data type of every item. Default: ``'uint8'``
+        cspace (str): Colorspace of the items (rgb/bgr/gray/hsv/hls/lab/yuv/luv). Default: None
+        classes (list): Optional list of class names, indexed by label.
+
+    Examples::
+
+        >> with caer.io.ShardWriter('train.shard', shape=(224,224,3), cspace='rgb', classes=classes) as writer:
+        ..     for tens, label in data:
+        ..         writer.write(tens, label)
+
+    """
+    def __init__(self, path, shape, dtype='uint8', cspace=None, classes=None):
+        self.path = path
+        self.shape = tuple(int(i) for i in shape)
+        self.dtype = np.dtype(dtype)
+        self.cspace = cspace
+        self.classes = None if classes is None else [str(c) for c in classes]
+        self.count = 0
+
+        self._labels = []
+        self._file = open(path, 'wb')
+        self._file.write(b'\0' * _PREAMBLE_SIZE)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+    def write(self, tens, label=None):
+        r"""
+            Appends one item (and its label) to the shard.
+
+        Args:
+            tens (Tensor, ndarray): Item of shape ``shape`` and type ``dtype``.
+            label (int): Label of the item. Either every item or no item may have a label.
+        """
+        if self._file is None:
+            raise ValueError('Cannot write to a closed ShardWriter')
+
+        if tens.shape != self.shape:
+            raise ValueError(f'caer.ShardWriter: item has wrong shape (got {tens.shape}, while expecting {self.shape})')
+
+        if tens.dtype != self.dtype:
+            raise ValueError(f'caer.ShardWriter: item has wrong type (got {tens.dtype}, while expecting {self.dtype})')
+
+        if self.count > 0 and (label is not None) != (len(self._labels) > 0):
+            raise ValueError('Either every item or no item in a shard may have a label')
+
+        if label is not None:
+            self._labels.append(int(label))
+
+        # Writing the buffer directly avoids an intermediate bytes copy
+        self._file.write(memoryview(np.ascontiguousarray(tens)).cast('B'))
+        self.count += 1
+
+
+    def write_batch(self, tensors, labels=None):
+        r"""
+            Appends every item of `tensors` (an ``(n, *shape)`` array or a list of items) and their `labels`.
+        """
+        if labels is None:
+            for tens in tensors:
+                self.write(tens)
+        else:
+            for tens, label in zip(tensors, labels):
+                self.write(tens, label)
+
+
+    def close(self):
+        r"""
+            Writes the labels and footer and closes the shard. Safe to call more than once.
+        """
+        if self._file is None:
+            return
+
+        f = self._file
+        data_offset = _PREAMBLE_SIZE
+        labels_offset = None
+
+        if len(self._labels) > 0:
+            labels_offset = f.tell()
+            f.write(memoryview(np.asarray(self._labels, dtype=_LABEL_DTYPE)).cast('B'))
+
+        footer = json.dumps({
+            'count': self.count,
+            'shape': list(self.shape),
+            'dtype': self.dtype.str,
+            'cspace': self.cspace,
+            'classes': self.classes,
+            'data_offset': data_offset,
+            'labels_offset': labels_offset,
+        }).encode('utf-8')
+
+        footer_offset = f.tell()
+        f.write(footer)
+
+        f.seek(0)
+        f.write(_MAGIC + _VERSION.to_bytes(4, 'little') + footer_offset.to_bytes(8, 'little') + len(footer).to_bytes(8, 'little'))
+        f.close()
+        self._file = None
+
+
+    def abort(self):
+        r"""
+            Closes the shard without finalizing it, and deletes the partial file. Safe to call more than once.
+        """
+        if self._file is None:
+            return
+
+        self._file.close()
+        self._file = None
+
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+class ShardReader:
+    r"""
+        Memory-maps a shard written by ``ShardWriter``.
+
+        Indexing with an integer or a slice returns a zero-copy ``caer.Tensor`` view into the file, so opening a shard is instant
+        regardless of its size, and processes reading the same shard share the OS page cache.
+        Views are read-only.
+
+    Args:
+        path (str): Filepath of the shard.
+
+    Attributes:
+        shape (tuple): Shape of every item.
+        dtype (numpy dtype): Data type of the items.
+        cspace (str): Colorspace of the items.
+        classes (list): Class names (or None).
+        labels (ndarray): Memory-mapped int64 labels of shape ``(n,)`` (or None).
+
+    Examples::
+
+        >> shard = caer.io.ShardReader('train.shard')
+        >> len(shard)
+        50000
+        >> shard[0].shape
+        (224, 224, 3)
+        >> shard[:32].shape # Zero-copy batch
+        (32, 224, 224, 3)
+
+    """
+    def __init__(self, path):
+        self.path = path
+
+        with open(path, 'rb') as f:
+            preamble = f.read(_PREAMBLE_SIZE)
+            if len(preamble) != _PREAMBLE_SIZE or preamble[:8] != _MAGIC:
+                raise ValueError(f'"{path}" is not a caer shard (or was not closed properly)')
+
+            version = int.from_bytes(preamble[8:12], 'little')
+            if version != _VERSION:
+                raise ValueError(f'Unsupported shard version {version}')
+
+            footer_offset = int.from_bytes(preamble[12:20], 'little')
+            footer_len = int.from_bytes(preamble[20:28], 'little')
+            f.seek(footer_offset)
+            footer = json.loads(f.read(footer_len).decode('utf-8'))
+
+        self.count = footer['count']
+        self.shape = tuple(footer['shape'])
+        self.dtype = np.dtype(footer['dtype'])
+        self.cspace = footer['cspace']
+        self.classes = footer['classes']
+
+        if self.count > 0:
+            self._data = np.memmap(path, dtype=self.dtype, mode='r', offset=footer['data_offset'], shape=(self.count,) + self.shape)
+        else:
+            self._data = np.empty((0,) + self.shape, dtype=self.dtype)
+
+        self.labels = None
+        if footer['labels_offset'] is not None:
+            self.labels = np.memmap(path, dtype=_LABEL_DTYPE, mode='r', offset=footer['labels_offset'], shape=(self.count,))
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def __len__(self):
+        return self.count
+
+
+    def __getitem__(self, index) -> Tensor:
+        # np.asarray() drops the memmap subclass without copying
+        return Tensor(np.asarray(self._data[index]), cspace=self.cspace)
+
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self[i]
+
+
+    def close(self):
+        r"""
+            Drops the reader's memory maps. Views handed out earlier keep their own map alive.
+        """
+        self._data = None
+        self.labels = None
@@ -0,0 +1,184 @@
+#    _____           ______  _____
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+
+import math
+import cv2 as cv
+import numpy as np
+
+from .io import _read_image
+from .resize import _INTERPOLATION_METHODS
+from ..adorad import to_tensor
+from .._internal import _check_target_size, _check_output
+from ..globals import INTER_AREA, INTER_CUBIC, INTER_NEAREST
+
+__all__ = [
+    'tiled_resize'
+]
+
+# Default budget for one source strip when `tile` is not given
+_STRIP_BYTES = 64 * 2**20
+
+# Coefficient of OpenCV's bicubic kernel
+_CUBIC_A = -0.75
+
+
+def tiled_resize(source, target_size, tile=None, interpolation='area', out_path=None, out=None):
+    r"""
+        Resizes an image that may be far larger than memory, one horizontal strip at a time.
+
+        Every strip of output rows is computed from just the source rows it depends on, including the halo each interpolation
+        kernel needs above and below it: one row for ``'bilinear'``, two for ``'bicubic'`` and the whole footprint of each output
+        row for ``'area'``. Peak memory is therefore about one source strip plus its resized copy, instead of several full-size
+        intermediates. With a memory-mapped `source` (e.g. a ``.npy`` file), only the rows of the current strip are paged in.
+
+        Each strip is resized horizontally with OpenCV, then vertically with the same kernel weights OpenCV uses.
+        The result matches ``caer.resize()`` of the whole image to within 1 intensity level (fixed-point rounding).
+
+    Args:
+        source (str, ndarray): Image of shape ``(height, width)`` or ``(height, width, channels)``: an ndarray or ``np.memmap``,
+            the path of a ``.npy`` file (memory-mapped), or the path of an image file. Compressed image files (JPEG, PNG, ...)
+            have to be decoded in full first, so store gigapixel images as ``.npy`` to keep memory bounded.
+        target_size (tuple): Target size. Must be a tuple of ``(width, height)`` integer.
+        tile (int): Number of output rows computed per strip. Defaults to as many as keep a source strip under 64 MiB.
+        interpolation (str): Interpolation to use. Defaults to `'area'` (best for large reductions).
+            Supports `'bilinear'`, `'bicubic'`, `'area'`, `'nearest'`.
+        out_path (str): If given, the output is written to a new memory-mapped ``.npy`` file at this path.
+        out (ndarray): Optional output array (e.g. an ``np.memmap``) of shape ``(target_height, target_width[, channels])``
+            and the dtype of `source`. Ignored if `out_path` is given.
+
+    Returns:
+        Tensor of shape ``(target_height, target_width[, channels])``. If `out_path` or `out` is given, the Tensor is backed by it.
+
+    Examples::
+
+        >> slide = np.load('slide.npy', mmap_mode='r')
+        >> slide.shape
+        (50000, 50000, 3)
+        >> thumb = caer.io.tiled_resize(slide, target_size=(2000,2000), out_path='thumb.npy')
+        >> thumb.shape
+        (2000, 2000, 3)
+
+    """
+    _ = _check_target_size(target_size)
+
+    if str(interpolation) not in _INTERPOLATION_METHODS:
+        raise ValueError('Specify a valid interpolation type - area/nearest/bicubic/bilinear')
+    interpolation = _INTERPOLATION_METHODS[str(interpolation)]
+
+    cspace = getattr(source, 'cspace', None)
+    if isinstance(source, str):
+        if source.lower().endswith('.npy'):
+            source = np.load(source, mmap_mode='r')
+        else:
+            source = _read_image(source, cspace='rgb')
+            cspace = 'rgb'
+
+    if not isinstance(source, np.ndarray) or source.ndim not in (2, 3):
+        raise ValueError('`source` must be an image of shape (height, width) or (height, width, channels)')
+
+    height, width = source.shape[:2]
+    target_w, target_h = int(target_size[0]), int(target_size[1])
+    shape = (target_h, target_w) + source.shape[2:]
+
+    if out_path is not None:
+        out = np.lib.format.open_memmap(out_path, mode='w+', dtype=source.dtype, shape=shape)
+    elif out is not None:
+        _ = _check_output(out, shape, source.dtype, 'tiled_resize')
+    else:
+        out = np.empty(shape, dtype=source.dtype)
+
+    if tile is None:
+        row_bytes = source.nbytes // max(height, 1)
+        tile = max(1, int(_STRIP_BYTES // max(row_bytes, 1) * target_h / max(height, 1)))
+
+    if not isinstance(tile, int) or tile < 1:
+        raise ValueError('`tile` must be a positive integer')
+
+    # Source rows (and their weights) contributing to every output row. The halo is implicit in `rows`
+    rows, weights = _vertical_taps(height, target_h, interpolation)
+
+    for y0 in range(0, target_h, tile):
+        y1 = min(y0 + tile, target_h)
+        first, last = int(rows[y0:y1].min()), int(rows[y0:y1].max()) + 1
+
+        # Horizontal pass on just the rows this strip needs. With an unchanged height, each row is resized independently.
+        # Bicubic overshoots, so its intermediate is kept in float (as OpenCV does internally) rather than saturated
+        strip = np.ascontiguousarray(source[first:last])
+        if interpolation == INTER_CUBIC:
+            strip = strip.astype(np.float32)
+        strip = cv.resize(strip, (target_w, last - first), interpolation=interpolation)
+
+        # Vertical pass
+        acc = np.zeros((y1 - y0,) + strip.shape[1:], dtype=np.float32)
+        bshape = (-1,) + (1,) * (strip.ndim - 1)
+        for k in range(rows.shape[1]):
+            acc += weights[y0:y1, k].reshape(bshape) * strip[rows[y0:y1, k] - first]
+
+        if np.issubdtype(out.dtype, np.integer):
+            info = np.iinfo(out.dtype)
+            np.rint(acc, out=acc)
+            np.clip(acc, info.min, info.max, out=acc)
+        out[y0:y1] = acc
+
+    if isinstance(out, np.memmap):
+        out.flush()
+
+    return to_tensor(out, cspace=cspace, override_checks=True)
+
+
+def _vertical_taps(src_len, dst_len, interpolation):
+    r"""
+        Returns ``(rows, weights)``, both of shape ``(dst_len, taps)``: output row `i` is ``sum(weights[i] * source[rows[i]])``.
+        Mirrors the coordinate mapping of ``cv.resize()`` for each interpolation
+    """
+    scale = src_len / dst_len
+    dst = np.arange(dst_len, dtype=np.float64)
+
+    if interpolation == INTER_NEAREST:
+        rows = np.minimum(np.floor(dst * scale), src_len - 1)[:, None]
+        return rows.astype(np.int64), np.ones((dst_len, 1), dtype=np.float32)
+
+    if interpolation == INTER_AREA and scale >= 1:
+        # Box filter: output row i averages source [i * scale, (i + 1) * scale), weighted by overlap
+        start, end = dst * scale, (dst + 1) * scale
+        taps = int(math.ceil(scale)) + 1
+        rows = np.floor(start)[:, None] + np.arange(taps)
+        overlap = np.minimum(end[:, None], rows + 1) - np.maximum(start[:, None], rows)
+        weights = np.clip(overlap, 0, None) / scale
+        return np.minimum(rows, src_len - 1).astype(np.int64), weights.astype(np.float32)
+
+    if interpolation == INTER_AREA:
+        # Enlarging: OpenCV interpolates linearly, but only across the boundary between two source pixels
+        base = np.floor(dst * scale)
+        frac = (dst + 1) - (base + 1) / scale
+        frac = np.where(frac <= 0, 0, frac - np.floor(frac))
+    else:
+        # Bilinear/bicubic: sample at the pixel-centre aligned source coordinate
+        coord = (dst + 0.5) * scale - 0.5
+        base = np.floor(coord)
+        frac = coord - base
+
+    if interpolation == INTER_CUBIC:
+        offsets = np.arange(-1, 3)
+        x = frac[:, None] + np.array([1, 0, -1, -2])
+        ax = np.abs(x)
+        A = _CUBIC_A
+        weights = np.where(ax <= 1, ((A + 2) * ax - (A + 3)) * ax * ax + 1, ((A * ax - 5 * A) * ax + 8 * A) * ax - 4 * A)
+    else:
+        # Like OpenCV, clamp at the borders instead of extrapolating
+        frac = np.where((base < 0) | (base >= src_len - 1), 0, frac)
+        base = np.clip(base, 0, src_len - 1)
+        offsets = np.arange(2)
+        weights = np.stack([1 - frac, frac], axis=1)
+
+    rows = np.clip(base[:, None] + offsets, 0, src_len - 1)
+    return rows.astype(np.int64), weights.astype(np.float32)
@@ -0,0 +1,345 @@
+#    _____           ______  _____
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+
+import os
+import hashlib
+import threading
+import http.client
+import urllib.error
+import urllib.request
+from urllib.parse import urlsplit, urljoin
+from concurrent.futures import ThreadPoolExecutor
+
+from ._decode import _decode_buffer, _decode_cspace, _finish_read
+from .._internal import _check_target_size
+from .._meta import version
+
+__all__ = [
+    'URLFetcher',
+    'imread_urls'
+]
+
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+# Many image hosts reject requests without a User-Agent (HTTP 403)
+_HEADERS = {'User-Agent': f'caer/{version}'}
+
+
+class URLFetcher:
+    r"""
+        Downloads images over HTTP(S) with keep-alive connection reuse, bounded concurrency and an optional content-addressed disk cache.
+
+        Connections are pooled per host and reused across requests (and threads), so fetching many images from the same server
+        only pays for connection setup once per pooled connection. At most ``max_connections`` requests are in flight at any time.
+
+        If ``cache_dir`` is given, every downloaded payload is stored once under the SHA-256 hash of its content
+        (identical images behind different URLs share one file), and each URL maps to the hash of the content it returned.
+        Subsequent fetches of a cached URL are served from disk without touching the network.
+
+        Proxies configured in the environment (``HTTP_PROXY``, ``HTTPS_PROXY``, ``NO_PROXY``) are honoured: requests that
+        must go through a proxy are made with ``urllib.request.urlopen()`` (without connection reuse), which also follows
+        redirects itself.
+
+    Args:
+        max_connections (int): Maximum number of concurrent requests (and pooled connections per host). Default: 8
+        cache_dir (str): Directory for the on-disk cache. Default: None (no caching)
+        timeout (int, float): Socket timeout in seconds. Default: 30
+        max_redirects (int): Maximum number of HTTP redirects to follow. Default: 5
+
+    Examples::
+
+        >> with caer.io.URLFetcher(max_connections=16, cache_dir='url_cache') as fetcher:
+        ..     tensors = fetcher.imread_urls(urls, target_size=(224,224))
+        >> tensors[0].shape
+        (224, 224, 3)
+
+    """
+    def __init__(self, max_connections=8, cache_dir=None, timeout=30, max_redirects=5):
+        if not isinstance(max_connections, int) or max_connections < 1:
+            raise ValueError('`max_connections` must be a positive integer')
+
+        if not isinstance(max_redirects, int) or max_redirects < 0:
+            raise ValueError('`max_redirects` must be a non-negative integer')
+
+        self.max_connections = max_connections
+        self.cache_dir = cache_dir
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+
+        # (scheme, host:port) --> list of idle connections
+        self._pools = {}
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_connections)
+
+        if cache_dir is not None:
+            os.makedirs(os.path.join(cache_dir, 'objects'), exist_ok=True)
+            os.makedirs(os.path.join(cache_dir, 'urls'), exist_ok=True)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def close(self):
+        r"""
+            Closes all pooled connections. The fetcher may still be used afterwards (new connections are opened as needed).
+        """
+        with self._lock:
+            pools, self._pools = self._pools, {}
+
+        for pool in pools.values():
+            for conn in pool:
+                conn.close()
+
+
+    def fetch(self, url) -> bytes:
+        r"""
+            Returns the raw (encoded) payload at `url`.
+
+        Args:
+            url (str): http:// or https:// URL.
+
+        Returns:
+            bytes
+        """
+        if self.cache_dir is not None:
+            data = self._cache_lookup(url)
+            if data is not None:
+                return data
+
+        with self._slots:
+            data = self._get(url, self.max_redirects)
+
+        if self.cache_dir is not None:
+            self._cache_store(url, data)
+
+        return data
+
+
+    def fetch_many(self, urls) -> list:
+        r"""
+            Fetches `urls` concurrently (at most ``max_connections`` at a time).
+
+        Args:
+            urls (list): http:// or https:// URLs.
+
+        Returns:
+            List of bytes, in the same order as `urls`. Raises on the first failed download.
+        """
+        urls = list(urls)
+        if len(urls) == 0:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(self.max_connections, len(urls))) as executor:
+            return list(executor.map(self.fetch, urls))
+
+
+    def imread_urls(self, urls, rgb=True, gray=False, target_size=None, resize_factor=None, preserve_aspect_ratio=False, interpolation='bilinear') -> list:
+        r"""
+            Fetches and decodes `urls` concurrently. Decoding runs on the same threads as the downloads.
+
+        Args:
+            urls (list): http:// or https:// URLs.
+            rgb (bool): Boolean to keep RGB ordering. Default: True
+            gray (bool): Decode directly to grayscale (overrides ``rgb``). Default: False
+            target_size (tuple): Target size. Must be a tuple of ``(width, height)`` integer.
+            resize_factor (float, tuple): Resizing Factor to employ.
+            preserve_aspect_ratio (bool): Prevent aspect ratio distortion (employs center crop).
+            interpolation (str): Interpolation to use for resizing. Defaults to `'bilinear'`.
+
+        Returns:
+            List of Tensors, in the same order as `urls`. Entries are ``None`` where the download or decode failed.
+        """
+        if target_size is not None:
+            _ = _check_target_size(target_size)
+
+        urls = list(urls)
+        cspace = _decode_cspace(rgb, gray)
+
+        def _load(url):
+            try:
+                tens = _decode_buffer(self.fetch(url), cspace=cspace, source=url)
+                return _finish_read(tens, cspace, target_size=target_size, resize_factor=resize_factor, preserve_aspect_ratio=preserve_aspect_ratio, interpolation=interpolation)
+            except Exception:
+                return None
+
+        if len(urls) == 0:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(self.max_connections, len(urls))) as executor:
+            return list(executor.map(_load, urls))
+
+
+    def _get(self, url, redirects_left):
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError(f'Only http:// and https:// URLs are supported. Got "{url}"')
+
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        if parts.scheme in urllib.request.getproxies() and not urllib.request.proxy_bypass(parts.hostname or ''):
+            return self._urlopen(url)
+
+        key = (parts.scheme, parts.netloc)
+        status, location, data = self._request(key, path)
+
+        if status in _REDIRECT_CODES and location is not None:
+            if redirects_left <= 0:
+                raise ValueError(f'Too many redirects while fetching "{url}"')
+            return self._get(urljoin(url, location), redirects_left - 1)
+
+        if status != 200:
+            raise ValueError(f'Could not fetch "{url}" (HTTP {status})')
+
+        return data
+
+
+    def _urlopen(self, url):
+        # Goes through the proxy configured for the scheme of `url`
+        request = urllib.request.Request(url, headers=_HEADERS)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return response.read()
+        except urllib.error.HTTPError as e:
+            raise ValueError(f'Could not fetch "{url}" (HTTP {e.code})') from e
+
+
+    def _request(self, key, path):
+        # A pooled connection may have been closed by the server since its last use. In that case, retry once on a fresh connection
+        for attempt in range(2):
+            conn, reused = self._acquire(key, fresh=(attempt > 0))
+            try:
+                conn.request('GET', path, headers={'Connection': 'keep-alive', **_HEADERS})
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(key, conn)
+
+            return response.status, response.getheader('Location'), data
+
+
+    def _acquire(self, key, fresh=False):
+        if not fresh:
+            with self._lock:
+                pool = self._pools.get(key)
+                if pool:
+                    return pool.pop(), True
+
+        scheme, netloc = key
+        if scheme == 'https':
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout), False
+        return http.client.HTTPConnection(netloc, timeout=self.timeout), False
+
+
+    def _release(self, key, conn):
+        with self._lock:
+            pool = self._pools.setdefault(key, [])
+            if len(pool) < self.max_connections:
+                pool.append(conn)
+                return
+
+        conn.close()
+
+
+    def _cache_blob_path(self, digest):
+        return os.path.join(self.cache_dir, 'objects', digest[:2], digest)
+
+
+    def _cache_lookup(self, url):
+        index = os.path.join(self.cache_dir, 'urls', hashlib.sha256(url.encode('utf-8')).hexdigest())
+        try:
+            with open(index, 'r') as f:
+                digest = f.read().strip()
+            with open(self._cache_blob_path(digest), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+
+    def _cache_store(self, url, data):
+        digest = hashlib.sha256(data).hexdigest()
+        blob = self._cache_blob_path(digest)
+
+        if not os.path.exists(blob):
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            _atomic_write(blob, data)
+
+        index = os.path.join(self.cache_dir, 'urls', hashlib.sha256(url.encode('utf-8')).hexdigest())
+        _atomic_write(index, digest.encode('ascii'))
+
+
+def _atomic_write(path, data):
+    # Write to a temporary file first so that concurrent readers never see a partially written file
+    tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+_default_fetcher = None
+_default_fetcher_lock = threading.Lock()
+
+
+def _get_default_fetcher():
+    r"""
+        Returns the process-wide ``URLFetcher`` used by ``caer.imread()`` for URLs (no disk cache)
+    """
+    global _default_fetcher
+
+    with _default_fetcher_lock:
+        if _default_fetcher is None:
+            _default_fetcher = URLFetcher()
+        return _default_fetcher
+
+
+def imread_urls(urls, rgb=True, gray=False, target_size=None, resize_factor=None, preserve_aspect_ratio=False, interpolation='bilinear', fetcher=None) -> list:
+    r"""
+        Fetches and decodes a batch of image URLs concurrently, reusing connections.
+
+    Args:
+        urls (list): http:// or https:// URLs.
+        rgb (bool): Boolean to keep RGB ordering. Default: True
+        gray (bool): Decode directly to grayscale (overrides ``rgb``). Default: False
+        target_size (tuple): Target size. Must be a tuple of ``(width, height)`` integer.
+        resize_factor (float, tuple): Resizing Factor to employ.
+        preserve_aspect_ratio (bool): Prevent aspect ratio distortion (employs center crop).
+        interpolation (str): Interpolation to use for resizing. Defaults to `'bilinear'`.
+        fetcher (URLFetcher): Fetcher to use (e.g. one with a disk cache). Defaults to a shared fetcher without a cache.
+
+    Returns:
+        List of Tensors, in the same order as `urls`. Entries are ``None`` where the download or decode failed.
+
+    Examples::
+
+        >> tensors = caer.io.imread_urls(urls, target_size=(224,224))
+        >> len(tensors) == len(urls)
+        True
+
+    """
+    if fetcher is None:
+        fetcher = _get_default_fetcher()
+
+    return fetcher.imread_urls(urls, rgb=rgb, gray=gray, target_size=target_size, resize_factor=resize_factor, preserve_aspect_ratio=preserve_aspect_ratio, interpolation=interpolation)
@@ -0,0 +1,150 @@
+#    _____           ______  _____
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .io import imsave
+from ._encode import _check_encoder_options
+from .._internal import _get_num_workers
+
+__all__ = [
+    'AsyncImageWriter'
+]
+
+
+class AsyncImageWriter:
+    r"""
+        Encodes and writes images on a pool of worker threads, so that the producer (e.g. a video decoding loop) never waits on encoding.
+
+        ``write()`` queues a ``(path, tens)`` pair and returns immediately, unless ``max_pending`` writes are already queued or in progress.
+        In that case it blocks until a worker frees up a slot (back-pressure), which keeps memory bounded if the producer outpaces the encoders.
+
+        A failed write does not stop the writer. Instead, the ``(path, exception)`` pair is appended to ``errors``.
+
+    .. warning::
+        The writer keeps a reference to ``tens`` until it has been written. Do not modify ``tens`` in-place after passing it to ``write()``.
+
+    Args:
+        workers (int): Number of encoder threads. Defaults to the number of available CPUs.
+        max_pending (int): Maximum number of queued + in-progress writes before ``write()`` blocks. Defaults to ``2 * workers``.
+        profile (str): Encoder profile - ``'fast'``, ``'balanced'`` or ``'small'``. See ``caer.imsave()``. Default: None (OpenCV defaults)
+        **encoder_options: Explicit encoder settings passed on to ``caer.imsave()`` 
+            (``png_compression``, ``jpeg_quality``, ``jpeg_optimize``, ``jpeg_progressive``, ``webp_quality``).
+
+    Examples::
+
+        >> with caer.io.AsyncImageWriter(workers=4, profile='fast') as writer:
+        ..     for i, tens in enumerate(frames):
+        ..         writer.write(f'frames/{i}.jpg', tens)
+        >> writer.errors
+        []
+
+    """
+    def __init__(self, workers=None, max_pending=None, profile=None, **encoder_options):
+        self.workers = _get_num_workers(workers)
+
+        # Fail here rather than on every write
+        _ = _check_encoder_options(profile, **encoder_options)
+        self.profile = profile
+        self.encoder_options = encoder_options
+
+        if max_pending is None:
+            max_pending = 2 * self.workers
+
+        if not isinstance(max_pending, int) or max_pending < 1:
+            raise ValueError('`max_pending` must be a positive integer')
+
+        self.max_pending = max_pending
+        self.errors = []
+
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending = 0
+        self._idle = threading.Condition()
+        self._closed = False
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def write(self, path, tens):
+        r"""
+            Queues `tens` to be written to `path`. Blocks while ``max_pending`` writes are outstanding.
+
+        Args:
+            path (str): Filepath to save the image to.
+            tens (Tensor): caer Tensor to save.
+        """
+        if self._closed:
+            raise ValueError('Cannot write to a closed AsyncImageWriter')
+
+        self._slots.acquire()
+        with self._idle:
+            self._pending += 1
+
+        try:
+            self._executor.submit(self._write, path, tens)
+        except Exception:
+            self._done()
+            raise
+
+
+    def flush(self):
+        r"""
+            Blocks until every queued write has finished.
+
+        Returns:
+            List of ``(path, exception)`` pairs for the writes that failed so far (same as ``errors``).
+        """
+        with self._idle:
+            self._idle.wait_for(lambda: self._pending == 0)
+
+        return self.errors
+
+
+    def close(self):
+        r"""
+            Flushes all queued writes and shuts down the worker threads. Safe to call more than once.
+
+        Returns:
+            List of ``(path, exception)`` pairs for the writes that failed (same as ``errors``).
+        """
+        if not self._closed:
+            self._closed = True
+            self.flush()
+            self._executor.shutdown(wait=True)
+
+        return self.errors
+
+
+    def _write(self, path, tens):
+        try:
+            if not imsave(path, tens, profile=self.profile, **self.encoder_options):
+                raise ValueError(f'Could not write the image to "{path}"')
+        except Exception as e:
+            with self._idle:
+                self.errors.append((path, e))
+        finally:
+            self._done()
+
+
+    def _done(self):
+        with self._idle:
+            self._pending -= 1
+            self._idle.notify_all()
+        self._slots.release()
@@ -19,7 +19,6 @@ from .io import imread
 from .preprocessing import MeanProcess
 from ._internal import _check_target_size, _check_mean_sub_values
 from .path import listdir, minijoin, exists, list_images
-from .color import to_gray
 
 __all__ = [
     'preprocess_from_dir',
@@ -148,14 +147,11 @@ def preprocess_from_dir(DIR,
                     # image_path = minijoin(class_path, image)
 
                     # Returns the resized image (ignoring aspect ratio since it isn't relevant for Deep Computer Vision models)
-                    tens = imread(image_path, target_size=IMG_SIZE, rgb=True)
+                    # Grayscale images are decoded directly as grayscale
+                    tens = imread(image_path, target_size=IMG_SIZE, rgb=True, gray=(channels == 1))
 
                     if tens is None:
                         continue
-                    
-                    # Gray
-                    if channels == 1:
-                        tens = to_gray(tens)
 
                     # Normalizing
                     if normalize_train:
@@ -273,6 +269,7 @@ def reshape(x, IMG_SIZE, channels):
 def normalize(x, dtype='float32'):
     """
     Normalizes the data to mean 0 and standard deviation 1
+    Works on a single image, a stack or a caer.TensorBatch (in one vectorized operation, keeping its metadata)
     """
     # x/=255.0 raises a TypeError
     # x = x/255.0
@@ -16,7 +16,7 @@ from .._internal import _check_mean_sub_values
 from ..path import exists, list_images
 from ..io import imread 
 from ..core import mean, merge, split, npmean
-from ..adorad import Tensor
+from ..adorad import Tensor, TensorBatch
 from ..jit.annotations import Tuple, List
 
 import numpy as np 
@@ -49,7 +49,14 @@ class MeanProcess:
         """
             Mean Subtraction performed per channel
             Mean must be calculated ONLY on the training set
+            A TensorBatch is processed in a single broadcast subtraction
         """
+        if isinstance(image, TensorBatch):
+            # Same per-channel values as below: channel 0 (b) -= bMean, 1 (g) -= gMean, 2 (r) -= rMean
+            values = [self.bMean, self.gMean, self.rMean] if channels == 3 else [self.bgrMean]
+            shape = [1, 1, 1, 1]
+            shape[image._axis('c')] = len(values)
+            return image.astype('float32') - np.asarray(values, dtype='float32').reshape(shape)
 
         if channels == 3:
             b, g, r = split(image.astype('float32'))[:3]
@@ -135,15 +142,27 @@ def compute_mean(data, channels, per_channel_subtraction=True) -> Tuple:
 
     count = 0
 
-    for tens in data:
-        count += 1
+    if isinstance(data, TensorBatch):
+        # A single reduction over the batch. As every image has the same size, this equals the mean of the per-image means
+        axes = tuple(axis for axis in range(4) if axis != data._axis('c'))
+        channel_means = np.asarray(data).mean(axis=axes, dtype='float64')
+        count = 1
+
         if channels == 3:
-            b, g, r = mean(tens.astype('float32'))[:3]
-            rMean += r
-            gMean += g
-            bMean += b
+            bMean, gMean, rMean = channel_means[:3]
         if channels == 1:
-            bgrMean += npmean(tens.astype('float32'))
+            bgrMean = channel_means.mean()
+
+    else:
+        for tens in data:
+            count += 1
+            if channels == 3:
+                b, g, r = mean(tens.astype('float32'))[:3]
+                rMean += r
+                gMean += g
+                bMean += b
+            if channels == 1:
+                bgrMean += npmean(tens.astype('float32'))
 
     # Computing average mean
     if channels == 3:
@@ -175,6 +194,9 @@ def subtract_mean(data, channels, mean_sub_values) -> List[str]:
     if not isinstance(data, (list, Tensor)):
         raise ValueError('Dataset must be a list of size = number of images and shape = image shape')
 
+    if isinstance(data, TensorBatch):
+        return mean_process.mean_preprocess(data, channels)
+
     data = [mean_process.mean_preprocess(tens, channels) for tens in data]
     
     return data
\ No newline at end of file
@@ -14,7 +14,7 @@ import cv2 as cv
 import random 
 import collections
 
-from ..adorad import Tensor, to_tensor
+from ..adorad import Tensor, TensorBatch, to_tensor
 from .._internal import _check_target_size
 from ..globals import (
     INTER_AREA, INTER_CUBIC, INTER_NEAREST, INTER_LINEAR
@@ -70,12 +70,15 @@ def hflip(tens) -> Tensor:
     r"""
         Flip an image horizontally. 
     Args:
-        tens (Tensor): Image to be flipped.
+        tens (Tensor, TensorBatch): Image (or batch of images) to be flipped.
 
     Returns:
         Flipped image.
 
     """
+    if isinstance(tens, TensorBatch):
+        # One copy for the whole batch
+        return np.flip(tens, axis=tens._axis('w')).copy()
 
     tens = np.ascontiguousarray(tens[:, ::-1, ...])
     return to_tensor(tens, override_checks=True)
@@ -85,12 +88,15 @@ def vflip(tens) -> Tensor:
     r"""
         Flip an image vertically. 
     Args:
-        tens (Tensor): Image to be flipped.
+        tens (Tensor, TensorBatch): Image (or batch of images) to be flipped.
 
     Returns:
         Flipped image.
         
     """
+    if isinstance(tens, TensorBatch):
+        return np.flip(tens, axis=tens._axis('h')).copy()
+
     tens = np.ascontiguousarray(tens[::-1, ...])
     return to_tensor(tens, override_checks=True)
 
@@ -100,12 +106,15 @@ def hvflip(tens) -> Tensor:
         Flip an image both horizontally and vertically. 
 
     Args:
-        tens (Tensor): Image to be flipped.
+        tens (Tensor, TensorBatch): Image (or batch of images) to be flipped.
 
     Returns:
         Flipped image.
         
     """
+    if isinstance(tens, TensorBatch):
+        return np.flip(tens, axis=(tens._axis('h'), tens._axis('w'))).copy()
+
     return hflip(vflip(tens))
 
 
@@ -17,7 +17,8 @@ import cv2 as cv
 from .._internal import _check_target_size
 from ..path import list_videos, exists, mkdir
 from .constants import FRAME_COUNT, FPS
-from ..io import imsave, resize
+from ..io import resize, AsyncImageWriter
+from ..adorad import to_tensor
 
 __all__ = [
     'extract_frames'
@@ -31,7 +32,8 @@ def extract_frames(input_folder,
                    max_video_count=None, 
                    frames_per_sec=None, 
                    frame_interval=None,
-                   dest_filetype='jpg') -> int:
+                   dest_filetype='jpg',
+                   workers=None) -> int:
     r"""
         Extract frames from videos within a directory and save them as separate frames in an output directory.
 
@@ -44,6 +46,7 @@ def extract_frames(input_folder,
         frames_per_sec (int, float): Number of frames to process per second. 
         frame_interval (int, float): Interval between the frames to be processed.
         dest_filetype (str): Processed image filetype (png, jpg). Default: png
+        workers (int): Number of threads encoding and writing frames while the next frames are decoded. Defaults to the number of available CPUs.
 
     Returns:
         label_counter (after processing)
@@ -74,56 +77,75 @@ def extract_frames(input_folder,
     if not exists(output_folder):
         mkdir(output_folder)
 
+    # Frames are encoded and written on worker threads, overlapping with decoding
+    writer = AsyncImageWriter(workers=workers)
+
     # Begin Timer
     start = time.time()
 
-    for vid_filepath in video_list:
-        if vid_count < max_video_count:
-            capture = cv.VideoCapture(vid_filepath)
-            video_frame_counter = 0
-            vid_count += 1
-
-            # Find the number of frames and FPS
-            video_frame_count = int(capture.get(FRAME_COUNT)) - 1
-            video_fps = math.ceil(capture.get(FPS))
-            file = vid_filepath[vid_filepath.rindex('/')+1:]
+    try:
+        for vid_filepath in video_list:
+            if vid_count < max_video_count:
+                capture = cv.VideoCapture(vid_filepath)
+                video_frame_counter = 0
+                vid_count += 1
+
+                # Find the number of frames and FPS
+                video_frame_count = int(capture.get(FRAME_COUNT)) - 1
+                video_fps = math.ceil(capture.get(FPS))
+                file = vid_filepath[vid_filepath.rindex('/')+1:]
             
-            if frames_per_sec is not None:
-                if frame_interval is None:
-                    interval = _determine_interval(video_fps/frames_per_sec) # eg: 30//15
+                if frames_per_sec is not None:
+                    if frame_interval is None:
+                        interval = _determine_interval(video_fps/frames_per_sec) # eg: 30//15
             
-                else:
-                    interval = frame_interval
+                    else:
+                        interval = frame_interval
 
-            # if frames_per_sec and frame_interval are both None, we assume that each frame should be processed
-            else:
-                interval = 1
+                # if frames_per_sec and frame_interval are both None, we assume that each frame should be processed
+                else:
+                    interval = 1
             
-            # processed_frames = (video_frame_count//video_fps) * frames_per_sec
+                # processed_frames = (video_frame_count//video_fps) * frames_per_sec
 
-            print(f'{vid_count}. Reading \'{file}\'. Frame Count: {video_frame_count}. FPS: {video_fps}. Processed frames: {video_frame_count//interval}')
+                print(f'{vid_count}. Reading \'{file}\'. Frame Count: {video_frame_count}. FPS: {video_fps}. Processed frames: {video_frame_count//interval}')
             
-            # Start converting the video
-            while capture.isOpened():
-                _, frame = capture.read()
+                # Start converting the video
+                while capture.isOpened():
+                    ret, frame = capture.read()
+
+                    if not ret:
+                        capture.release()
+                        processed_videos += 1
+                        break
 
-                if target_size is not None:                    
-                    frame = resize(frame, target_size=target_size)
+                    if target_size is not None:                    
+                        frame = resize(frame, target_size=target_size)
                 
-                # Write the results back to output location as per specified frames per second
-                if video_frame_counter % interval == 0:
-                    imsave(f'{output_folder}/{file}_{label_counter}.{dest_filetype}', frame)
-                    video_frame_counter += 1
-                    label_counter += 1
-                    # print('Frame counter: ', video_frame_counter)
+                    # Write the results back to output location as per specified frames per second
+                    if video_frame_counter % interval == 0:
+                        # OpenCV decodes frames as BGR
+                        writer.write(f'{output_folder}/{file}_{label_counter}.{dest_filetype}', to_tensor(frame, cspace='bgr'))
+                        video_frame_counter += 1
+                        label_counter += 1
+                        # print('Frame counter: ', video_frame_counter)
                 
-                video_frame_counter += 1
+                    video_frame_counter += 1
+
+                    # If there are no more frames left
+                    if video_frame_counter > (video_frame_count-1):
+                        capture.release()
+                        processed_videos += 1
+                        break
+    finally:
+        # Wait for the remaining frames to be written (also if the loop failed, so that no encoder thread is leaked)
+        errors = writer.close()
+
+    # Only reached if the loop finished, so a failure in the loop is never masked by the write errors
+    if len(errors) > 0:
+        path, e = errors[0]
+        raise ValueError(f'{len(errors)} frame(s) could not be written. First failure: "{path}"') from e
 
-                # If there are no more frames left
-                if video_frame_counter > (video_frame_count-1):
-                    capture.release()
-                    processed_videos += 1
-                    break
     # End timer
     end = time.time()
     
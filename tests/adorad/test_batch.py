@@ -0,0 +1,102 @@
+#    _____           ______  _____
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+
+import caer
+import numpy as np
+import pytest
+
+from caer.transforms import hflip, vflip, hvflip
+from caer.preprocessing import compute_mean, subtract_mean
+
+images = [caer.Tensor(np.random.randint(0, 256, (24, 32, 3), dtype=np.uint8), cspace='rgb') for _ in range(5)]
+
+
+def test_tensor_batch():
+    batch = caer.TensorBatch(images)
+
+    assert isinstance(batch, caer.Tensor)
+    assert batch.shape == (5, 24, 32, 3)
+    assert batch.cspace == 'rgb' and batch.layout == 'nhwc'
+    assert (batch.batch_size(), batch.height(), batch.width(), batch.channels()) == (5, 24, 32, 3)
+
+    # Single images are Tensor views, slices along the batch are TensorBatch views
+    first = batch[0]
+    assert type(first) is caer.Tensor
+    assert first.cspace == 'rgb'
+    assert np.shares_memory(first, batch)
+    assert type(batch[1:3]) is caer.TensorBatch
+    assert [type(tens) for tens in batch] == [caer.Tensor] * 5
+    assert type(batch.mean(axis=0)) is caer.Tensor
+    assert type(batch + 1) is caer.TensorBatch
+
+    nchw = batch.to_layout('nchw')
+    assert nchw.shape == (5, 3, 24, 32) and nchw.layout == 'nchw'
+    assert (nchw.height(), nchw.width(), nchw.channels()) == (24, 32, 3)
+    assert caer.TensorBatch(nchw).layout == 'nchw'
+
+    # Grayscale images get a channel axis
+    gray = caer.TensorBatch(np.zeros((2, 24, 32), dtype=np.uint8), cspace='gray')
+    assert gray.shape == (2, 24, 32, 1)
+
+    with pytest.raises(ValueError):
+        caer.TensorBatch([images[0], images[0][1:]])
+
+    with pytest.raises(ValueError):
+        caer.TensorBatch(np.zeros((24, 32)), cspace='rgb')
+
+
+@pytest.mark.parametrize('layout', ['nhwc', 'nchw'])
+def test_tensor_batch_ops(layout):
+    batch = caer.TensorBatch(images).to_layout(layout)
+
+    def per_image(res):
+        # Every image of `res` in (height, width, channels)
+        return np.asarray(res.to_layout('nhwc'))
+
+    bgr = caer.to_bgr(batch)
+    assert type(bgr) is caer.TensorBatch
+    assert bgr.cspace == 'bgr' and bgr.layout == layout
+    assert np.array_equal(per_image(bgr), np.stack([caer.to_bgr(tens) for tens in images]))
+
+    gray = caer.to_gray(batch)
+    assert gray.cspace == 'gray' and gray.channels() == 1
+    assert np.array_equal(per_image(gray)[..., 0], np.stack([caer.to_gray(tens) for tens in images]))
+
+    # The xxx2yyy() helpers keep the batch and its layout too
+    hsv = caer.color.rgb2hsv(batch)
+    assert type(hsv) is caer.TensorBatch
+    assert hsv.cspace == 'hsv' and hsv.layout == layout
+    assert np.array_equal(per_image(hsv), np.stack([caer.color.rgb2hsv(tens) for tens in images]))
+
+    resized = caer.resize(batch, target_size=(16, 12))
+    assert resized.cspace == 'rgb' and resized.layout == layout
+    assert np.array_equal(per_image(resized), np.stack([caer.resize(tens, target_size=(16, 12)) for tens in images]))
+
+    cropped = caer.resize(batch, target_size=(16, 16), preserve_aspect_ratio=True)
+    assert np.array_equal(per_image(cropped), np.stack([caer.resize(tens, target_size=(16, 16), preserve_aspect_ratio=True) for tens in images]))
+
+    for flip in (hflip, vflip, hvflip):
+        flipped = flip(batch)
+        assert flipped.cspace == 'rgb' and flipped.layout == layout
+        assert np.array_equal(per_image(flipped), np.stack([flip(tens) for tens in images]))
+
+    normalized = caer.normalize(batch)
+    assert type(normalized) is caer.TensorBatch and normalized.cspace == 'rgb'
+    assert np.allclose(per_image(normalized), np.stack(images) / 255)
+
+    # Mean subtraction matches the per-image path
+    mean = compute_mean(batch, channels=3)
+    assert np.allclose(mean, compute_mean(list(images), channels=3))
+
+    subtracted = subtract_mean(batch, 3, mean)
+    assert type(subtracted) is caer.TensorBatch
+    assert np.allclose(per_image(subtracted), np.stack(subtract_mean(list(images), 3, mean)), atol=1e-3)
@@ -7,4 +7,214 @@
 
 # Licensed under the MIT License <http://opensource.org/licenses/MIT>
 # SPDX-License-Identifier: MIT
-# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
\ No newline at end of file
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+import caer 
+import gc 
+import weakref 
+import numpy as np 
+import pytest 
+
+
+def test_tensor_views_keep_cspace():
+    tens = caer.Tensor(np.zeros((8, 8, 3), dtype=np.uint8), cspace='bgr')
+
+    assert tens[2:4].cspace == 'bgr'
+    assert tens[..., 0].cspace == 'bgr'
+    assert (tens + 1).cspace == 'bgr'
+    assert np.clip(tens, 0, 10).cspace == 'bgr'
+    assert tens.astype(np.float32).cspace == 'bgr'
+    assert tens.copy().cspace == 'bgr'
+
+    # Changing the colorspace through to_tensor() doesn't touch the original
+    rgb = caer.to_tensor(tens, cspace='rgb')
+    assert rgb.cspace == 'rgb'
+    assert tens.cspace == 'bgr'
+    assert np.shares_memory(rgb, tens)
+
+    # Tensors of unknown colorspace pass on 'null'
+    null = caer.to_tensor(np.zeros((8, 8, 3), dtype=np.uint8), cspace=None, override_checks=True)
+    assert null[1:].cspace == 'null'
+    assert caer.Tensor(null[1:], cspace=null.cspace).cspace == 'null'
+
+    # Plain ndarrays viewed as Tensors get the defaults
+    assert np.zeros(3).view(caer.Tensor).cspace == 'null'
+
+
+def test_tensor_does_not_retain_source():
+    # Converting the dtype copies the data: the source array must be freeable afterwards.
+    # Tensors used to keep a reference to it (``self.x``), holding an extra full image alive
+    src = np.zeros((256, 256, 3), dtype=np.uint8)
+    ref = weakref.ref(src)
+
+    tens = caer.Tensor(src, cspace='rgb', dtype=np.float32)
+    del src
+    gc.collect()
+
+    assert ref() is None
+    assert tens.shape == (256, 256, 3)
+    assert 'x' not in vars(tens)
+
+    # Neither does a chain of re-wraps keep intermediate Tensors alive
+    first = caer.Tensor(np.zeros((16, 16), dtype=np.float64), cspace='gray')
+    ref = weakref.ref(first)
+    last = caer.to_tensor(caer.Tensor(first, cspace='gray', dtype=np.uint8), cspace='gray')
+    del first
+    gc.collect()
+
+    assert ref() is None
+    assert last.cspace == 'gray'
+
+
+def test_tensor_repr_summarized():
+    from caer.adorad._tensor_str import PRINT_OPTS, get_summarized_data, _Formatter
+
+    # A 1080p frame is well past the threshold: only the edge items are ever formatted
+    frame = caer.Tensor(np.random.randint(0, 256, (1080, 1920, 3), dtype=np.uint8), cspace='rgb')
+    edge = 2 * PRINT_OPTS.edgeitems
+    assert get_summarized_data(frame).shape == (edge, edge, 3)
+
+    text = repr(frame)
+    assert text.startswith('tensor([[[') and text.endswith('dtype=uint8)')
+    assert text.count('...') == 1 + edge
+    assert len(text) < 2000
+
+    # Small Tensors are printed in full
+    small = caer.Tensor(np.arange(PRINT_OPTS.threshold), cspace=None)
+    assert '...' not in repr(small)
+    assert '...' in repr(caer.Tensor(np.arange(PRINT_OPTS.threshold + 1), cspace=None))
+
+    # Columns are padded to the widest value
+    assert repr(caer.Tensor(np.array([-5, 10, 200], dtype=np.int16), cspace=None)) == 'tensor([ -5,  10, 200], dtype=int16)'
+    assert repr(caer.Tensor(np.array([1., -300., np.nan]), cspace=None)) == 'tensor([   1., -300.,   nan], dtype=float64)'
+
+    formatter = _Formatter(np.array([0.5, 2.25]))
+    assert not formatter.int_mode and not formatter.sci_mode
+    assert formatter.width() == len('2.2500')
+
+    assert _Formatter(np.array([1.e-6, 3.])).sci_mode
+
+
+def _read_shared(handle):
+    tens = caer.Tensor.from_shared(handle)
+    tens[0, 0, 0] = 42
+    return tens.cspace, int(np.asarray(tens).sum())
+
+
+def test_tensor_shared_memory():
+    import pickle 
+    import multiprocessing as mp 
+
+    tens = caer.Tensor(np.random.randint(0, 100, (32, 48, 3), dtype=np.uint8), cspace='bgr')
+    total = int(np.asarray(tens).sum())
+
+    with tens.to_shared() as handle:
+        assert handle.shape == (32, 48, 3) and handle.cspace == 'bgr'
+
+        # Only the description of the segment is pickled
+        assert len(pickle.dumps(handle)) < 1000
+
+        with mp.get_context('spawn').Pool(1) as pool:
+            assert pool.map(_read_shared, [handle]) == [('bgr', total - int(tens[0, 0, 0]) + 42)]
+
+        # Zero-copy: the worker's write is visible here
+        shared = caer.Tensor.from_shared(handle)
+        assert shared.cspace == 'bgr'
+        assert shared[0, 0, 0] == 42
+        assert np.array_equal(shared[1:], tens[1:])
+
+    # Views outlive unlink()
+    assert shared[1:].cspace == 'bgr'
+    assert np.array_equal(shared[1:], tens[1:])
+
+    with pytest.raises(FileNotFoundError):
+        caer.Tensor.from_shared(handle)
+
+    batch = caer.TensorBatch(np.zeros((2, 4, 4, 3), dtype=np.uint8), cspace='rgb').to_layout('nchw')
+    with batch.to_shared() as handle:
+        shared = caer.Tensor.from_shared(handle)
+        assert type(shared) is caer.TensorBatch
+        assert shared.layout == 'nchw' and shared.shape == (2, 3, 4, 4)
+
+
+def test_tensor_pickle():
+    import copy 
+    import pickle 
+
+    tens = caer.Tensor(np.random.randint(0, 256, (24, 32, 3), dtype=np.uint8), cspace='hsv')
+
+    for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+        res = pickle.loads(pickle.dumps(tens, protocol=protocol))
+        assert type(res) is caer.Tensor
+        assert res.cspace == 'hsv'
+        assert np.array_equal(res, tens)
+
+    # Non-contiguous views are pickled too
+    res = pickle.loads(pickle.dumps(tens[:, ::2], protocol=5))
+    assert res.cspace == 'hsv'
+    assert np.array_equal(res, tens[:, ::2])
+
+    # Out-of-band: the data isn't part of the pickle, nor copied when loading
+    buffers = []
+    data = pickle.dumps(tens, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    assert len(data) < 1000
+
+    res = pickle.loads(data, buffers=buffers)
+    assert res.cspace == 'hsv'
+    assert np.shares_memory(res, tens)
+
+    assert copy.deepcopy(tens).cspace == 'hsv'
+
+    batch = caer.TensorBatch(tens[None].repeat(4, axis=0)).to_layout('nchw')
+    res = pickle.loads(pickle.dumps(batch, protocol=5))
+    assert type(res) is caer.TensorBatch
+    assert res.cspace == 'hsv' and res.layout == 'nchw'
+    assert np.array_equal(res, batch)
+
+
+def test_tensor_dlpack():
+    tens = caer.Tensor(np.random.randint(0, 256, (24, 32, 3), dtype=np.uint8), cspace='lab')
+
+    # Export: NumPy acts as the DLPack consumer
+    assert tens.__dlpack_device__() == (1, 0)
+    exported = np.from_dlpack(tens)
+    assert type(exported) is np.ndarray
+    assert np.shares_memory(exported, tens)
+
+    # Import: zero-copy, cspace given explicitly or kept from a caer.Tensor
+    res = caer.from_dlpack(exported, cspace='lab')
+    assert type(res) is caer.Tensor
+    assert res.cspace == 'lab'
+    assert np.shares_memory(res, tens)
+    assert caer.from_dlpack(tens).cspace == 'lab'
+    assert caer.from_dlpack(exported).cspace == 'null'
+
+    # Strided (channels-first) batches keep their strides
+    batch = caer.TensorBatch(tens[None].repeat(2, axis=0)).to_layout('nchw')
+    exported = np.from_dlpack(batch)
+    assert exported.strides == batch.strides
+
+    res = caer.from_dlpack(exported, cspace='lab', layout='nchw')
+    assert type(res) is caer.TensorBatch
+    assert res.layout == 'nchw' and res.channels() == 3
+    assert np.shares_memory(res, batch)
+
+    # Buffer protocol fallback
+    buf = bytearray(8)
+    res = caer.from_dlpack(buf)
+    res[0] = 7
+    assert buf[0] == 7
+
+    class _GPUTensor:
+        def __dlpack__(self, stream=None):
+            raise AssertionError('Must not be exported')
+
+        def __dlpack_device__(self):
+            return (2, 0)
+
+    with pytest.raises(ValueError):
+        caer.from_dlpack(_GPUTensor(), cspace='rgb')
+
+    with pytest.raises(TypeError):
+        caer.from_dlpack(3)
@@ -11,7 +11,9 @@
 
 import caer
 import cv2 as cv
+import numpy as np
 import os
+import pytest
 
 here = os.path.dirname(os.path.dirname(__file__))
 tens_path = os.path.join(here, 'data', 'green_fish.jpg')
@@ -481,3 +483,72 @@ def test_to_luv():
     # assert np.all(caer_hls_luv == caer_rgb_luv)
     # assert np.all(caer_lab_luv == caer_lab_luv)
     # assert np.all(caer_yuv_luv == caer_yuv_luv)
+
+
+def _two_pass(tens, src, dst):
+    # Reference: through BGR, one OpenCV conversion at a time
+    bgr = tens if src == 'bgr' else cv.cvtColor(tens, getattr(cv, f'COLOR_{src.upper()}2BGR'))
+    return bgr if dst == 'bgr' else cv.cvtColor(bgr, getattr(cv, f'COLOR_BGR2{dst.upper()}'))
+
+
+@pytest.mark.parametrize('src', ['bgr', 'gray', 'hsv', 'hls', 'lab', 'yuv', 'luv'])
+def test_convert(src):
+    tens = {'bgr': cv_bgr, 'gray': cv_gray, 'hsv': cv_hsv, 'hls': cv_hls, 'lab': cv_lab, 'yuv': cv_yuv, 'luv': cv_luv}[src]
+
+    for dst in ['bgr', 'gray', 'hsv', 'hls', 'lab', 'yuv', 'luv']:
+        expected = tens if src == dst else _two_pass(tens, src, dst)
+
+        converted = caer.color.convert(tens, dst)
+        assert converted.cspace == dst
+        assert np.array_equal(converted, expected)
+
+        # The xxx2yyy() helpers take the same paths
+        if src != dst:
+            assert np.array_equal(getattr(caer.color, f'{src}2{dst}')(tens), expected)
+
+        # Written into `out`, without allocating the result
+        out = np.empty(expected.shape, dtype=expected.dtype)
+        converted = caer.color.convert(tens, dst, out=out)
+        assert np.shares_memory(converted, out)
+        assert converted.cspace == dst
+        assert np.array_equal(out, expected)
+
+
+def test_convert_errors():
+    with pytest.raises(TypeError):
+        caer.color.convert(np.asarray(cv_bgr), 'rgb')
+
+    with pytest.raises(ValueError):
+        caer.color.convert(cv_bgr, 'cmyk')
+
+    with pytest.raises(ValueError):
+        caer.color.convert(cv_bgr, 'lab', out=np.empty(cv_gray.shape, dtype=np.uint8))
+
+    with pytest.raises(ValueError):
+        caer.color.convert(cv_bgr, 'lab', out=np.empty(cv_bgr.shape, dtype=np.float32))
+
+
+@pytest.mark.parametrize('src', ['rgb', 'gray', 'hsv', 'lab', 'yuv'])
+def test_convert_batch(src):
+    rng = np.random.default_rng(0)
+    images = [caer.to_tensor(cv.cvtColor(rng.integers(0, 256, (24, 32, 3), dtype=np.uint8), getattr(cv, f'COLOR_BGR2{src.upper()}')), cspace=src) for _ in range(6)]
+    stack = caer.to_tensor(np.stack([tens.reshape(24, 32, -1) for tens in images]), cspace=src)
+
+    for dst in ['bgr', 'gray', 'hls', 'lab', 'luv']:
+        expected = np.stack([caer.color.convert(tens, dst).reshape(24, 32, -1) for tens in images])
+
+        # Identical to the per-image path, with a channel axis for gray batches
+        converted = caer.color.convert(stack, dst, workers=3)
+        assert converted.cspace == dst
+        assert np.array_equal(converted, expected)
+        assert np.array_equal(getattr(caer, f'to_{dst}')(stack), expected)
+        if src != dst:
+            assert np.array_equal(getattr(caer.color, f'{src}2{dst}')(stack), expected)
+
+        out = np.empty(expected.shape, dtype=np.uint8)
+        converted = caer.color.convert(stack, dst, out=out, workers=2)
+        assert np.shares_memory(converted, out)
+        assert np.array_equal(out, expected)
+
+    with pytest.raises(ValueError):
+        caer.color.convert(stack, 'hls', out=np.empty((6, 24, 32, 3), dtype=np.float32))
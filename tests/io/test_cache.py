@@ -0,0 +1,58 @@
+#    _____           ______  _____ 
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+
+import caer 
+import os 
+import shutil
+import pytest
+import numpy as np 
+
+here = os.path.dirname(os.path.dirname(__file__))
+tens_path = os.path.join(here, 'data', 'green_fish.jpg')
+other_path = os.path.join(here, 'data', 'beverages.jpg')
+
+
+def test_image_cache(tmp_path):
+    path = str(tmp_path / 'fish.jpg')
+    shutil.copy(tens_path, path)
+
+    # Room for exactly two 200x150 RGB images
+    cache = caer.io.enable_image_cache(2 * 150 * 200 * 3)
+    try:
+        first = caer.imread(path, target_size=(200,150))
+        second = caer.imread(path, target_size=(200,150))
+        assert cache.info()['misses'] == 1 and cache.info()['hits'] == 1
+        assert np.all(first == second)
+        assert second.is_rgb()
+
+        # Cached images can't be modified in-place
+        with pytest.raises(ValueError):
+            second[0, 0] = 0
+
+        # Different decoding arguments are cached separately
+        caer.imread(path, target_size=(200,150), rgb=False)
+        assert cache.info()['entries'] == 2
+
+        # LRU eviction
+        caer.imread(other_path, target_size=(200,150))
+        assert cache.info()['evictions'] == 1
+        assert cache.info()['nbytes'] <= cache.max_bytes
+
+        # A modified file is not served stale
+        shutil.copy(other_path, path)
+        os.utime(path, ns=(0, 0))
+        assert np.all(caer.imread(path, target_size=(200,150)) == caer.imread(other_path, target_size=(200,150)))
+    finally:
+        caer.io.disable_image_cache()
+
+    assert caer.io.get_image_cache() is None
+    assert caer.imread(path).flags.writeable
@@ -0,0 +1,91 @@
+#    _____           ______  _____ 
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+
+import caer 
+import os 
+import mmap 
+import numpy as np 
+import pytest 
+
+here = os.path.dirname(os.path.dirname(__file__))
+tens_path = os.path.join(here, 'data', 'green_fish.jpg')
+
+
+def test_imdecode(tmp_path):
+    with open(tens_path, 'rb') as f:
+        blob = f.read()
+
+    expected = caer.imread(tens_path, reduced_decode=False)
+
+    assert np.all(caer.io.imdecode(blob) == expected)
+    assert np.all(caer.io.imdecode(bytearray(blob)) == expected)
+    assert np.all(caer.io.imdecode(memoryview(blob)) == expected)
+    assert caer.io.imdecode(blob).is_rgb()
+    assert caer.io.imdecode(blob, gray=True).is_gray()
+    assert caer.io.imdecode(blob, target_size=(200,150)).shape == (150,200,3)
+
+    # A slice of a memory-mapped archive
+    archive = b'\0' * 100 + blob + b'\0' * 100
+    path = tmp_path / 'archive.bin'
+    path.write_bytes(archive)
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm)[100:100 + len(blob)]
+        assert np.all(caer.io.imdecode(view) == expected)
+        view.release()
+
+    with pytest.raises(ValueError):
+        caer.io.imdecode(b'not an image')
+
+
+def test_imencode():
+    tens = caer.imread(tens_path)
+
+    png = caer.io.imencode(tens, '.png')
+    assert isinstance(png, bytes)
+    assert np.all(caer.io.imdecode(png) == tens)
+
+    # Grayscale Tensors are encoded as single-channel images
+    gray = caer.imread(tens_path, gray=True)
+    assert np.all(caer.io.imdecode(caer.io.imencode(gray, 'png'), gray=True) == gray)
+
+    with pytest.raises(TypeError):
+        caer.io.imencode(np.asarray(tens), '.png')
+
+
+def test_codec_batch():
+    tens = caer.imread(tens_path, target_size=(200,150))
+
+    blobs = caer.io.imencode_batch([tens] * 4, '.png', workers=2)
+    assert len(blobs) == 4
+
+    decoded = caer.io.imdecode_batch(blobs + [b'not an image'], workers=2)
+    assert all(np.all(d == tens) for d in decoded[:4])
+    assert decoded[4] is None
+
+    # Same explicit encoder options as imencode()
+    jpegs = caer.io.imencode_batch([tens] * 2, '.jpg', workers=2, jpeg_quality=50, jpeg_progressive=True)
+    assert jpegs == [caer.io.imencode(tens, '.jpg', jpeg_quality=50, jpeg_progressive=True)] * 2
+
+    with pytest.raises(ValueError):
+        caer.io.imencode_batch([tens], '.jpg', jpeg_quality=0)
+
+    with pytest.raises(TypeError):
+        caer.io.imencode_batch([tens], '.jpg', quality=50)
+
+
+def test_imencode_profiles():
+    tens = caer.imread(tens_path)
+
+    fast = caer.io.imencode(tens, '.jpg', profile='fast')
+    small = caer.io.imencode(tens, '.jpg', profile='small')
+    assert len(small) < len(fast)
+    assert caer.io.imdecode(small).shape == tens.shape
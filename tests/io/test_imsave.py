@@ -10,11 +10,34 @@
 # Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
 
 import caer
-# import os  
+import os
+import pytest
 
-def test_imsave():
+def test_imsave(tmp_path):
     tens = caer.data.sunrise()
 
-    saved = caer.imsave('sunrise.jpg', tens)
+    saved = caer.imsave(str(tmp_path / 'sunrise.jpg'), tens)
     assert saved == True
-    # os.remove(os.path.join('io', 'sunrise.jpg'))
\ No newline at end of file
+
+def test_imsave_profiles(tmp_path):
+    tens = caer.data.sunrise()
+
+    sizes = {}
+    for profile in (None, 'fast', 'balanced', 'small'):
+        path = str(tmp_path / f'{profile}.jpg')
+        assert caer.imsave(path, tens, profile=profile)
+        sizes[profile] = os.path.getsize(path)
+    assert sizes['small'] < sizes['balanced']
+
+    # Explicit arguments override the profile
+    assert caer.imsave(str(tmp_path / 'q50.jpg'), tens, profile='balanced', jpeg_quality=50)
+    assert os.path.getsize(str(tmp_path / 'q50.jpg')) < sizes['balanced']
+
+    # PNG is lossless at every compression level
+    assert caer.imsave(str(tmp_path / 'small.png'), tens, png_compression=9)
+    assert (caer.imread(str(tmp_path / 'small.png')) == tens).all()
+
+    with pytest.raises(ValueError):
+        caer.imsave(str(tmp_path / 'bad.jpg'), tens, profile='tiny')
+    with pytest.raises(ValueError):
+        caer.imsave(str(tmp_path / 'bad.png'), tens, png_compression=10)
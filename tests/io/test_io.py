@@ -14,6 +14,7 @@ import caer
 import os 
 import cv2 as cv 
 import numpy as np 
+import pytest 
 
 here = os.path.dirname(os.path.dirname(__file__))
 tens_path = os.path.join(here, 'data', 'green_fish.jpg')
@@ -70,4 +71,116 @@ def test_imread_preserve_aspect_ratio():
 
     assert isinstance(tens_400_400, caer.Tensor)
     assert isinstance(tens_223_182, caer.Tensor)
-    assert isinstance(tens_93_35, caer.Tensor)
\ No newline at end of file
+    assert isinstance(tens_93_35, caer.Tensor)
+
+def test_imread_batch(tmp_path):
+    corrupt_path = tmp_path / 'corrupt.jpg'
+    corrupt_path.write_bytes(b'not an image')
+
+    paths = [tens_path, str(corrupt_path), 'does_not_exist.jpg', tens_path]
+    batch, failed = caer.imread_batch(paths, target_size=(200,150), workers=2)
+
+    assert batch.shape == (4, 150, 200, 3)
+    assert batch.dtype == np.uint8
+    assert isinstance(batch, caer.Tensor)
+    assert batch.is_rgb()
+    assert failed.tolist() == [False, True, True, False]
+
+    expected = caer.imread(tens_path, target_size=(200,150))
+    assert np.all(batch[0] == expected)
+    assert np.all(batch[3] == expected)
+    assert not batch[1].any()
+
+
+def test_imread_reduced_decode(tmp_path):
+    large_path = str(tmp_path / 'large_green_fish.jpg')
+    cv.imwrite(large_path, cv.resize(cv.imread(tens_path), (1600,1200)))
+
+    assert caer.io.imsize(large_path) == (1600,1200,3)
+
+    # 1600x1200 -> 200x150 is decoded at 1/8 of its resolution; no reduction covers the full size
+    assert caer.io.io._reduced_imread_flag(large_path, (200,150)) == cv.IMREAD_REDUCED_COLOR_8
+    assert caer.io.io._reduced_imread_flag(large_path, (1600,1200)) is None
+
+    area = caer.imread(large_path, target_size=(200,150), interpolation='area', reduced_decode=False)
+    reduced = caer.imread(large_path, target_size=(200,150))
+    reduced_ratio = caer.imread(large_path, target_size=(150,150), preserve_aspect_ratio=True)
+
+    assert reduced.shape == area.shape == (150,200,3)
+    assert reduced_ratio.shape == (150,150,3)
+    assert reduced.is_rgb()
+
+    # Documented bound (see caer.imread()): within a mean absolute error of 4 of an 'area' resize of the full decode
+    assert np.abs(np.asarray(reduced, dtype=float) - np.asarray(area, dtype=float)).mean() < 4
+
+
+def test_imread_gray():
+    cv_gray = cv.imread(tens_path, cv.IMREAD_GRAYSCALE)
+
+    caer_gray = caer.imread(tens_path, gray=True)
+    caer_gray_resized = caer.imread(tens_path, gray=True, target_size=(200,150))
+
+    assert np.all(caer_gray == cv_gray)
+    assert caer_gray.is_gray()
+    assert caer_gray_resized.shape == (150,200)
+    assert caer_gray_resized.is_gray()
+
+    batch, failed = caer.imread_batch([tens_path, tens_path], target_size=(200,150), gray=True)
+    assert batch.shape == (2, 150, 200, 1)
+    assert batch.is_gray()
+    assert not failed.any()
+    assert np.all(batch[0, ..., 0] == caer_gray_resized)
+
+
+def test_imread_out():
+    batch = np.zeros((2, 150, 200, 3), dtype=np.uint8)
+
+    tens = caer.imread(tens_path, target_size=(200,150), out=batch[1])
+
+    assert np.shares_memory(tens, batch)
+    assert tens.is_rgb()
+    assert np.all(batch[1] == caer.imread(tens_path, target_size=(200,150)))
+    assert np.all(batch[0] == 0)
+
+    # Without resizing, `out` must match the decoded shape
+    full = caer.imread(tens_path)
+    out = np.empty(full.shape, dtype=np.uint8)
+    assert np.all(caer.imread(tens_path, out=out) == full)
+
+    with pytest.raises(ValueError):
+        caer.imread(tens_path, target_size=(200,151), out=batch[0])
+    with pytest.raises(ValueError):
+        caer.imread(tens_path, target_size=(200,150), out=batch[0].astype(np.float32))
+
+
+def test_imread_iter():
+    paths = [tens_path, os.path.join(here, 'data', 'beverages.jpg'), 'nonexistent.jpg'] * 4
+
+    ordered = list(caer.io.imread_iter(paths, prefetch=3, workers=2, target_size=(200,150)))
+    assert [path for path, _ in ordered] == paths
+    assert all(tens.shape == (150,200,3) for path, tens in ordered if path != 'nonexistent.jpg')
+    assert all(tens is None for path, tens in ordered if path == 'nonexistent.jpg')
+
+    unordered = list(caer.io.imread_iter(paths, prefetch=3, workers=2, ordered=False, target_size=(200,150)))
+    assert sorted(path for path, _ in unordered) == sorted(paths)
+
+    # From a directory
+    from_dir = [path for path, _ in caer.io.imread_iter(os.path.join(here, 'data'), workers=2)]
+    assert len(from_dir) > 0
+    assert all(caer.path.is_image(path) for path in from_dir)
+
+
+def test_imread_iter_early_stop():
+    consumed = []
+
+    def _source():
+        for _ in range(1000):
+            consumed.append(tens_path)
+            yield tens_path
+
+    for i, (_, tens) in enumerate(caer.io.imread_iter(_source(), prefetch=4, workers=2)):
+        if i == 2:
+            break
+
+    # Only `prefetch` images are ever requested ahead of the consumer
+    assert len(consumed) <= 3 + 4
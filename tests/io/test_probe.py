@@ -0,0 +1,83 @@
+#    _____           ______  _____ 
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+
+import caer 
+import os 
+import cv2 as cv 
+import struct
+
+here = os.path.dirname(os.path.dirname(__file__))
+tens_path = os.path.join(here, 'data', 'green_fish.jpg')
+
+
+def test_imsize(tmp_path):
+    bgr = cv.resize(cv.imread(tens_path), (123, 45))
+    gray = cv.cvtColor(bgr, cv.COLOR_BGR2GRAY)
+    bgra = cv.cvtColor(bgr, cv.COLOR_BGR2BGRA)
+
+    cases = {
+        'color.jpg': (bgr, [], 3),
+        'gray.jpg': (gray, [], 1),
+        'progressive.jpg': (bgr, [cv.IMWRITE_JPEG_PROGRESSIVE, 1], 3),
+        'color.png': (bgr, [], 3),
+        'gray.png': (gray, [], 1),
+        'alpha.png': (bgra, [], 4),
+        'color.bmp': (bgr, [], 3),
+        'lossy.webp': (bgr, [cv.IMWRITE_WEBP_QUALITY, 80], 3),
+        'lossless.webp': (bgr, [cv.IMWRITE_WEBP_QUALITY, 101], 3),
+        # Falls back to a full decode
+        'color.tiff': (bgr, [], 3),
+    }
+
+    for name, (tens, params, channels) in cases.items():
+        path = str(tmp_path / name)
+        assert cv.imwrite(path, tens, params)
+        assert caer.io.imsize(path) == (123, 45, channels), name
+
+
+def test_imsize_batch():
+    sizes = caer.io.imsize_batch([tens_path, 'does_not_exist.jpg'], workers=2)
+
+    tens = caer.imread(tens_path)
+    assert sizes.dtype.names == ('width', 'height', 'channels')
+    assert tuple(sizes[0]) == (tens.shape[1], tens.shape[0], 3)
+    assert tuple(sizes[1]) == (-1, -1, -1)
+
+
+def _with_exif_orientation(jpeg, orientation, byteorder):
+    # Inserts an APP1 segment with a single-entry IFD0 (Orientation, SHORT) right after SOI
+    fmt = '<' if byteorder == 'little' else '>'
+    tiff = (b'II*\0' if byteorder == 'little' else b'MM\0*') + struct.pack(fmt + 'I', 8)
+    tiff += struct.pack(fmt + 'H', 1) + struct.pack(fmt + 'HHIHH', 0x0112, 3, 1, orientation, 0) + struct.pack(fmt + 'I', 0)
+    app1 = b'Exif\0\0' + tiff
+    return jpeg[:2] + b'\xff\xe1' + struct.pack('>H', len(app1) + 2) + app1 + jpeg[2:]
+
+
+def test_imsize_exif_orientation(tmp_path):
+    jpeg = cv.imencode('.jpg', cv.resize(cv.imread(tens_path), (123, 45)))[1].tobytes()
+
+    for orientation, byteorder, expected in [(1, 'little', (123, 45, 3)), (3, 'big', (123, 45, 3)),
+                                             (6, 'little', (45, 123, 3)), (8, 'big', (45, 123, 3))]:
+        path = str(tmp_path / f'orientation_{orientation}.jpg')
+        with open(path, 'wb') as f:
+            f.write(_with_exif_orientation(jpeg, orientation, byteorder))
+
+        # Matches what caer.imread() decodes
+        tens = caer.imread(path)
+        assert caer.io.imsize(path) == expected == (tens.shape[1], tens.shape[0], 3), orientation
+
+
+def test_imsize_palette_bmp(tmp_path):
+    # OpenCV writes grayscale BMPs with an 8-bit palette, which imsize() reports as 3 channels
+    path = str(tmp_path / 'gray.bmp')
+    assert cv.imwrite(path, cv.cvtColor(cv.resize(cv.imread(tens_path), (123, 45)), cv.COLOR_BGR2GRAY))
+    assert caer.io.imsize(path) == (123, 45, 3)
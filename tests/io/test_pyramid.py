@@ -0,0 +1,59 @@
+#    _____           ______  _____ 
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+
+import caer 
+import os 
+import numpy as np 
+import pytest 
+
+here = os.path.dirname(os.path.dirname(__file__))
+tens_path = os.path.join(here, 'data', 'green_fish.jpg')
+
+
+def test_image_pyramid():
+    tens = caer.imread(tens_path)
+    height, width = tens.shape[:2]
+
+    pyramid = caer.io.ImagePyramid(tens, levels=4)
+    assert len(pyramid) == 4
+    assert pyramid.sizes[1] == (round(width / 2), round(height / 2))
+
+    # Lazy: nothing but the source is built up front
+    assert pyramid.built == 1
+    assert pyramid.nbytes == 0
+
+    small = pyramid.resize((width // 5, height // 5))
+    assert small.shape == (height // 5, width // 5, 3)
+    assert small.cspace == 'rgb'
+    assert pyramid.level_for((width // 5, height // 5)) == 2
+    assert pyramid.built == 3
+    assert pyramid.nbytes == pyramid[1].nbytes + pyramid[2].nbytes
+
+    levels = list(pyramid)
+    assert [lvl.shape[:2] for lvl in levels] == [(h, w) for w, h in pyramid.sizes]
+    assert np.all(levels[0] == tens)
+
+    pyramid.clear()
+    assert pyramid.built == 1
+
+
+def test_image_pyramid_gaussian():
+    tens = caer.imread(tens_path, gray=True)
+
+    pyramid = caer.io.ImagePyramid(tens, method='gaussian', min_size=32)
+    assert min(pyramid.sizes[-1]) >= 32
+    assert pyramid[-1].shape == pyramid.sizes[-1][::-1]
+
+    with pytest.raises(ValueError):
+        caer.io.ImagePyramid(tens, method='gaussian', scale_factor=3)
+    with pytest.raises(ValueError):
+        caer.io.ImagePyramid(tens, scale_factor=1)
@@ -12,6 +12,8 @@
 
 import caer 
 import cv2 as cv 
+import numpy as np 
+import pytest 
 import os 
 
 here = os.path.dirname(os.path.dirname(__file__))
@@ -59,4 +61,81 @@ def test_preserve_aspect_ratio():
     ## Using isinstance() often mistakes a caer.Tensor as an np.ndarray
     assert 'caer.Tensor' in str(type(tens_400_400))
     assert 'caer.Tensor' in str(type(tens_223_182))
-    assert 'caer.Tensor' in str(type(tens_93_35))
\ No newline at end of file
+    assert 'caer.Tensor' in str(type(tens_93_35))
+
+def test_resize_out():
+    out = np.empty((182,223,3), dtype=cv_tens.dtype)
+
+    tens = caer.resize(cv_tens, target_size=(223,182), out=out)
+    tens_ratio = caer.resize(caer_tens, target_size=(223,182), preserve_aspect_ratio=True, out=out)
+
+    assert np.shares_memory(tens, out)
+    assert np.shares_memory(tens_ratio, out)
+    assert np.all(tens_ratio == caer.resize(caer_tens, target_size=(223,182), preserve_aspect_ratio=True))
+
+    # Strict checking
+    with pytest.raises(ValueError):
+        caer.resize(cv_tens, target_size=(223,183), out=out)
+    with pytest.raises(ValueError):
+        caer.resize(cv_tens, target_size=(223,182), out=out.astype(np.float32))
+
+
+def test_resize_batch():
+    cv_flipped = np.ascontiguousarray(cv_tens[::-1])
+    stack = np.stack([cv_tens, cv_flipped])
+    stack = caer.to_tensor(stack, cspace='rgb')
+
+    batch = caer.resize_batch(stack, target_size=(223,182), workers=2)
+    assert batch.shape == (2,182,223,3)
+    assert batch.cspace == 'rgb'
+    assert np.all(batch[0] == caer.resize(cv_tens, target_size=(223,182)))
+    assert np.all(batch[1] == caer.resize(cv_flipped, target_size=(223,182)))
+
+    # Ragged inputs, written into a preallocated array
+    ragged = [cv_tens, cv_tens[:300, :250], cv_tens[50:]]
+    out = np.empty((3,100,100,3), dtype=cv_tens.dtype)
+    batch = caer.resize_batch(ragged, target_size=(100,100), preserve_aspect_ratio=True, out=out, workers=2)
+    assert np.shares_memory(batch, out)
+    for tens, resized in zip(ragged, batch):
+        assert np.all(resized == caer.resize(tens, target_size=(100,100), preserve_aspect_ratio=True))
+
+    with pytest.raises(ValueError):
+        caer.resize_batch(ragged, target_size=(100,101), out=out)
+    with pytest.raises(ValueError):
+        caer.resize_batch([cv_tens, cv_tens[..., 0]], target_size=(100,100))
+
+
+def test_resize_plan():
+    crop = caer.io.ResizePlan(cv_tens.shape, target_size=(223,182), mode='crop')
+    stretch = caer.io.ResizePlan(cv_tens.shape, target_size=(223,182), interpolation='area')
+
+    assert crop.out_shape == (182,223,3)
+    assert np.all(crop(cv_tens) == caer.resize(cv_tens, target_size=(223,182), preserve_aspect_ratio=True))
+    assert np.all(stretch(cv_tens) == caer.resize(cv_tens, target_size=(223,182), interpolation='area'))
+    assert crop(caer_tens).cspace == caer_tens.cspace
+
+    out = np.empty(crop.out_shape, dtype=cv_tens.dtype)
+    assert np.shares_memory(crop(cv_tens, out=out), out)
+
+    # Plans are bound to their source shape
+    with pytest.raises(ValueError):
+        crop(cv_tens[1:])
+    with pytest.raises(ValueError):
+        caer.io.ResizePlan(cv_tens.shape, target_size=(223,182), mode='fit')
+
+
+def test_smart_resize_single_resample():
+    for target_size in [(223,182), (64,64), (93,35)]:
+        two_pass = caer.smart_resize(cv_tens, target_size=target_size)
+        single = caer.smart_resize(cv_tens, target_size=target_size, single_resample=True)
+
+        assert single.shape == two_pass.shape == (target_size[1], target_size[0], 3)
+        # Same framing and area interpolation, so the results only differ by sub-pixel sampling
+        assert np.abs(np.asarray(single, dtype=float) - np.asarray(two_pass, dtype=float)).mean() < 2
+
+    # Dimensions that are multiples of the integer factor give identical results
+    tens = np.ascontiguousarray(cv_tens[:400, :400])
+    assert np.all(caer.smart_resize(tens, (100,100)) == caer.smart_resize(tens, (100,100), single_resample=True))
+
+    out = np.empty((64,64,3), dtype=cv_tens.dtype)
+    assert np.shares_memory(caer.resize(cv_tens, target_size=(64,64), preserve_aspect_ratio=True, single_resample=True, out=out), out)
@@ -0,0 +1,83 @@
+#    _____           ______  _____ 
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+
+import caer 
+import pytest
+import numpy as np 
+
+
+def test_shard_roundtrip(tmp_path):
+    path = str(tmp_path / 'train.shard')
+    tensors = [caer.data.sunrise(target_size=(32,24)), caer.data.bear(target_size=(32,24)), caer.data.puppy(target_size=(32,24))]
+
+    with caer.io.ShardWriter(path, shape=(24,32,3), cspace='rgb', classes=['a', 'b']) as writer:
+        writer.write(tensors[0], 1)
+        writer.write_batch(tensors[1:], [0, 1])
+
+        with pytest.raises(ValueError):
+            writer.write(np.zeros((24,32,3), dtype=np.float32), 0)
+        with pytest.raises(ValueError):
+            writer.write(tensors[0])
+
+    with caer.io.ShardReader(path) as shard:
+        assert len(shard) == 3
+        assert shard.classes == ['a', 'b']
+        assert shard.labels.tolist() == [1, 0, 1]
+
+        item = shard[1]
+        assert isinstance(item, caer.Tensor)
+        assert item.is_rgb()
+        assert np.all(item == tensors[1])
+        # Zero-copy, read-only view of the file
+        assert not item.flags.owndata and not item.flags.writeable
+
+        batch = shard[1:]
+        assert batch.shape == (2,24,32,3)
+        assert np.all(batch[1] == tensors[2])
+
+
+def test_shard_float_without_labels(tmp_path):
+    path = str(tmp_path / 'float.shard')
+    data = np.random.rand(5, 4, 4).astype(np.float32)
+
+    with caer.io.ShardWriter(path, shape=(4,4), dtype='float32') as writer:
+        writer.write_batch(data)
+
+    shard = caer.io.ShardReader(path)
+    assert shard.labels is None
+    assert shard.cspace is None
+    assert np.all(shard[:] == data)
+
+
+def test_shard_not_closed(tmp_path):
+    path = str(tmp_path / 'open.shard')
+    writer = caer.io.ShardWriter(path, shape=(2,2))
+    writer.write(np.zeros((2,2), dtype=np.uint8))
+
+    with pytest.raises(ValueError):
+        caer.io.ShardReader(path)
+
+    writer.close()
+    assert len(caer.io.ShardReader(path)) == 1
+
+
+def test_shard_aborted(tmp_path):
+    path = tmp_path / 'partial.shard'
+
+    with pytest.raises(RuntimeError):
+        with caer.io.ShardWriter(str(path), shape=(2,2)) as writer:
+            writer.write(np.zeros((2,2), dtype=np.uint8))
+            raise RuntimeError('Interrupted')
+
+    # The partial shard is never finalized as a valid one
+    assert not path.exists()
+    assert writer._file is None
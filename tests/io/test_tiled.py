@@ -0,0 +1,50 @@
+#    _____           ______  _____ 
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+
+import caer 
+import os 
+import tracemalloc 
+import cv2 as cv 
+import numpy as np 
+
+here = os.path.dirname(os.path.dirname(__file__))
+tens_path = os.path.join(here, 'data', 'green_fish.jpg')
+
+
+def test_tiled_resize():
+    tens = np.asarray(caer.imread(tens_path))
+
+    for interpolation in ('area', 'bilinear', 'bicubic', 'nearest'):
+        for target_size in [(200,150), (123,77), (900,700)]:
+            tiled = caer.io.tiled_resize(tens, target_size, tile=17, interpolation=interpolation)
+            full = caer.resize(tens, target_size, interpolation=interpolation)
+
+            assert tiled.shape == full.shape
+            diff = np.abs(np.asarray(tiled, dtype=int) - np.asarray(full, dtype=int))
+            assert diff.max() <= 1
+            assert diff.mean() < 0.25
+
+
+def test_tiled_resize_memmap(tmp_path):
+    tens = cv.resize(np.asarray(caer.imread(tens_path)), (2000,1600))
+    source_path = str(tmp_path / 'source.npy')
+    np.save(source_path, tens)
+
+    tracemalloc.start()
+    thumb = caer.io.tiled_resize(source_path, (200,160), tile=8, out_path=str(tmp_path / 'thumb.npy'))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # A few strips, not a multiple of the 9.6 MB source
+    assert peak < tens.nbytes / 4
+    assert thumb.shape == (160,200,3)
+    assert np.abs(np.load(str(tmp_path / 'thumb.npy')).astype(int) - cv.resize(tens, (200,160), interpolation=cv.INTER_AREA)).max() <= 1
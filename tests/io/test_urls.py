@@ -0,0 +1,150 @@
+#    _____           ______  _____ 
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+
+import caer 
+import os 
+import threading
+import functools
+import numpy as np 
+import pytest
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+here = os.path.dirname(os.path.dirname(__file__))
+data_dir = os.path.join(here, 'data')
+tens_path = os.path.join(data_dir, 'green_fish.jpg')
+
+
+class _Handler(SimpleHTTPRequestHandler):
+    # HTTP/1.1 enables keep-alive
+    protocol_version = 'HTTP/1.1'
+    connections = 0
+    requests = 0
+    user_agents = []
+
+    def setup(self):
+        type(self).connections += 1
+        super().setup()
+
+    def do_GET(self):
+        type(self).requests += 1
+        type(self).user_agents.append(self.headers.get('User-Agent'))
+        super().do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve():
+    _Handler.connections = 0
+    _Handler.requests = 0
+    _Handler.user_agents = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), functools.partial(_Handler, directory=data_dir))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+
+def test_url_fetcher_reuses_connections():
+    server, base = _serve()
+    try:
+        with caer.io.URLFetcher(max_connections=1) as fetcher:
+            payloads = fetcher.fetch_many([f'{base}/green_fish.jpg'] * 5)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    with open(tens_path, 'rb') as f:
+        expected = f.read()
+
+    assert all(p == expected for p in payloads)
+    assert _Handler.requests == 5
+    assert _Handler.connections == 1
+    assert all(agent.startswith('caer/') for agent in _Handler.user_agents)
+
+
+class _ProxyHandler(SimpleHTTPRequestHandler):
+    # Requests through a proxy carry the full URL: serve its path from `directory`
+    requested = []
+
+    def do_GET(self):
+        type(self).requested.append(self.path)
+        self.path = '/' + self.path.rsplit('/', 1)[-1]
+        super().do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+def test_url_fetcher_proxy(monkeypatch):
+    _ProxyHandler.requested = []
+    proxy = ThreadingHTTPServer(('127.0.0.1', 0), functools.partial(_ProxyHandler, directory=data_dir))
+    threading.Thread(target=proxy.serve_forever, daemon=True).start()
+
+    monkeypatch.setenv('http_proxy', f'http://127.0.0.1:{proxy.server_address[1]}')
+    for name in ('no_proxy', 'NO_PROXY', 'HTTP_PROXY'):
+        monkeypatch.delenv(name, raising=False)
+
+    try:
+        data = caer.io.URLFetcher().fetch('http://images.example.invalid/green_fish.jpg')
+    finally:
+        proxy.shutdown()
+        proxy.server_close()
+
+    with open(tens_path, 'rb') as f:
+        assert data == f.read()
+    assert _ProxyHandler.requested == ['http://images.example.invalid/green_fish.jpg']
+
+
+def test_url_fetcher_arguments():
+    with pytest.raises(ValueError):
+        caer.io.URLFetcher(max_connections=0)
+
+    with pytest.raises(ValueError):
+        caer.io.URLFetcher(max_redirects=-1)
+
+    with pytest.raises(ValueError):
+        caer.io.URLFetcher(max_redirects=2.5)
+
+
+def test_url_fetcher_cache(tmp_path):
+    server, base = _serve()
+    try:
+        fetcher = caer.io.URLFetcher(cache_dir=str(tmp_path))
+        first = fetcher.fetch(f'{base}/green_fish.jpg')
+        # Same content behind a different URL is stored once
+        fetcher.fetch(f'{base}/green_fish.jpg?copy=1')
+        fetcher.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # The server is gone, so this has to come from the cache
+    assert caer.io.URLFetcher(cache_dir=str(tmp_path)).fetch(f'{base}/green_fish.jpg') == first
+    assert _Handler.requests == 2
+    assert sum(len(files) for _, _, files in os.walk(tmp_path / 'objects')) == 1
+
+
+def test_imread_urls():
+    server, base = _serve()
+    try:
+        urls = [f'{base}/green_fish.jpg', f'{base}/missing.jpg', f'{base}/beverages.jpg']
+        tensors = caer.io.imread_urls(urls, target_size=(200,150))
+        from_imread = caer.imread(f'{base}/green_fish.jpg', rgb=False)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert tensors[1] is None
+    assert tensors[0].shape == tensors[2].shape == (150,200,3)
+    assert tensors[0].is_rgb()
+    assert np.all(tensors[0] == caer.imread(tens_path, target_size=(200,150), reduced_decode=False))
+    assert from_imread.is_bgr()
+    assert np.all(from_imread == caer.imread(tens_path, rgb=False))
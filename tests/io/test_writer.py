@@ -0,0 +1,47 @@
+#    _____           ______  _____ 
+#  / ____/    /\    |  ____ |  __ \
+# | |        /  \   | |__   | |__) | Caer - Modern Computer Vision
+# | |       / /\ \  |  __|  |  _  /  Languages: Python, C, C++, Cuda
+# | |___   / ____ \ | |____ | | \ \  http://github.com/jasmcaus/caer
+#  \_____\/_/    \_ \______ |_|  \_\
+
+# Licensed under the MIT License <http://opensource.org/licenses/MIT>
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2020-2021 The Caer Authors <http://github.com/jasmcaus>
+
+
+import caer 
+import os 
+import numpy as np 
+import pytest 
+
+
+def test_async_image_writer(tmp_path):
+    tens = caer.data.sunrise(target_size=(64,48))
+
+    with caer.io.AsyncImageWriter(workers=2, max_pending=3) as writer:
+        for i in range(10):
+            writer.write(str(tmp_path / f'{i}.png'), tens)
+        # A foreign ndarray (no colorspace) is rejected by imsave
+        writer.write(str(tmp_path / 'bad.png'), np.zeros((4,4,3), dtype=np.uint8))
+
+        assert writer.flush() is writer.errors
+        assert len(writer.errors) == 1
+        assert writer.errors[0][0] == str(tmp_path / 'bad.png')
+
+    assert sorted(os.listdir(tmp_path)) == sorted(f'{i}.png' for i in range(10))
+    assert np.all(caer.imread(str(tmp_path / '3.png')) == tens)
+
+
+def test_async_image_writer_profile(tmp_path):
+    tens = caer.data.sunrise(target_size=(64,48))
+
+    with caer.io.AsyncImageWriter(workers=2, profile='small', jpeg_quality=60) as writer:
+        writer.write(str(tmp_path / 'small.jpg'), tens)
+    assert writer.errors == []
+    assert caer.imread(str(tmp_path / 'small.jpg')).shape == (48,64,3)
+
+    with pytest.raises(ValueError):
+        caer.io.AsyncImageWriter(profile='tiny')
+    with pytest.raises(TypeError):
+        caer.io.AsyncImageWriter(jpeg_qualiti=60)